@@ -6,42 +6,112 @@
 
 from __future__ import annotations
 
-import json
+import os
 import sys
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+import orjson
+
 from src.api.api_config import get_api_config
 from src.api.app import app
+from src.api.schema_fingerprint import openapi_fingerprint
 from src.api.schema_versions import detect_breaking_schema_changes
 
 SNAPSHOT_PATH = Path("reports/api/contract_checks/latest_contract_snapshot.json")
 DIFF_REPORT_PATH = Path("reports/api/contract_checks/contract_diff_report.md")
+FINGERPRINT_PATH = SNAPSHOT_PATH.with_suffix(".fp")
+_SNAPSHOT_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+LAST_RUN_PATH = Path("reports/api/contract_checks/last_run.txt")
+
 
+def _schema_fingerprint(target_app: Any) -> str:
+    """Hash everything that feeds OpenAPI generation so unchanged apps can skip it."""
 
-def _openapi_snapshot() -> dict[str, object]:
     config = get_api_config()
-    openapi_schema = app.openapi()
+    return openapi_fingerprint(
+        target_app,
+        api_version_path=config.api_version_path,
+        schema_version=config.schema_version,
+    )
+
+
+def _read_fingerprint() -> str | None:
+    try:
+        return FINGERPRINT_PATH.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return None
+
+
+def _write_fingerprint(fingerprint: str) -> None:
+    tmp_path = FINGERPRINT_PATH.with_suffix(".fp.tmp")
+    tmp_path.write_text(fingerprint, encoding="utf-8")
+    os.replace(tmp_path, FINGERPRINT_PATH)
+
+
+def _openapi_snapshot(reuse_from: dict[str, object] | None = None) -> dict[str, object]:
+    config = get_api_config()
+    if reuse_from is not None:
+        paths = reuse_from.get("paths", {})
+        components = reuse_from.get("components", {})
+    else:
+        openapi_schema = app.openapi()
+        paths = openapi_schema.get("paths", {})
+        components = openapi_schema.get("components", {})
     return {
         "api_version_path": config.api_version_path,
         "schema_version": config.schema_version,
-        "generated_at": datetime.now(tz=UTC).isoformat(),
-        "paths": openapi_schema.get("paths", {}),
-        "components": openapi_schema.get("components", {}),
+        "paths": paths,
+        "components": components,
     }
 
 
+def _serialize_snapshot(snapshot: dict[str, object]) -> bytes:
+    return orjson.dumps(snapshot, option=_SNAPSHOT_OPTIONS)
+
+
+def _write_snapshot(snapshot_bytes: bytes) -> None:
+    tmp_path = SNAPSHOT_PATH.with_suffix(".tmp")
+    tmp_path.write_bytes(snapshot_bytes)
+    os.replace(tmp_path, SNAPSHOT_PATH)
+
+
 def main() -> int:
     SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    current = _openapi_snapshot()
+    # The run timestamp lives in a sidecar so the snapshot only changes with the contract.
+    run_at = datetime.now(tz=UTC).isoformat()
+    LAST_RUN_PATH.write_text(run_at, encoding="utf-8")
+
+    raw_previous: bytes | None
+    try:
+        raw_previous = SNAPSHOT_PATH.read_bytes()
+    except FileNotFoundError:
+        raw_previous = None
+
+    fingerprint = _schema_fingerprint(app)
+    reuse_from: dict[str, object] | None = None
+    if raw_previous is not None and fingerprint == _read_fingerprint():
+        reuse_from = orjson.loads(raw_previous)
+    current = _openapi_snapshot(reuse_from=reuse_from)
+    current_bytes = _serialize_snapshot(current)
+
+    # Byte comparison against the stored snapshot avoids the structural diff and the
+    # snapshot rewrite on no-op runs, which are the common case in CI.
+    if raw_previous is not None and raw_previous == current_bytes:
+        DIFF_REPORT_PATH.write_text(_build_unchanged_report(current=current, run_at=run_at), encoding="utf-8")
+        _write_fingerprint(fingerprint)
+        print("No breaking API contract changes detected.")
+        return 0
 
     previous: dict[str, object] | None = None
-    if SNAPSHOT_PATH.exists():
-        previous = json.loads(SNAPSHOT_PATH.read_text(encoding="utf-8"))
+    if raw_previous is not None:
+        previous = reuse_from if reuse_from is not None else orjson.loads(raw_previous)
 
     breaking_findings: list[str] = []
     if previous is not None:
@@ -55,14 +125,13 @@ def main() -> int:
             previous=previous,
             current=current,
             findings=breaking_findings,
+            run_at=run_at,
         ),
         encoding="utf-8",
     )
 
-    SNAPSHOT_PATH.write_text(
-        json.dumps(current, indent=2, sort_keys=True),
-        encoding="utf-8",
-    )
+    _write_snapshot(current_bytes)
+    _write_fingerprint(fingerprint)
 
     if previous is None:
         print("No previous API snapshot found. A new baseline snapshot was created.")
@@ -88,35 +157,55 @@ def _build_report(
     previous: dict[str, object] | None,
     current: dict[str, object],
     findings: list[str],
+    run_at: str,
 ) -> str:
-    lines: list[str] = [
-        "# API Contract Diff Report",
-        "",
-        f"Generated at: {datetime.now(tz=UTC).isoformat()}",
-        "",
-        f"Current API version path: `{current.get('api_version_path')}`",
-        f"Current schema version: `{current.get('schema_version')}`",
-        "",
-    ]
+    lines = _iter_lines(previous=previous, current=current, findings=findings, run_at=run_at)
+    return "\n".join(lines) + "\n"
+
+
+def _build_unchanged_report(*, current: dict[str, object], run_at: str) -> str:
+    return "\n".join(_iter_unchanged_lines(current=current, run_at=run_at)) + "\n"
+
+
+def _iter_header_lines(current: dict[str, object], run_at: str) -> Iterator[str]:
+    yield "# API Contract Diff Report"
+    yield ""
+    yield f"Generated at: {run_at}"
+    yield ""
+    yield f"Current API version path: `{current.get('api_version_path')}`"
+    yield f"Current schema version: `{current.get('schema_version')}`"
+    yield ""
+
+
+def _iter_lines(
+    *,
+    previous: dict[str, object] | None,
+    current: dict[str, object],
+    findings: list[str],
+    run_at: str,
+) -> Iterator[str]:
+    yield from _iter_header_lines(current, run_at)
 
     if previous is None:
-        lines.extend(
-            [
-                "## Status",
-                "",
-                "No previous snapshot existed. This run created the initial baseline.",
-            ]
-        )
-        return "\n".join(lines) + "\n"
+        yield "## Status"
+        yield ""
+        yield "No previous snapshot existed. This run created the initial baseline."
+        return
 
-    lines.append("## Breaking Change Findings")
-    lines.append("")
+    yield "## Breaking Change Findings"
+    yield ""
     if not findings:
-        lines.append("No breaking differences were detected.")
-    else:
-        lines.extend([f"- {item}" for item in findings])
+        yield "No breaking differences were detected."
+        return
+    for item in findings:
+        yield f"- {item}"
 
-    return "\n".join(lines) + "\n"
+
+def _iter_unchanged_lines(*, current: dict[str, object], run_at: str) -> Iterator[str]:
+    yield from _iter_header_lines(current, run_at)
+    yield "## Status"
+    yield ""
+    yield "Snapshot is unchanged since the previous run. No differences to report."
 
 
 if __name__ == "__main__":
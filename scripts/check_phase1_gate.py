@@ -17,7 +17,7 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from src.common.db import engine
-from src.ingestion.ddl import apply_ingestion_ddl
+from src.ingestion.ddl import apply_ingestion_ddl_if_changed
 from src.ingestion.gate import evaluate_phase1_gate
 
 
@@ -25,12 +25,17 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Check whether Phase 1 gate is satisfied")
     parser.add_argument("--min-successful-batches", type=int, default=2)
     parser.add_argument("--skip-tests", action="store_true")
+    parser.add_argument(
+        "--force-ddl",
+        action="store_true",
+        help="Re-apply ingestion DDL even when the recorded DDL hash matches",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    apply_ingestion_ddl(engine)
+    apply_ingestion_ddl_if_changed(engine, force=args.force_ddl)
 
     passed, details = evaluate_phase1_gate(
         engine,
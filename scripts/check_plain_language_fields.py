@@ -7,7 +7,9 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
@@ -15,32 +17,48 @@ if str(ROOT_DIR) not in sys.path:
 
 from src.api.plain_language import guardrail_note, price_action_label
 
+# (final_multiplier, expected label, failure message)
+LABEL_CASES: tuple[tuple[float, str, str], ...] = (
+    (1.0, "No price change", "1.00 must map to 'No price change'"),
+    (1.05, "Small increase", "1.01-1.08 must map to 'Small increase'"),
+)
+
+# (guardrail_note kwargs, substring expected in the lowercased note, failure message)
+GUARDRAIL_CASES: tuple[tuple[dict[str, Any], str, str], ...] = (
+    (
+        {
+            "cap_applied": True,
+            "rate_limit_applied": False,
+            "cap_reason": "confidence",
+            "cap_type": "contextual",
+        },
+        "cap",
+        "cap_applied=true must mention cap behavior",
+    ),
+    (
+        {
+            "cap_applied": False,
+            "rate_limit_applied": True,
+            "cap_reason": None,
+            "cap_type": None,
+        },
+        "rate",
+        "rate_limit_applied=true must mention rate limiting",
+    ),
+)
+
+
+def _iter_failures() -> Iterator[str]:
+    for multiplier, expected_label, message in LABEL_CASES:
+        if price_action_label(multiplier) != expected_label:
+            yield message
+    for kwargs, expected_fragment, message in GUARDRAIL_CASES:
+        if expected_fragment not in guardrail_note(**kwargs).lower():
+            yield message
+
 
 def main() -> int:
-    checks = [
-        (price_action_label(1.0) == "No price change", "1.00 must map to 'No price change'"),
-        (price_action_label(1.05) == "Small increase", "1.01-1.08 must map to 'Small increase'"),
-        (
-            "cap" in guardrail_note(
-                cap_applied=True,
-                rate_limit_applied=False,
-                cap_reason="confidence",
-                cap_type="contextual",
-            ).lower(),
-            "cap_applied=true must mention cap behavior",
-        ),
-        (
-            "rate" in guardrail_note(
-                cap_applied=False,
-                rate_limit_applied=True,
-                cap_reason=None,
-                cap_type=None,
-            ).lower(),
-            "rate_limit_applied=true must mention rate limiting",
-        ),
-    ]
-
-    failures = [message for passed, message in checks if not passed]
+    failures = list(_iter_failures())
     if failures:
         for failure in failures:
             print(f"FAIL: {failure}")
@@ -27,12 +27,20 @@ def parse_args() -> argparse.Namespace:
         default=["2024-01", "2024-02", "2024-03"],
         help="Year-month entries (YYYY-MM) to download for pilot",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Maximum number of files to download concurrently",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    manifest_rows = download_sample_files(args.months)
+    # One extra worker covers the zone lookup file fetched alongside the months.
+    max_workers = max(1, min(args.max_workers, len(args.months) + 1))
+    manifest_rows = download_sample_files(args.months, max_workers=max_workers)
     print(json.dumps({"files_recorded": len(manifest_rows), "months": args.months}, indent=2))
 
 
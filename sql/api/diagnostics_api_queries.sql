@@ -1,10 +1,13 @@
 -- Diagnostics API query pack.
 -- These templates mirror the service-layer SQL used by diagnostics endpoints.
 
--- Coverage summary for latest pricing run.
+-- Coverage and guardrail usage for latest pricing run (one aggregate pass).
 SELECT
-    COUNT(DISTINCT zone_id) AS pricing_zone_count,
-    COUNT(*) AS pricing_row_count
+    COUNT(*) AS total_rows,
+    COUNT(DISTINCT zone_id) AS zone_count,
+    COUNT(*) FILTER (WHERE cap_applied) AS cap_applied_rows,
+    COUNT(*) FILTER (WHERE rate_limit_applied) AS rate_limited_rows,
+    COUNT(*) FILTER (WHERE smoothing_applied) AS smoothing_applied_rows
 FROM pricing_decisions
 WHERE run_id = :pricing_run_id;
 
@@ -15,15 +18,6 @@ SELECT
 FROM demand_forecast
 WHERE run_id = :forecast_run_id;
 
--- Guardrail usage summary.
-SELECT
-    COUNT(*) AS total_rows,
-    SUM(CASE WHEN cap_applied THEN 1 ELSE 0 END) AS cap_applied_rows,
-    SUM(CASE WHEN rate_limit_applied THEN 1 ELSE 0 END) AS rate_limited_rows,
-    SUM(CASE WHEN smoothing_applied THEN 1 ELSE 0 END) AS smoothing_applied_rows
-FROM pricing_decisions
-WHERE run_id = :pricing_run_id;
-
 -- Confidence distribution summary.
 SELECT
     uncertainty_band,
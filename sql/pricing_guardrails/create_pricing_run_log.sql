@@ -26,3 +26,6 @@ CREATE INDEX IF NOT EXISTS idx_pricing_run_log_started_at
 
 CREATE INDEX IF NOT EXISTS idx_pricing_run_log_status
     ON pricing_run_log (status);
+
+CREATE INDEX IF NOT EXISTS idx_pricing_run_log_status_lower_started_at
+    ON pricing_run_log (LOWER(status), started_at DESC);
@@ -28,3 +28,5 @@ CREATE INDEX IF NOT EXISTS idx_scoring_run_log_started_at
 CREATE INDEX IF NOT EXISTS idx_scoring_run_log_status
     ON scoring_run_log (status);
 
+CREATE INDEX IF NOT EXISTS idx_scoring_run_log_status_lower_started_at
+    ON scoring_run_log (LOWER(status), started_at DESC);
@@ -6,13 +6,27 @@
 from __future__ import annotations
 
 import os
-import re
 from functools import lru_cache
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+_IDENTIFIER_FIELDS: tuple[str, ...] = (
+    "pricing_table_name",
+    "forecast_table_name",
+    "zone_table_name",
+    "reason_code_table_name",
+    "pricing_run_log_table_name",
+    "forecast_run_log_table_name",
+    "pricing_policy_snapshot_table_name",
+    "request_log_table_name",
+    "contract_registry_table_name",
+)
+
+
+def _is_safe_identifier(value: str) -> bool:
+    # For ASCII input this matches `^[a-zA-Z_][a-zA-Z0-9_]*$` without running a regex.
+    return value.isascii() and value.isidentifier()
 
 
 class ApiConfig(BaseModel):
@@ -31,6 +45,16 @@ class ApiConfig(BaseModel):
     max_page_size: int = 200
     default_sort_order: str = "bucket_start_ts:desc"
     request_timeout_seconds: int = 30
+    db_pool_size: int = 20
+    db_max_overflow: int = 30
+    db_pool_timeout_seconds: int = 30
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = False
+    diagnostics_cache_ttl_seconds: int = 60
+    metadata_cache_ttl_seconds: int = 300
+    latest_run_cache_ttl_seconds: int = 5
+    list_count_cache_ttl_seconds: int = 60
+    readiness_cache_ttl_seconds: int = 5
     enable_request_logging: bool = False
     include_plain_language_fields: bool = True
     allowed_origins: list[str] = Field(default_factory=list)
@@ -44,7 +68,7 @@ class ApiConfig(BaseModel):
     request_log_table_name: str = "api_request_log"
     contract_registry_table_name: str = "api_contract_registry"
     app_version: str = "0.1.0"
-    allowed_table_names: set[str] = Field(default_factory=set)
+    allowed_table_names: frozenset[str] = Field(default_factory=frozenset)
 
     @field_validator("api_version_path")
     @classmethod
@@ -56,25 +80,28 @@ class ApiConfig(BaseModel):
             raise ValueError("api_version_path must look like '/api/v1'.")
         return value.rstrip("/")
 
+    @model_validator(mode="after")
+    def validate_identifiers(self) -> ApiConfig:
+        # One pass over every SQL identifier; allowlist entries from the environment are
+        # covered here too, so `validate_table_name` can trust set membership.
+        for field_name in _IDENTIFIER_FIELDS:
+            value = getattr(self, field_name)
+            if not _is_safe_identifier(value):
+                raise ValueError(f"Unsafe SQL identifier: {value!r}")
+        for table_name in self.allowed_table_names:
+            if not _is_safe_identifier(table_name):
+                raise ValueError(f"Unsafe SQL identifier in allowlist: {table_name!r}")
+        return self
+
     @field_validator(
-        "pricing_table_name",
-        "forecast_table_name",
-        "zone_table_name",
-        "reason_code_table_name",
-        "pricing_run_log_table_name",
-        "forecast_run_log_table_name",
-        "pricing_policy_snapshot_table_name",
-        "request_log_table_name",
-        "contract_registry_table_name",
+        "default_page_size",
+        "max_page_size",
+        "request_timeout_seconds",
+        "db_pool_size",
+        "db_pool_timeout_seconds",
+        "db_pool_recycle_seconds",
     )
     @classmethod
-    def validate_identifier(cls, value: str) -> str:
-        if not _IDENTIFIER_RE.match(value):
-            raise ValueError(f"Unsafe SQL identifier: {value!r}")
-        return value
-
-    @field_validator("default_page_size", "max_page_size", "request_timeout_seconds")
-    @classmethod
     def validate_positive_ints(cls, value: int) -> int:
         if value <= 0:
             raise ValueError("Value must be greater than 0.")
@@ -84,11 +111,12 @@ class ApiConfig(BaseModel):
         return self.api_version_path.rstrip("/").split("/")[-1]
 
     def validate_table_name(self, table_name: str) -> str:
-        if not _IDENTIFIER_RE.match(table_name):
+        # The allowlist is frozen and identifier-checked when the config is built.
+        if table_name in self.allowed_table_names:
+            return table_name
+        if not _is_safe_identifier(table_name):
             raise ValueError(f"Unsafe SQL identifier: {table_name!r}")
-        if table_name not in self.allowed_table_names:
-            raise ValueError(f"Table name is not in allowlist: {table_name!r}")
-        return table_name
+        raise ValueError(f"Table name is not in allowlist: {table_name!r}")
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -117,18 +145,8 @@ def _env_list(name: str, default: list[str] | None = None) -> list[str]:
     return [item.strip() for item in raw.split(",") if item.strip()]
 
 
-def _build_allowed_table_names(config_values: dict[str, object]) -> set[str]:
-    configured_names = {
-        str(config_values["pricing_table_name"]),
-        str(config_values["forecast_table_name"]),
-        str(config_values["zone_table_name"]),
-        str(config_values["reason_code_table_name"]),
-        str(config_values["pricing_run_log_table_name"]),
-        str(config_values["forecast_run_log_table_name"]),
-        str(config_values["pricing_policy_snapshot_table_name"]),
-        str(config_values["request_log_table_name"]),
-        str(config_values["contract_registry_table_name"]),
-    }
+def _build_allowed_table_names(config_values: dict[str, object]) -> frozenset[str]:
+    configured_names = {str(config_values[field_name]) for field_name in _IDENTIFIER_FIELDS}
     configured_names.update(
         {
             "pricing_decisions",
@@ -143,10 +161,7 @@ def _build_allowed_table_names(config_values: dict[str, object]) -> set[str]:
         }
     )
     configured_names.update(_env_list("API_ALLOWED_TABLE_NAMES", []))
-    for table_name in configured_names:
-        if not _IDENTIFIER_RE.match(table_name):
-            raise ValueError(f"Unsafe SQL identifier in allowlist: {table_name!r}")
-    return configured_names
+    return frozenset(configured_names)
 
 
 def load_api_config(*, load_env: bool = True) -> ApiConfig:
@@ -167,6 +182,16 @@ def load_api_config(*, load_env: bool = True) -> ApiConfig:
         "max_page_size": _env_int("API_MAX_PAGE_SIZE", 200),
         "default_sort_order": os.getenv("API_DEFAULT_SORT_ORDER", "bucket_start_ts:desc"),
         "request_timeout_seconds": _env_int("API_REQUEST_TIMEOUT_SECONDS", 30),
+        "db_pool_size": _env_int("API_DB_POOL_SIZE", 20),
+        "db_max_overflow": _env_int("API_DB_MAX_OVERFLOW", 30),
+        "db_pool_timeout_seconds": _env_int("API_DB_POOL_TIMEOUT_SECONDS", 30),
+        "db_pool_recycle_seconds": _env_int("API_DB_POOL_RECYCLE_SECONDS", 1800),
+        "db_pool_pre_ping": _env_bool("API_DB_POOL_PRE_PING", False),
+        "diagnostics_cache_ttl_seconds": _env_int("API_DIAGNOSTICS_CACHE_TTL_SECONDS", 60),
+        "metadata_cache_ttl_seconds": _env_int("API_METADATA_CACHE_TTL_SECONDS", 300),
+        "latest_run_cache_ttl_seconds": _env_int("API_LATEST_RUN_CACHE_TTL_SECONDS", 5),
+        "list_count_cache_ttl_seconds": _env_int("API_LIST_COUNT_CACHE_TTL_SECONDS", 60),
+        "readiness_cache_ttl_seconds": _env_int("API_READINESS_CACHE_TTL_SECONDS", 5),
         "enable_request_logging": _env_bool("API_ENABLE_REQUEST_LOGGING", False),
         "include_plain_language_fields": _env_bool("API_INCLUDE_PLAIN_LANGUAGE_FIELDS", True),
         "allowed_origins": _env_list("API_ALLOWED_ORIGINS", []),
@@ -5,17 +5,31 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import json
+import os
+import secrets
 import time
-import uuid
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager, suppress
+from datetime import UTC, datetime
+from typing import Any
 
-from fastapi import FastAPI, Request, Response
+from anyio import to_thread
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 from starlette.middleware.base import RequestResponseEndpoint
+from starlette.routing import BaseRoute, Match
 
 from src.api.api_config import get_api_config
-from src.api.dependencies import get_database_client
+from src.api.db_access import DatabaseClient
+from src.api.dependencies import bind_app_services, get_db_connection
 from src.api.error_handlers import register_error_handlers
+from src.api.readiness import ReadinessCache, refresh_readiness, refresh_readiness_forever
+from src.api.request_log_buffer import RequestLogBuffer
+from src.api.responses import ApiJSONResponse
 from src.api.routers.diagnostics import router as diagnostics_router
 from src.api.routers.forecast import router as forecast_router
 from src.api.routers.health import router as health_router
@@ -23,6 +37,18 @@ from src.api.routers.metadata import router as metadata_router
 from src.api.routers.pricing import router as pricing_router
 from src.common.logging import configure_logging
 
+_API_DESCRIPTION = (
+    "Versioned API for real-time demand forecasts and dynamic pricing guardrail outputs. "
+    "Responses include machine fields, optional plain-language summaries, and schema metadata."
+)
+_OPENAPI_TAGS: tuple[dict[str, str], ...] = (
+    {"name": "health", "description": "Service liveness, readiness, and version metadata."},
+    {"name": "pricing", "description": "Pricing decisions and pricing run summaries."},
+    {"name": "forecast", "description": "Demand forecasts with confidence and run summaries."},
+    {"name": "metadata", "description": "Reference catalogs and schema compatibility metadata."},
+    {"name": "diagnostics", "description": "Coverage and guardrail diagnostics snapshots."},
+)
+
 API_HTTP_REQUESTS_TOTAL = Counter(
     "api_http_requests_total",
     "Total number of HTTP requests processed by the API.",
@@ -40,6 +66,89 @@ API_HTTP_INFLIGHT_REQUESTS = Gauge(
     ["method", "path"],
 )
 
+# Bound metric children are cached per label tuple so the middleware skips the label
+# validation and lock taken by `.labels()` on every request.
+_UNMATCHED_ROUTE_LABEL = "__unmatched__"
+_REQUEST_COUNTER_CHILDREN: dict[tuple[str, str, int], Counter] = {}
+_REQUEST_DURATION_CHILDREN: dict[tuple[str, str], Histogram] = {}
+_INFLIGHT_CHILDREN: dict[tuple[str, str], Gauge] = {}
+
+
+def _request_counter(method: str, path: str, status_code: int) -> Counter:
+    key = (method, path, status_code)
+    child = _REQUEST_COUNTER_CHILDREN.get(key)
+    if child is None:
+        child = _REQUEST_COUNTER_CHILDREN.setdefault(
+            key, API_HTTP_REQUESTS_TOTAL.labels(method, path, str(status_code))
+        )
+    return child
+
+
+def _request_duration(method: str, path: str) -> Histogram:
+    key = (method, path)
+    child = _REQUEST_DURATION_CHILDREN.get(key)
+    if child is None:
+        child = _REQUEST_DURATION_CHILDREN.setdefault(
+            key, API_HTTP_REQUEST_DURATION_SECONDS.labels(method, path)
+        )
+    return child
+
+
+def _inflight(method: str, path: str) -> Gauge:
+    key = (method, path)
+    child = _INFLIGHT_CHILDREN.get(key)
+    if child is None:
+        child = _INFLIGHT_CHILDREN.setdefault(key, API_HTTP_INFLIGHT_REQUESTS.labels(method, path))
+    return child
+
+
+# Generated request ids are a per-process random prefix plus a randomly started counter,
+# which keeps them unique without an os.urandom call per request.
+_REQUEST_ID_PREFIX = secrets.token_bytes(8).hex()
+_REQUEST_ID_COUNTER = itertools.count(int.from_bytes(os.urandom(8), "big"))
+
+
+def _new_request_id() -> str:
+    return _REQUEST_ID_PREFIX + format(next(_REQUEST_ID_COUNTER) & 0xFFFFFFFFFFFFFFFF, "016x")
+
+
+# Scrapes within the TTL reuse the last exposition instead of re-walking the registry.
+_METRICS_CACHE_TTL_SECONDS = 2.0
+_METRICS_CACHE: dict[str, Any] = {"ts": 0.0, "body": b""}
+
+
+async def _warm_database_pool(db_client: DatabaseClient) -> bool:
+    """Open pool connections concurrently and report whether any succeeded."""
+
+    engine = db_client.engine
+    pool_size = getattr(engine.pool, "size", lambda: 1)()
+    results = await asyncio.gather(
+        *[asyncio.to_thread(engine.connect) for _ in range(max(pool_size, 1))],
+        return_exceptions=True,
+    )
+    connected = False
+    for result in results:
+        if isinstance(result, BaseException):
+            continue
+        connected = True
+        result.close()
+    return connected
+
+
+def _route_label(routes: Sequence[BaseRoute], request: Request) -> str:
+    """Resolve the route template the router will dispatch `request` to."""
+
+    # Route templates keep label cardinality bounded when paths embed run or zone ids.
+    # Matching ahead of dispatch lets the in-flight gauge carry the same label.
+    partial: BaseRoute | None = None
+    for route in routes:
+        match, _ = route.matches(request.scope)
+        if match is Match.FULL:
+            return getattr(route, "path", None) or _UNMATCHED_ROUTE_LABEL
+        if match is Match.PARTIAL and partial is None:
+            partial = route
+    return getattr(partial, "path", None) or _UNMATCHED_ROUTE_LABEL
+
 
 def create_app() -> FastAPI:
     """Create configured FastAPI application instance."""
@@ -47,28 +156,54 @@ def create_app() -> FastAPI:
     configure_logging()
     config = get_api_config()
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        bind_app_services(app.state, config)
+        # Sync routes run on AnyIO's worker threads; match them to the connections the
+        # pool can hand out so neither side queues while the other sits idle.
+        to_thread.current_default_thread_limiter().total_tokens = max(
+            40, config.db_pool_size + config.db_max_overflow
+        )
+        db_client: DatabaseClient = app.state.db_client
+        app.state.db_connected_at_startup = await _warm_database_pool(db_client)
+
+        request_log_buffer: RequestLogBuffer | None = None
+        if config.enable_request_logging:
+            request_log_buffer = RequestLogBuffer(
+                writer_factory=lambda: db_client,
+                table_name=config.request_log_table_name,
+            )
+            request_log_buffer.start()
+        app.state.request_log_buffer = request_log_buffer
+
+        readiness_cache = ReadinessCache(
+            pricing_table_name=config.pricing_table_name,
+            forecast_table_name=config.forecast_table_name,
+            ttl_seconds=config.readiness_cache_ttl_seconds,
+        )
+        app.state.readiness_cache = readiness_cache
+        await refresh_readiness(readiness_cache, db_client)
+        readiness_task = asyncio.create_task(refresh_readiness_forever(readiness_cache, db_client))
+        try:
+            yield
+        finally:
+            readiness_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await readiness_task
+            if request_log_buffer is not None:
+                await request_log_buffer.stop()
+
     app = FastAPI(
+        lifespan=lifespan,
         title=config.api_name,
-        description=(
-            "Versioned API for real-time demand forecasts and dynamic pricing guardrail outputs. "
-            "Responses include machine fields, optional plain-language summaries, and schema metadata."
-        ),
+        description=_API_DESCRIPTION,
         version=config.app_version,
-        openapi_tags=[
-            {"name": "health", "description": "Service liveness, readiness, and version metadata."},
-            {"name": "pricing", "description": "Pricing decisions and pricing run summaries."},
-            {
-                "name": "forecast",
-                "description": "Demand forecasts with confidence and run summaries.",
-            },
-            {
-                "name": "metadata",
-                "description": "Reference catalogs and schema compatibility metadata.",
-            },
-            {"name": "diagnostics", "description": "Coverage and guardrail diagnostics snapshots."},
-        ],
+        openapi_tags=list(_OPENAPI_TAGS),
+        default_response_class=ApiJSONResponse,
     )
 
+    app.state.config = config
+
     if config.allowed_origins:
         app.add_middleware(
             CORSMiddleware,
@@ -82,71 +217,111 @@ def create_app() -> FastAPI:
     async def request_context_middleware(
         request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
-        request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
+        request_id = request.headers.get("x-request-id") or _new_request_id()
         request.state.request_id = request_id
+        # One wall-clock read per request, shared by envelopes, errors, and the log row.
+        now_utc = datetime.now(tz=UTC)
+        request.state.now_utc = now_utc
 
         method_label = request.method
-        path_label = request.url.path
+        path_label = _route_label(app.router.routes, request)
         started = time.perf_counter()
         status_code = 500
-        API_HTTP_INFLIGHT_REQUESTS.labels(method=method_label, path=path_label).inc()
+        inflight = _inflight(method_label, path_label)
+        inflight.inc()
         try:
             response: Response = await call_next(request)
             status_code = response.status_code
             duration_ms = (time.perf_counter() - started) * 1000.0
 
             response.headers["x-request-id"] = request_id
-            response.headers["x-response-time-ms"] = f"{duration_ms:.2f}"
+            response.headers["x-response-time-ms"] = format(duration_ms, ".2f")
 
             if config.enable_request_logging:
-                try:
-                    db = get_database_client()
-                    db.log_request(
-                        table_name=config.request_log_table_name,
-                        request_id=request_id,
-                        path=request.url.path,
-                        method=request.method,
-                        status_code=response.status_code,
-                        duration_ms=duration_ms,
+                request_log_buffer = getattr(app.state, "request_log_buffer", None)
+                if request_log_buffer is not None:
+                    request_log_buffer.put_nowait(
+                        {
+                            "request_id": request_id,
+                            "path": request.url.path,
+                            "method": request.method,
+                            "status_code": response.status_code,
+                            "duration_ms": duration_ms,
+                            "created_at": now_utc,
+                        }
                     )
-                except Exception:
-                    pass
 
             return response
         finally:
             duration_s = time.perf_counter() - started
-            API_HTTP_REQUESTS_TOTAL.labels(
-                method=method_label,
-                path=path_label,
-                status_code=str(status_code),
-            ).inc()
-            API_HTTP_REQUEST_DURATION_SECONDS.labels(
-                method=method_label,
-                path=path_label,
-            ).observe(duration_s)
-            API_HTTP_INFLIGHT_REQUESTS.labels(method=method_label, path=path_label).dec()
+            _request_counter(method_label, path_label, status_code).inc()
+            _request_duration(method_label, path_label).observe(duration_s)
+            inflight.dec()
 
     @app.get("/metrics", include_in_schema=False)
-    def metrics() -> Response:
-        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
-
-    @app.on_event("startup")
-    def startup_checks() -> None:
-        try:
-            db = get_database_client()
-            app.state.db_connected_at_startup = db.can_connect()
-        except Exception:
-            app.state.db_connected_at_startup = False
+    async def metrics() -> Response:
+        now = time.monotonic()
+        if now - _METRICS_CACHE["ts"] > _METRICS_CACHE_TTL_SECONDS:
+            body = await asyncio.to_thread(generate_latest)
+            _METRICS_CACHE.update(ts=now, body=body)
+        return Response(content=_METRICS_CACHE["body"], media_type=CONTENT_TYPE_LATEST)
 
     register_error_handlers(app)
 
     app.include_router(health_router)
-    app.include_router(pricing_router, prefix=config.api_version_path)
-    app.include_router(forecast_router, prefix=config.api_version_path)
-    app.include_router(metadata_router, prefix=config.api_version_path)
-    app.include_router(diagnostics_router, prefix=config.api_version_path)
+    versioned_dependencies = [Depends(get_db_connection)]
+    app.include_router(
+        pricing_router, prefix=config.api_version_path, dependencies=versioned_dependencies
+    )
+    app.include_router(
+        forecast_router, prefix=config.api_version_path, dependencies=versioned_dependencies
+    )
+    app.include_router(
+        metadata_router, prefix=config.api_version_path, dependencies=versioned_dependencies
+    )
+    app.include_router(
+        diagnostics_router, prefix=config.api_version_path, dependencies=versioned_dependencies
+    )
+
+    if config.environment != "local" and app.openapi_url:
+        _install_cached_openapi_route(app, app.openapi_url)
 
     return app
 
 
-app = create_app()
+def _install_cached_openapi_route(app: FastAPI, openapi_url: str) -> None:
+    """Serve the OpenAPI document from bytes serialized on the first request.
+
+    The document is built lazily so importing the app (for example from the contract
+    script) does not pay for schema generation; bytes are cached per `root_path` so the
+    `servers` entry FastAPI normally injects is preserved behind a proxy prefix.
+    """
+
+    serialized: dict[str, bytes] = {}
+    app.router.routes[:] = [
+        route for route in app.router.routes if getattr(route, "path", None) != openapi_url
+    ]
+
+    @app.get(openapi_url, include_in_schema=False)
+    def cached_openapi(request: Request) -> Response:
+        root_path = str(request.scope.get("root_path", "")).rstrip("/")
+        body = serialized.get(root_path)
+        if body is None:
+            schema = app.openapi()
+            if root_path and app.root_path_in_servers:
+                server_urls = {server.get("url") for server in app.servers}
+                if root_path not in server_urls:
+                    schema = {**schema, "servers": [{"url": root_path}, *app.servers]}
+            body = json.dumps(schema).encode("utf-8")
+            serialized[root_path] = body
+        return Response(content=body, media_type="application/json")
+
+
+def __getattr__(name: str) -> FastAPI:
+    # PEP 562 hook: build the app on first `src.api.app.app` access rather than at import,
+    # so modules that only need the helpers here do not pay for router registration.
+    if name == "app":
+        instance = create_app()
+        globals()["app"] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,22 +6,78 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Mapping
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.elements import TextClause
 
 _IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+_MISSING_TABLE_RECHECK_SECONDS = 60.0
+
+
+class RequestConnectionScope:
+    """Lazily checked-out read connection shared by every query in one request."""
+
+    __slots__ = ("engine", "connection")
+
+    def __init__(self) -> None:
+        self.engine: Engine | None = None
+        self.connection: Connection | None = None
+
+    def activate(self) -> Token[RequestConnectionScope | None]:
+        return _REQUEST_CONNECTION_SCOPE.set(self)
+
+    def deactivate(self, token: Token[RequestConnectionScope | None]) -> None:
+        _REQUEST_CONNECTION_SCOPE.reset(token)
+
+    def close(self) -> None:
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            connection.close()
+
+
+_REQUEST_CONNECTION_SCOPE: ContextVar[RequestConnectionScope | None] = ContextVar(
+    "api_request_connection_scope", default=None
+)
 
 
 class DatabaseClient:
     """Minimal SQLAlchemy wrapper for API read/write access."""
 
-    def __init__(self, *, database_url: str) -> None:
-        self._engine: Engine = create_engine(database_url, pool_pre_ping=True, future=True)
+    def __init__(
+        self,
+        *,
+        database_url: str,
+        pool_size: int = 20,
+        max_overflow: int = 30,
+        pool_timeout_seconds: int = 30,
+        pool_recycle_seconds: int = 1800,
+        pool_pre_ping: bool = False,
+    ) -> None:
+        self._engine: Engine = create_engine(
+            database_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout_seconds,
+            pool_recycle=pool_recycle_seconds,
+            pool_pre_ping=pool_pre_ping,
+            future=True,
+        )
+        # Reads share the same pool but run in autocommit, skipping the implicit
+        # BEGIN/COMMIT pair around every SELECT.
+        self._read_engine: Engine = self._engine.execution_options(isolation_level="AUTOCOMMIT")
         self._request_log_table_available: bool | None = None
+        self._request_log_table_checked_at = 0.0
+        self._log_insert_statements: dict[str, TextClause] = {}
+        self._trusted_identifiers: set[str] = set()
 
     @property
     def engine(self) -> Engine:
@@ -42,23 +98,72 @@ class DatabaseClient:
             result = connection.execute(query, {"table_name": table_name}).scalar_one()
         return bool(result)
 
-    def fetch_all(self, query: str, params: Mapping[str, Any] | None = None) -> list[dict[str, Any]]:
-        with self._engine.connect() as connection:
-            rows = connection.execute(text(query), dict(params or {})).mappings().all()
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        """Yield the request-scoped read connection, or a short-lived one outside requests."""
+
+        scope = _REQUEST_CONNECTION_SCOPE.get()
+        if scope is None or scope.engine not in (None, self._read_engine):
+            with self._read_engine.connect() as connection:
+                yield connection
+            return
+        if scope.connection is None:
+            scope.engine = self._read_engine
+            scope.connection = self._read_engine.connect()
+        yield scope.connection
+
+    def fetch_all(
+        self,
+        query: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        conn: Connection | None = None,
+    ) -> list[dict[str, Any]]:
+        if conn is not None:
+            rows = conn.execute(_text_clause(query), dict(params or {})).mappings().all()
+            return [dict(row) for row in rows]
+        with self.connection() as connection:
+            rows = connection.execute(_text_clause(query), dict(params or {})).mappings().all()
         return [dict(row) for row in rows]
 
-    def fetch_one(self, query: str, params: Mapping[str, Any] | None = None) -> dict[str, Any] | None:
-        with self._engine.connect() as connection:
-            row = connection.execute(text(query), dict(params or {})).mappings().first()
+    def fetch_one(
+        self,
+        query: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        conn: Connection | None = None,
+    ) -> dict[str, Any] | None:
+        if conn is not None:
+            row = conn.execute(_text_clause(query), dict(params or {})).mappings().first()
+            return dict(row) if row is not None else None
+        with self.connection() as connection:
+            row = connection.execute(_text_clause(query), dict(params or {})).mappings().first()
         return dict(row) if row is not None else None
 
-    def fetch_scalar(self, query: str, params: Mapping[str, Any] | None = None) -> Any:
-        with self._engine.connect() as connection:
-            return connection.execute(text(query), dict(params or {})).scalar_one()
+    def fetch_scalar(
+        self,
+        query: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        conn: Connection | None = None,
+    ) -> Any:
+        if conn is not None:
+            return conn.execute(_text_clause(query), dict(params or {})).scalar_one()
+        with self.connection() as connection:
+            return connection.execute(_text_clause(query), dict(params or {})).scalar_one()
 
-    def execute(self, query: str, params: Mapping[str, Any] | None = None) -> None:
+    def execute(
+        self,
+        query: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        conn: Connection | None = None,
+    ) -> None:
+        if conn is not None:
+            conn.execute(_text_clause(query), dict(params or {}))
+            return
         with self._engine.begin() as connection:
-            connection.execute(text(query), dict(params or {}))
+            connection.execute(_text_clause(query), dict(params or {}))
 
     def log_request(
         self,
@@ -70,28 +175,88 @@ class DatabaseClient:
         status_code: int,
         duration_ms: float,
     ) -> None:
+        self.log_requests(
+            table_name=table_name,
+            records=[
+                {
+                    "request_id": request_id,
+                    "path": path,
+                    "method": method,
+                    "status_code": status_code,
+                    "duration_ms": duration_ms,
+                    "created_at": datetime.now(tz=UTC),
+                }
+            ],
+        )
+
+    def log_requests(self, *, table_name: str, records: Sequence[Mapping[str, Any]]) -> None:
+        """Insert a batch of request log rows in one transaction."""
+
+        if not records:
+            return
         safe_table = self._validate_identifier(table_name)
-        if self._request_log_table_available is not True:
-            self._request_log_table_available = self.table_exists(safe_table)
-        if not self._request_log_table_available:
+        if not self._request_log_table_ready(safe_table):
             return
 
-        query = f"""
-        INSERT INTO {safe_table} (request_id, path, method, status_code, duration_ms, created_at)
-        VALUES (:request_id, :path, :method, :status_code, :duration_ms, NOW())
-        """
-        self.execute(
-            query,
-            {
-                "request_id": request_id,
-                "path": path,
-                "method": method,
-                "status_code": status_code,
-                "duration_ms": duration_ms,
-            },
-        )
+        with self._engine.begin() as connection:
+            connection.execute(
+                self._log_insert_statement(safe_table), [dict(record) for record in records]
+            )
+
+    def _log_insert_statement(self, safe_table: str) -> TextClause:
+        # Built once per table so the logging path skips re-parsing bind parameters.
+        statement = self._log_insert_statements.get(safe_table)
+        if statement is None:
+            # Client supplied request ids can repeat; skipping duplicates keeps one bad row
+            # from rolling back the whole batch.
+            statement = text(
+                f"""
+                INSERT INTO {safe_table}
+                    (request_id, path, method, status_code, duration_ms, created_at)
+                VALUES (:request_id, :path, :method, :status_code, :duration_ms, :created_at)
+                ON CONFLICT (request_id) DO NOTHING
+                """
+            )
+            self._log_insert_statements[safe_table] = statement
+        return statement
+
+    def _request_log_table_ready(self, safe_table: str) -> bool:
+        # A missing table is re-checked at most once per interval instead of on every
+        # logged request; a present table is never re-checked.
+        available = self._request_log_table_available
+        if available is True:
+            return True
+        now = time.monotonic()
+        if (
+            available is False
+            and now - self._request_log_table_checked_at < _MISSING_TABLE_RECHECK_SECONDS
+        ):
+            return False
+        self._request_log_table_available = self.table_exists(safe_table)
+        self._request_log_table_checked_at = now
+        return self._request_log_table_available
+
+    def trust_identifiers(self, identifiers: Iterable[str]) -> None:
+        """Validate deployment-static identifiers once so later calls skip the regex."""
+
+        for identifier in identifiers:
+            self._trusted_identifiers.add(_validate_identifier(identifier))
 
     def _validate_identifier(self, identifier: str) -> str:
-        if not _IDENTIFIER_RE.match(identifier):
-            raise ValueError(f"Unsafe SQL identifier: {identifier!r}")
-        return identifier
+        if identifier in self._trusted_identifiers:
+            return identifier
+        return _validate_identifier(identifier)
+
+
+@lru_cache(maxsize=256)
+def _text_clause(query: str) -> TextClause:
+    # Services send a small, fixed set of SQL strings (table names are deployment-static and
+    # values are bound), so the parsed clause is reused instead of re-scanning for binds.
+    return text(query)
+
+
+@lru_cache(maxsize=64)
+def _validate_identifier(identifier: str) -> str:
+    if not _IDENTIFIER_RE.match(identifier):
+        raise ValueError(f"Unsafe SQL identifier: {identifier!r}")
+    return identifier
@@ -1,53 +1,136 @@
 # This file provides dependency factories for FastAPI routes and middleware.
-# It exists so services are created once and shared through dependency injection.
+# It exists so services built once at startup are shared through dependency injection.
 # The setup keeps routers thin and makes endpoint tests easy to override.
 # Centralized construction also ensures one consistent API configuration is used.
 
 from __future__ import annotations
 
-from functools import lru_cache
+import asyncio
+from collections.abc import AsyncIterator
+from collections.abc import Set as AbstractSet
+from datetime import datetime
 
-from src.api.api_config import ApiConfig, get_api_config
-from src.api.db_access import DatabaseClient
+from fastapi import Request
+from starlette.datastructures import State
+
+from src.api.api_config import ApiConfig
+from src.api.db_access import DatabaseClient, RequestConnectionScope
+from src.api.error_handlers import APIError
+from src.api.pagination import PaginationSpec, SortSpec, normalize_pagination, parse_sort
 from src.api.services.diagnostics_service import DiagnosticsService
 from src.api.services.forecast_service import ForecastService
 from src.api.services.metadata_service import MetadataService
 from src.api.services.pricing_service import PricingService
 
 
-@lru_cache(maxsize=1)
-def get_database_client() -> DatabaseClient:
-    config = get_api_config()
-    return DatabaseClient(database_url=config.database_url)
+def build_database_client(config: ApiConfig) -> DatabaseClient:
+    return DatabaseClient(
+        database_url=config.database_url,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout_seconds=config.db_pool_timeout_seconds,
+        pool_recycle_seconds=config.db_pool_recycle_seconds,
+        pool_pre_ping=config.db_pool_pre_ping,
+    )
+
+
+def bind_app_services(state: State, config: ApiConfig) -> None:
+    """Construct the database client and services once and store them on `app.state`."""
+
+    db_client = build_database_client(config)
+    db_client.trust_identifiers(config.allowed_table_names)
+    state.db_client = db_client
+    state.pricing_service = PricingService(config=config, db=db_client)
+    state.forecast_service = ForecastService(config=config, db=db_client)
+    state.metadata_service = MetadataService(config=config, db=db_client)
+    state.diagnostics_service = DiagnosticsService(config=config, db=db_client)
+
+
+async def get_database_client(request: Request) -> DatabaseClient:
+    db_client: DatabaseClient = request.app.state.db_client
+    return db_client
+
+
+async def get_pricing_service(request: Request) -> PricingService:
+    service: PricingService = request.app.state.pricing_service
+    return service
+
+
+async def get_forecast_service(request: Request) -> ForecastService:
+    service: ForecastService = request.app.state.forecast_service
+    return service
+
+
+async def get_metadata_service(request: Request) -> MetadataService:
+    service: MetadataService = request.app.state.metadata_service
+    return service
+
+
+async def get_diagnostics_service(request: Request) -> DiagnosticsService:
+    service: DiagnosticsService = request.app.state.diagnostics_service
+    return service
+
 
+def ensure_time_window(*, start_ts: datetime, end_ts: datetime) -> None:
+    """Reject reversed `start_ts`/`end_ts` query windows with one shared API error."""
 
-@lru_cache(maxsize=1)
-def get_pricing_service() -> PricingService:
-    config = get_api_config()
-    db_client = get_database_client()
-    return PricingService(config=config, db=db_client)
+    if start_ts > end_ts:
+        raise APIError(
+            status_code=400,
+            error_code="INVALID_TIME_WINDOW",
+            message="start_ts must be less than or equal to end_ts.",
+        )
 
 
-@lru_cache(maxsize=1)
-def get_forecast_service() -> ForecastService:
-    config = get_api_config()
-    db_client = get_database_client()
-    return ForecastService(config=config, db=db_client)
+def resolve_list_query(
+    *,
+    config: ApiConfig,
+    page: int,
+    page_size: int | None,
+    limit: int | None,
+    sort: str | None,
+    default_sort: str,
+    allowed_fields: AbstractSet[str],
+) -> tuple[PaginationSpec, SortSpec]:
+    """Validate list paging and sort query values, raising one shared API error."""
 
+    try:
+        pagination = normalize_pagination(
+            page=page,
+            page_size=page_size,
+            limit=limit,
+            default_page_size=config.default_page_size,
+            max_page_size=config.max_page_size,
+        )
+        sort_spec = parse_sort(
+            requested_sort=sort,
+            default_sort=default_sort,
+            allowed_fields=allowed_fields,
+        )
+    except ValueError as exc:
+        raise APIError(
+            status_code=400,
+            error_code="INVALID_QUERY_PARAM",
+            message=str(exc),
+        ) from exc
+    return pagination, sort_spec
 
-@lru_cache(maxsize=1)
-def get_metadata_service() -> MetadataService:
-    config = get_api_config()
-    db_client = get_database_client()
-    return MetadataService(config=config, db=db_client)
 
+async def get_db_connection() -> AsyncIterator[None]:
+    """Scope one pooled read connection to the request; it is checked out on first use."""
 
-@lru_cache(maxsize=1)
-def get_diagnostics_service() -> DiagnosticsService:
-    config = get_api_config()
-    db_client = get_database_client()
-    return DiagnosticsService(config=config, db=db_client)
+    scope = RequestConnectionScope()
+    token = scope.activate()
+    try:
+        yield
+    finally:
+        scope.deactivate(token)
+        await asyncio.to_thread(scope.close)
 
 
-def get_config() -> ApiConfig:
-    return get_api_config()
+async def get_config(request: Request) -> ApiConfig:
+    # `create_app` binds the loaded config once so requests skip the cached loader call.
+    # State-backed dependencies are `async def` so FastAPI resolves them on the event loop
+    # instead of dispatching each one to the threadpool.
+    config: ApiConfig = request.app.state.config
+    return config
@@ -5,12 +5,14 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 
-from fastapi import FastAPI, HTTPException, Request
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+
+from src.api.response_envelope import request_timestamp
+from src.api.responses import ApiJSONResponse
 
 
 class APIError(Exception):
@@ -43,55 +45,86 @@ def _error_body(
         "message": message,
         "details": details,
         "request_id": _request_id(request),
-        "timestamp": datetime.now(tz=UTC).isoformat(),
+        "timestamp": request_timestamp(request),
     }
 
 
-def register_error_handlers(app: FastAPI) -> None:
-    """Register global exception handlers."""
-
-    @app.exception_handler(APIError)
-    async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=_error_body(
-                request=request,
-                error_code=exc.error_code,
-                message=exc.message,
-                details=exc.details,
-            ),
+# Unhandled failures always share the same leading fields, so only the request id and
+# timestamp are serialized per response.
+_INTERNAL_ERROR_PREFIX = orjson.dumps(
+    {
+        "error_code": "INTERNAL_SERVER_ERROR",
+        "message": "The server encountered an unexpected error.",
+        "details": None,
+    }
+)[:-1]
+
+
+def _internal_error_content(request: Request) -> bytes:
+    return b"".join(
+        (
+            _INTERNAL_ERROR_PREFIX,
+            b',"request_id":',
+            orjson.dumps(_request_id(request)),
+            b',"timestamp":',
+            orjson.dumps(request_timestamp(request)),
+            b"}",
         )
+    )
+
+
+# Starlette types handlers as taking any Exception; each one is registered for a single
+# exception class below, so the casts only narrow the static type.
+async def api_error_handler(request: Request, exc: Exception) -> Response:
+    api_error = cast(APIError, exc)
+    return ApiJSONResponse(
+        status_code=api_error.status_code,
+        content=_error_body(
+            request=request,
+            error_code=api_error.error_code,
+            message=api_error.message,
+            details=api_error.details,
+        ),
+    )
+
+
+async def validation_error_handler(request: Request, exc: Exception) -> Response:
+    validation_error = cast(RequestValidationError, exc)
+    return ApiJSONResponse(
+        status_code=422,
+        content=_error_body(
+            request=request,
+            error_code="VALIDATION_ERROR",
+            message="Invalid request parameters.",
+            details=validation_error.errors(),
+        ),
+    )
+
+
+async def http_exception_handler(request: Request, exc: Exception) -> Response:
+    http_error = cast(HTTPException, exc)
+    return ApiJSONResponse(
+        status_code=http_error.status_code,
+        content=_error_body(
+            request=request,
+            error_code="HTTP_ERROR",
+            message=str(http_error.detail),
+        ),
+    )
+
+
+async def unhandled_exception_handler(request: Request, _: Exception) -> Response:
+    return Response(
+        status_code=500,
+        content=_internal_error_content(request),
+        media_type="application/json",
+    )
 
-    @app.exception_handler(RequestValidationError)
-    async def validation_error_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
-        return JSONResponse(
-            status_code=422,
-            content=_error_body(
-                request=request,
-                error_code="VALIDATION_ERROR",
-                message="Invalid request parameters.",
-                details=exc.errors(),
-            ),
-        )
 
-    @app.exception_handler(HTTPException)
-    async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=_error_body(
-                request=request,
-                error_code="HTTP_ERROR",
-                message=str(exc.detail),
-            ),
-        )
+def register_error_handlers(app: FastAPI) -> None:
+    """Register global exception handlers."""
 
-    @app.exception_handler(Exception)
-    async def unhandled_exception_handler(request: Request, _: Exception) -> JSONResponse:
-        return JSONResponse(
-            status_code=500,
-            content=_error_body(
-                request=request,
-                error_code="INTERNAL_SERVER_ERROR",
-                message="The server encountered an unexpected error.",
-            ),
-        )
+    app.add_exception_handler(APIError, api_error_handler)
+    app.add_exception_handler(RequestValidationError, validation_error_handler)
+    app.add_exception_handler(HTTPException, http_exception_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
@@ -5,7 +5,20 @@
 
 from __future__ import annotations
 
+import base64
+from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import orjson
+
+_SORT_ORDERS = frozenset({"asc", "desc"})
+
+# Row columns that break ties after the sort value. (zone_id, bucket_start_ts) is unique
+# within a run, so together with a NOT NULL sort column they give a total row order.
+KEYSET_TIE_BREAKERS = ("zone_id", "bucket_start_ts")
 
 
 @dataclass(frozen=True)
@@ -54,23 +67,30 @@ def parse_sort(
     *,
     requested_sort: str | None,
     default_sort: str,
-    allowed_fields: set[str],
+    allowed_fields: AbstractSet[str],
 ) -> SortSpec:
     """Parse sort input in the form `field:asc|desc`."""
 
     raw_sort = (requested_sort or default_sort).strip().lower()
     if not raw_sort:
         raise ValueError("sort cannot be empty")
+    if not isinstance(allowed_fields, frozenset):
+        allowed_fields = frozenset(allowed_fields)
+    return _parse_sort_text(raw_sort, allowed_fields)
 
-    if ":" in raw_sort:
-        field, order = raw_sort.split(":", 1)
-    else:
-        field, order = raw_sort, "asc"
+
+@lru_cache(maxsize=128)
+def _parse_sort_text(raw_sort: str, allowed_fields: frozenset[str]) -> SortSpec:
+    # Most requests send the configured default or one of a few sort strings, so
+    # successful parses are shared; invalid input raises and is never cached.
+    field, separator, order = raw_sort.partition(":")
+    if not separator:
+        order = "asc"
 
     if field not in allowed_fields:
         supported = ", ".join(sorted(allowed_fields))
         raise ValueError(f"Unsupported sort field '{field}'. Supported fields: {supported}")
-    if order not in {"asc", "desc"}:
+    if order not in _SORT_ORDERS:
         raise ValueError("sort order must be 'asc' or 'desc'")
     return SortSpec(field=field, order=order)
 
@@ -81,3 +101,116 @@ def compute_total_pages(*, total_count: int, page_size: int) -> int:
     if total_count <= 0:
         return 0
     return ((total_count - 1) // page_size) + 1
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of a page's last row as an opaque, URL-safe cursor."""
+
+    return base64.urlsafe_b64encode(orjson.dumps(list(values))).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a cursor produced by `encode_cursor`."""
+
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise ValueError("cursor is invalid") from None
+    if not isinstance(values, list):
+        raise ValueError("cursor is invalid")
+    return values
+
+
+def keyset_after_clause(*, sort_expr: str, sort_order: str, table_alias: str) -> str:
+    """Return the SQL predicate selecting rows after the cursor's sort key."""
+
+    # Keyset sorts are limited to NOT NULL columns, so plain comparisons are total.
+    comparison = ">" if sort_order == "asc" else "<"
+    columns = ", ".join(f"{table_alias}.{name}" for name in KEYSET_TIE_BREAKERS)
+    bounds = ", ".join(f":cursor_{name}" for name in KEYSET_TIE_BREAKERS)
+    return (
+        f"({sort_expr} {comparison} :cursor_sort_value OR ({sort_expr} = :cursor_sort_value"
+        f" AND ({columns}) > ({bounds})))"
+    )
+
+
+def keyset_page_params(
+    *,
+    cursor: str | None,
+    sort: SortSpec,
+    page: int,
+    page_size: int,
+    value_parsers: Mapping[str, Callable[[Any], Any]],
+) -> dict[str, Any]:
+    """Return limit/offset and cursor bounds for one list page.
+
+    Sorts listed in `value_parsers` read one extra row so `split_keyset_page` can tell
+    whether a next cursor is needed. Raises `ValueError` for unusable cursors.
+    """
+
+    keyset = sort.field in value_parsers
+    params: dict[str, Any]
+    if cursor is None:
+        params = {"offset": (page - 1) * page_size}
+    elif not keyset:
+        raise ValueError(f"cursor is not supported with sort {sort.as_text}")
+    else:
+        params = {"offset": 0, **_keyset_cursor_bounds(cursor, sort, value_parsers)}
+    params["limit"] = page_size + 1 if keyset else page_size
+    return params
+
+
+def _keyset_cursor_bounds(
+    cursor: str, sort: SortSpec, value_parsers: Mapping[str, Callable[[Any], Any]]
+) -> dict[str, Any]:
+    try:
+        sort_text, sort_value, *tie_values = decode_cursor(cursor)
+        if sort_text != sort.as_text or len(tie_values) != len(KEYSET_TIE_BREAKERS):
+            raise ValueError("cursor was issued for a different sort")
+        bounds = {"cursor_sort_value": value_parsers[sort.field](sort_value)}
+        for name, value in zip(KEYSET_TIE_BREAKERS, tie_values, strict=True):
+            bounds[f"cursor_{name}"] = value_parsers[name](value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("cursor is invalid or was issued for a different sort") from exc
+    return bounds
+
+
+def split_keyset_page(
+    rows: list[dict[str, Any]],
+    *,
+    sort: SortSpec,
+    page_size: int,
+    value_parsers: Mapping[str, Callable[[Any], Any]],
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Trim the look-ahead row from a keyset page and return the next cursor, if any."""
+
+    if sort.field not in value_parsers or len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last_row = rows[-1]
+    tie_values = [last_row[name] for name in KEYSET_TIE_BREAKERS]
+    return rows, encode_cursor([sort.as_text, last_row[sort.field], *tie_values])
+
+
+def build_pagination_metadata(
+    *,
+    pagination: PaginationSpec,
+    total_count: int,
+    sort_spec: SortSpec,
+    next_cursor: str | None = None,
+) -> dict[str, Any]:
+    """Return the list envelope pagination block as a plain dict."""
+
+    # The response model validates this once; building a `PaginationMetadata` here
+    # only to `model_dump()` it would validate the same values twice.
+
+    metadata: dict[str, Any] = {
+        "page": pagination.page,
+        "page_size": pagination.page_size,
+        "total_count": total_count,
+        "total_pages": compute_total_pages(total_count=total_count, page_size=pagination.page_size),
+        "sort": sort_spec.as_text,
+    }
+    if next_cursor is not None:
+        metadata["next_cursor"] = next_cursor
+    return metadata
@@ -5,8 +5,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
+
+_PRICE_ACTION_DEFAULT = "Larger increase"
+_DEFAULT_REASON_SUMMARY = "Pricing decision followed policy defaults."
+_DEMAND_OUTLOOK_BINS = np.asarray([5.0, 15.0, 30.0])
+_DEMAND_OUTLOOK_LABELS = np.asarray(["low", "normal", "elevated", "high"], dtype=object)
+_CONFIDENCE_TEMPLATES = (
+    "Lower confidence forecast with {band} uncertainty band, treat changes cautiously.",
+    "Medium confidence forecast with {band} uncertainty band.",
+    "High confidence forecast with {band} uncertainty band.",
+)
+
 
 def price_action_label(final_multiplier: float) -> str:
     """Map multiplier to deterministic price action labels."""
@@ -25,12 +40,19 @@ def price_action_label(final_multiplier: float) -> str:
 def confidence_note(confidence_score: float, uncertainty_band: str | None) -> str:
     """Translate confidence values into a simple sentence."""
 
-    band = (uncertainty_band or "unknown").lower()
     if confidence_score >= 0.8:
-        return f"High confidence forecast with {band} uncertainty band."
-    if confidence_score >= 0.6:
-        return f"Medium confidence forecast with {band} uncertainty band."
-    return f"Lower confidence forecast with {band} uncertainty band, treat changes cautiously."
+        tier = 2
+    elif confidence_score >= 0.6:
+        tier = 1
+    else:
+        tier = 0
+    return _confidence_sentence(tier, uncertainty_band)
+
+
+@lru_cache(maxsize=256)
+def _confidence_sentence(tier: int, uncertainty_band: str | None) -> str:
+    # Bands come from a handful of model labels, so each sentence is formatted once.
+    return _CONFIDENCE_TEMPLATES[tier].format(band=(uncertainty_band or "unknown").lower())
 
 
 def guardrail_note(
@@ -42,6 +64,15 @@ def guardrail_note(
 ) -> str:
     """Describe guardrail effects in plain language."""
 
+    return _guardrail_sentence(cap_applied, rate_limit_applied, cap_reason, cap_type)
+
+
+@lru_cache(maxsize=128)
+def _guardrail_sentence(
+    cap_applied: bool, rate_limit_applied: bool, cap_reason: str | None, cap_type: str | None
+) -> str:
+    # Guardrail flags and cap reasons come from a short policy vocabulary, so whole
+    # sentences are memoized rather than re-formatted for every row.
     if cap_applied and rate_limit_applied:
         reason = (cap_reason or cap_type or "policy").replace("_", " ")
         return f"Both cap and rate limiting were applied due to {reason}."
@@ -62,10 +93,23 @@ def why_this_price(
 ) -> str:
     """Generate concise explanation sentence for pricing rows."""
 
-    action = price_action_label(final_multiplier).lower()
-    if cap_applied or rate_limit_applied:
-        return f"{action.capitalize()} was recommended and then adjusted by guardrails. {reason_summary}"
-    return f"{action.capitalize()} was recommended from forecasted demand signals. {reason_summary}"
+    return _why_this_price(
+        price_action_label(final_multiplier),
+        reason_summary,
+        adjusted=cap_applied or rate_limit_applied,
+    )
+
+
+def _why_this_price(action_label: str, reason_summary: str, *, adjusted: bool) -> str:
+    return _why_this_price_prefix(action_label, adjusted) + reason_summary
+
+
+@lru_cache(maxsize=16)
+def _why_this_price_prefix(action_label: str, adjusted: bool) -> str:
+    action = action_label.capitalize()
+    if adjusted:
+        return f"{action} was recommended and then adjusted by guardrails. "
+    return f"{action} was recommended from forecasted demand signals. "
 
 
 def demand_outlook_label(y_pred: float) -> str:
@@ -94,7 +138,7 @@ def pricing_plain_fields(row: dict[str, Any]) -> dict[str, str | None]:
         "recommended_price_action": price_action_label(final_multiplier),
         "why_this_price": why_this_price(
             final_multiplier=final_multiplier,
-            reason_summary=str(row.get("reason_summary", "Pricing decision followed policy defaults.")),
+            reason_summary=str(row.get("reason_summary", _DEFAULT_REASON_SUMMARY)),
             cap_applied=bool(row.get("cap_applied", False)),
             rate_limit_applied=bool(row.get("rate_limit_applied", False)),
         ),
@@ -129,3 +173,129 @@ def forecast_plain_fields(row: dict[str, Any]) -> dict[str, str]:
             y_pred_upper=float(row.get("y_pred_upper", 0.0)),
         ),
     }
+
+
+def price_action_labels(final_multipliers: np.ndarray) -> np.ndarray:
+    """Vectorized `price_action_label` over an array of multipliers."""
+
+    return np.select(
+        [
+            final_multipliers < 1.0,
+            final_multipliers == 1.0,
+            final_multipliers <= 1.08,
+            final_multipliers <= 1.2,
+        ],
+        ["Price decrease", "No price change", "Small increase", "Moderate increase"],
+        default=_PRICE_ACTION_DEFAULT,
+    )
+
+
+def demand_outlook_labels(y_preds: np.ndarray) -> np.ndarray:
+    """Vectorized `demand_outlook_label` over an array of forecast levels."""
+
+    result: np.ndarray = _DEMAND_OUTLOOK_LABELS[np.digitize(y_preds, _DEMAND_OUTLOOK_BINS)]
+    return result
+
+
+def _confidence_tiers(confidence_scores: np.ndarray) -> list[int]:
+    # `np.select` keeps NaN scores in the lowest tier like the scalar comparisons do.
+    tiers: list[int] = np.select(
+        [confidence_scores >= 0.8, confidence_scores >= 0.6], [2, 1], default=0
+    ).tolist()
+    return tiers
+
+
+def _float_column(rows: Sequence[Mapping[str, Any]], key: str, default: float) -> np.ndarray:
+    return np.fromiter((float(row.get(key, default)) for row in rows), dtype=float, count=len(rows))
+
+
+def _optional_str(value: Any) -> str | None:
+    return str(value) if value is not None else None
+
+
+def _row_values(
+    rows: Sequence[Mapping[str, Any]], columns: tuple[str, ...], defaults: tuple[Any, ...]
+) -> list[tuple[Any, ...]]:
+    # One C-level itemgetter call per row replaces a `.get` per field; rows missing a
+    # column fall back to the defaults the row helpers use.
+    getter = itemgetter(*columns)
+    values: list[tuple[Any, ...]] = []
+    for row in rows:
+        try:
+            values.append(getter(row))
+        except KeyError:
+            values.append(
+                tuple(
+                    row.get(column, default)
+                    for column, default in zip(columns, defaults, strict=True)
+                )
+            )
+    return values
+
+
+_PRICING_TEXT_COLUMNS = (
+    "reason_summary",
+    "cap_applied",
+    "rate_limit_applied",
+    "cap_reason",
+    "cap_type",
+    "uncertainty_band",
+)
+_PRICING_TEXT_DEFAULTS = (_DEFAULT_REASON_SUMMARY, False, False, None, None, None)
+_FORECAST_TEXT_COLUMNS = ("uncertainty_band", "y_pred_lower", "y_pred_upper")
+_FORECAST_TEXT_DEFAULTS = (None, 0.0, 0.0)
+
+
+def pricing_plain_fields_batch(rows: Sequence[Mapping[str, Any]]) -> list[dict[str, str | None]]:
+    """Return `pricing_plain_fields` for every row, bucketing the numeric thresholds at once."""
+
+    if not rows:
+        return []
+    actions: list[str] = price_action_labels(_float_column(rows, "final_multiplier", 1.0)).tolist()
+    tiers = _confidence_tiers(_float_column(rows, "confidence_score", 0.0))
+    text_values = _row_values(rows, _PRICING_TEXT_COLUMNS, _PRICING_TEXT_DEFAULTS)
+
+    results: list[dict[str, str | None]] = []
+    for values, action, tier in zip(text_values, actions, tiers, strict=True):
+        reason_summary, cap_applied, rate_limit_applied, cap_reason, cap_type, band = values
+        cap_applied = bool(cap_applied)
+        rate_limit_applied = bool(rate_limit_applied)
+        results.append(
+            {
+                "recommended_price_action": action,
+                "why_this_price": _why_this_price(
+                    action, str(reason_summary), adjusted=cap_applied or rate_limit_applied
+                ),
+                "guardrail_note": _guardrail_sentence(
+                    cap_applied,
+                    rate_limit_applied,
+                    _optional_str(cap_reason),
+                    _optional_str(cap_type),
+                ),
+                "confidence_note": _confidence_sentence(tier, _optional_str(band)),
+            }
+        )
+    return results
+
+
+def forecast_plain_fields_batch(rows: Sequence[Mapping[str, Any]]) -> list[dict[str, str]]:
+    """Return `forecast_plain_fields` for every row, bucketing the numeric thresholds at once."""
+
+    if not rows:
+        return []
+    outlooks: list[str] = demand_outlook_labels(_float_column(rows, "y_pred", 0.0)).tolist()
+    tiers = _confidence_tiers(_float_column(rows, "confidence_score", 0.0))
+    text_values = _row_values(rows, _FORECAST_TEXT_COLUMNS, _FORECAST_TEXT_DEFAULTS)
+
+    return [
+        {
+            "demand_outlook_label": outlook,
+            "confidence_note": _confidence_sentence(tier, _optional_str(band)),
+            "forecast_range_summary": forecast_range_summary(
+                y_pred_lower=float(y_pred_lower), y_pred_upper=float(y_pred_upper)
+            ),
+        }
+        for (band, y_pred_lower, y_pred_upper), outlook, tier in zip(
+            text_values, outlooks, tiers, strict=True
+        )
+    ]
@@ -0,0 +1,74 @@
+# This file keeps a short-lived cache of database readiness for the `/ready` endpoint.
+# It exists so load balancer health checks do not open a connection and run SQL on every hit.
+# A background task in the app lifespan refreshes the cache on a fixed interval.
+# Requests only probe the database themselves when the cached result has gone stale.
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Protocol
+
+
+class ReadinessProbe(Protocol):
+    def can_connect(self) -> bool: ...
+
+    def table_exists(self, table_name: str) -> bool: ...
+
+
+@dataclass
+class ReadinessCache:
+    """Latest readiness probe result with its monotonic check time."""
+
+    pricing_table_name: str
+    forecast_table_name: str
+    ttl_seconds: float = 5.0
+    last_checked: float = 0.0
+    db_connected: bool = False
+    pricing_source_ready: bool = False
+    forecast_source_ready: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+
+    @property
+    def ready(self) -> bool:
+        return self.db_connected and self.pricing_source_ready and self.forecast_source_ready
+
+    def is_fresh(self) -> bool:
+        return self.last_checked > 0.0 and time.monotonic() - self.last_checked < self.ttl_seconds
+
+    def refresh(self, db: ReadinessProbe) -> None:
+        try:
+            db_connected = db.can_connect()
+            pricing_ready = db_connected and db.table_exists(self.pricing_table_name)
+            forecast_ready = db_connected and db.table_exists(self.forecast_table_name)
+        except Exception:
+            db_connected = pricing_ready = forecast_ready = False
+        self.db_connected = db_connected
+        self.pricing_source_ready = pricing_ready
+        self.forecast_source_ready = forecast_ready
+        self.last_checked = time.monotonic()
+
+
+async def refresh_if_stale(cache: ReadinessCache, probe: ReadinessProbe) -> None:
+    """Refresh a stale cache once even when many probes arrive together."""
+
+    if cache.is_fresh():
+        return
+    async with cache.lock:
+        if not cache.is_fresh():
+            await asyncio.to_thread(cache.refresh, probe)
+
+
+async def refresh_readiness(cache: ReadinessCache, probe: ReadinessProbe) -> None:
+    """Run one probe in a worker thread and store the result in `cache`."""
+
+    await asyncio.to_thread(cache.refresh, probe)
+
+
+async def refresh_readiness_forever(cache: ReadinessCache, probe: ReadinessProbe) -> None:
+    """Refresh `cache` every TTL until cancelled; the caller runs the first probe."""
+
+    while True:
+        await asyncio.sleep(cache.ttl_seconds)
+        await refresh_readiness(cache, probe)
@@ -0,0 +1,115 @@
+# This file buffers API request log rows and writes them to Postgres in batches.
+# It exists so request logging never adds a database round trip to the response path.
+# Rows are queued by the middleware and flushed by one background task per app.
+# Overflowing rows are dropped because request logs are operational, not transactional.
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Mapping
+from typing import Any, Protocol
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RequestLogWriter(Protocol):
+    def log_requests(self, *, table_name: str, records: list[Mapping[str, Any]]) -> None: ...
+
+
+class RequestLogBuffer:
+    """Bounded queue of request log rows drained by a single background flusher."""
+
+    def __init__(
+        self,
+        *,
+        writer_factory: Callable[[], RequestLogWriter],
+        table_name: str,
+        max_batch: int = 500,
+        flush_interval_ms: int = 200,
+        max_queue_size: int = 10_000,
+    ) -> None:
+        self._writer_factory = writer_factory
+        self._table_name = table_name
+        self._max_batch = max_batch
+        self._flush_interval_seconds = flush_interval_ms / 1000.0
+        self._max_queue_size = max_queue_size
+        self._queue: asyncio.Queue[Mapping[str, Any] | None] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.dropped_count = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._task = asyncio.create_task(self._run(self._queue))
+
+    def put_nowait(self, record: Mapping[str, Any]) -> bool:
+        """Queue one row; returns False when the buffer is stopped or full."""
+
+        if self._queue is None:
+            return False
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self.dropped_count += 1
+            return False
+        return True
+
+    async def stop(self) -> None:
+        """Flush queued rows and stop the background task."""
+
+        queue, task = self._queue, self._task
+        self._queue = None
+        self._task = None
+        if queue is None or task is None:
+            return
+        if task.done():
+            return
+
+        # The sentinel waits behind queued rows; if the flusher dies first, stop waiting.
+        sentinel = asyncio.ensure_future(queue.put(None))
+        await asyncio.wait({sentinel, task}, return_when=asyncio.FIRST_COMPLETED)
+        if not sentinel.done():
+            sentinel.cancel()
+        try:
+            await task
+        except Exception:
+            LOGGER.warning("Request log flusher stopped with an error.", exc_info=True)
+
+    async def _run(self, queue: asyncio.Queue[Mapping[str, Any] | None]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            deadline = loop.time() + self._flush_interval_seconds
+            while len(batch) < self._max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    next_item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except TimeoutError:
+                    break
+                if next_item is None:
+                    stop = True
+                    break
+                batch.append(next_item)
+
+            await self._flush(batch)
+            if stop:
+                return
+
+    async def _flush(self, batch: list[Mapping[str, Any]]) -> None:
+        try:
+            writer = self._writer_factory()
+            await asyncio.to_thread(writer.log_requests, table_name=self._table_name, records=batch)
+        except Exception:
+            LOGGER.warning("Dropped %s request log rows after a failed flush.", len(batch))
@@ -8,7 +8,12 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
+from fastapi import Request, Response
+
+from src.api.api_config import ApiConfig
+from src.api.pagination import PaginationSpec, SortSpec, build_pagination_metadata
 from src.api.schema_versions import build_version_fields
+from src.api.services.results import ServiceListResult
 
 
 def utc_now_iso() -> datetime:
@@ -17,6 +22,13 @@ def utc_now_iso() -> datetime:
     return datetime.now(tz=UTC)
 
 
+def request_timestamp(request: Request) -> datetime:
+    """Return the UTC timestamp the request middleware captured for this request."""
+
+    now: datetime | None = getattr(request.state, "now_utc", None)
+    return now if now is not None else utc_now_iso()
+
+
 def build_list_envelope(
     *,
     api_version_path: str,
@@ -25,18 +37,44 @@ def build_list_envelope(
     data: list[dict[str, Any]],
     pagination: dict[str, Any],
     warnings: list[str] | None = None,
+    generated_at: datetime | None = None,
 ) -> dict[str, Any]:
     """Build standard list response envelope."""
 
-    payload = {
+    return {
         **build_version_fields(api_version_path=api_version_path, schema_version=schema_version),
         "request_id": request_id,
-        "generated_at": utc_now_iso(),
-        "data": data,
-        "pagination": pagination,
+        "generated_at": generated_at or utc_now_iso(),
         "warnings": warnings,
+        "pagination": pagination,
+        "data": data,
     }
-    return payload
+
+
+def build_list_response(
+    *,
+    request: Request,
+    config: ApiConfig,
+    service_result: ServiceListResult,
+    pagination: PaginationSpec,
+    sort_spec: SortSpec,
+) -> dict[str, Any]:
+    """Build the list envelope for a paginated service result."""
+
+    return build_list_envelope(
+        api_version_path=config.api_version_path,
+        schema_version=config.schema_version,
+        request_id=request.state.request_id,
+        generated_at=request_timestamp(request),
+        data=service_result["rows"],
+        pagination=build_pagination_metadata(
+            pagination=pagination,
+            total_count=service_result["total_count"],
+            sort_spec=sort_spec,
+            next_cursor=service_result.get("next_cursor"),
+        ),
+        warnings=service_result.get("warnings"),
+    )
 
 
 def build_object_envelope(
@@ -46,13 +84,38 @@ def build_object_envelope(
     request_id: str,
     data: dict[str, Any] | list[dict[str, Any]] | None,
     warnings: list[str] | None = None,
+    generated_at: datetime | None = None,
 ) -> dict[str, Any]:
     """Build standard non-list response envelope."""
 
     return {
         **build_version_fields(api_version_path=api_version_path, schema_version=schema_version),
         "request_id": request_id,
-        "generated_at": utc_now_iso(),
-        "data": data,
+        "generated_at": generated_at or utc_now_iso(),
         "warnings": warnings,
+        "data": data,
     }
+
+
+def build_conditional_object_response(
+    *,
+    request: Request,
+    response: Response,
+    config: ApiConfig,
+    data: dict[str, Any],
+    etag: str,
+    cache_control: str,
+) -> dict[str, Any] | Response:
+    """Return 304 when the client already holds `etag`, else the object envelope."""
+
+    headers = {"Cache-Control": cache_control, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return build_object_envelope(
+        api_version_path=config.api_version_path,
+        schema_version=config.schema_version,
+        request_id=request.state.request_id,
+        generated_at=request_timestamp(request),
+        data=data,
+    )
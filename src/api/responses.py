@@ -0,0 +1,40 @@
+# This file defines the JSON response class used by the API for every rendered body.
+# It exists so orjson handles values that its native encoder rejects, such as Decimal.
+# Route payloads usually arrive already normalized by response models; error details may not.
+# NumPy values are serialized natively so model outputs never fall back to per-value Python.
+
+from __future__ import annotations
+
+import hashlib
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _json_default(value: Any) -> Any:
+    # Called only for types orjson cannot encode natively.
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=str)
+    return str(value)
+
+
+class ApiJSONResponse(ORJSONResponse):
+    """`ORJSONResponse` that falls back to plain values instead of raising on unknown types."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS, default=_json_default)
+
+
+def weak_etag(content: Any) -> str:
+    """Return a weak ETag derived from the JSON form of `content`."""
+
+    body = orjson.dumps(
+        content, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS, default=_json_default
+    )
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
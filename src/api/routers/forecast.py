@@ -8,16 +8,20 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from src.api.api_config import ApiConfig
-from src.api.dependencies import get_config, get_forecast_service
+from src.api.dependencies import (
+    ensure_time_window,
+    get_config,
+    get_forecast_service,
+    resolve_list_query,
+)
 from src.api.error_handlers import APIError
-from src.api.pagination import compute_total_pages, normalize_pagination, parse_sort
-from src.api.response_envelope import build_list_envelope, build_object_envelope
-from src.api.schemas.common import PaginationMetadata
+from src.api.response_envelope import build_conditional_object_response, build_list_response
+from src.api.responses import weak_etag
 from src.api.schemas.forecast_schemas import ForecastListResponseV1, ForecastRunSummaryResponseV1
-from src.api.services.forecast_service import FORECAST_SORT_FIELD_MAP, ForecastService
+from src.api.services.forecast_service import FORECAST_SORT_FIELDS, ForecastService
 
 router = APIRouter(prefix="/forecast", tags=["forecast"])
 ForecastServiceDep = Annotated[ForecastService, Depends(get_forecast_service)]
@@ -35,26 +39,17 @@ def forecast_latest(
     page: int = Query(default=1, ge=1),
     page_size: int | None = Query(default=None, ge=1),
     sort: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
 ) -> dict[str, object]:
-    try:
-        pagination = normalize_pagination(
-            page=page,
-            page_size=page_size,
-            limit=limit,
-            default_page_size=config.default_page_size,
-            max_page_size=config.max_page_size,
-        )
-        sort_spec = parse_sort(
-            requested_sort=sort,
-            default_sort=config.default_sort_order,
-            allowed_fields=set(FORECAST_SORT_FIELD_MAP),
-        )
-    except ValueError as exc:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_QUERY_PARAM",
-            message=str(exc),
-        ) from exc
+    pagination, sort_spec = resolve_list_query(
+        config=config,
+        page=page,
+        page_size=page_size,
+        limit=limit,
+        sort=sort,
+        default_sort=config.default_sort_order,
+        allowed_fields=FORECAST_SORT_FIELDS,
+    )
 
     service_result = service.get_latest_forecast(
         zone_id=zone_id,
@@ -63,26 +58,15 @@ def forecast_latest(
         page_size=pagination.page_size,
         sort=sort_spec,
         include_plain_language_fields=config.include_plain_language_fields,
+        cursor=cursor,
     )
 
-    pagination_meta = PaginationMetadata(
-        page=pagination.page,
-        page_size=pagination.page_size,
-        total_count=int(service_result["total_count"]),
-        total_pages=compute_total_pages(
-            total_count=int(service_result["total_count"]),
-            page_size=pagination.page_size,
-        ),
-        sort=sort_spec.as_text,
-    )
-
-    return build_list_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
-        data=list(service_result["rows"]),
-        pagination=pagination_meta.model_dump(),
-        warnings=service_result.get("warnings"),
+    return build_list_response(
+        request=request,
+        config=config,
+        service_result=service_result,
+        pagination=pagination,
+        sort_spec=sort_spec,
     )
 
 
@@ -99,33 +83,19 @@ def forecast_window(
     page_size: int | None = Query(default=None, ge=1),
     limit: int | None = Query(default=None, ge=1),
     sort: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
 ) -> dict[str, object]:
-    if start_ts > end_ts:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_TIME_WINDOW",
-            message="start_ts must be less than or equal to end_ts.",
-        )
-
-    try:
-        pagination = normalize_pagination(
-            page=page,
-            page_size=page_size,
-            limit=limit,
-            default_page_size=config.default_page_size,
-            max_page_size=config.max_page_size,
-        )
-        sort_spec = parse_sort(
-            requested_sort=sort,
-            default_sort=config.default_sort_order,
-            allowed_fields=set(FORECAST_SORT_FIELD_MAP),
-        )
-    except ValueError as exc:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_QUERY_PARAM",
-            message=str(exc),
-        ) from exc
+    ensure_time_window(start_ts=start_ts, end_ts=end_ts)
+
+    pagination, sort_spec = resolve_list_query(
+        config=config,
+        page=page,
+        page_size=page_size,
+        limit=limit,
+        sort=sort,
+        default_sort=config.default_sort_order,
+        allowed_fields=FORECAST_SORT_FIELDS,
+    )
 
     service_result = service.get_forecast_window(
         start_ts=start_ts,
@@ -137,26 +107,15 @@ def forecast_window(
         page_size=pagination.page_size,
         sort=sort_spec,
         include_plain_language_fields=config.include_plain_language_fields,
+        cursor=cursor,
     )
 
-    pagination_meta = PaginationMetadata(
-        page=pagination.page,
-        page_size=pagination.page_size,
-        total_count=int(service_result["total_count"]),
-        total_pages=compute_total_pages(
-            total_count=int(service_result["total_count"]),
-            page_size=pagination.page_size,
-        ),
-        sort=sort_spec.as_text,
-    )
-
-    return build_list_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
-        data=list(service_result["rows"]),
-        pagination=pagination_meta.model_dump(),
-        warnings=service_result.get("warnings"),
+    return build_list_response(
+        request=request,
+        config=config,
+        service_result=service_result,
+        pagination=pagination,
+        sort_spec=sort_spec,
     )
 
 
@@ -172,33 +131,19 @@ def forecast_zone_timeline(
     page_size: int | None = Query(default=None, ge=1),
     limit: int | None = Query(default=None, ge=1),
     sort: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
 ) -> dict[str, object]:
-    if start_ts > end_ts:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_TIME_WINDOW",
-            message="start_ts must be less than or equal to end_ts.",
-        )
-
-    try:
-        pagination = normalize_pagination(
-            page=page,
-            page_size=page_size,
-            limit=limit,
-            default_page_size=config.default_page_size,
-            max_page_size=config.max_page_size,
-        )
-        sort_spec = parse_sort(
-            requested_sort=sort,
-            default_sort=config.default_sort_order,
-            allowed_fields=set(FORECAST_SORT_FIELD_MAP),
-        )
-    except ValueError as exc:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_QUERY_PARAM",
-            message=str(exc),
-        ) from exc
+    ensure_time_window(start_ts=start_ts, end_ts=end_ts)
+
+    pagination, sort_spec = resolve_list_query(
+        config=config,
+        page=page,
+        page_size=page_size,
+        limit=limit,
+        sort=sort,
+        default_sort=config.default_sort_order,
+        allowed_fields=FORECAST_SORT_FIELDS,
+    )
 
     service_result = service.get_zone_timeline(
         zone_id=zone_id,
@@ -208,35 +153,25 @@ def forecast_zone_timeline(
         page_size=pagination.page_size,
         sort=sort_spec,
         include_plain_language_fields=config.include_plain_language_fields,
+        cursor=cursor,
     )
 
-    pagination_meta = PaginationMetadata(
-        page=pagination.page,
-        page_size=pagination.page_size,
-        total_count=int(service_result["total_count"]),
-        total_pages=compute_total_pages(
-            total_count=int(service_result["total_count"]),
-            page_size=pagination.page_size,
-        ),
-        sort=sort_spec.as_text,
-    )
-
-    return build_list_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
-        data=list(service_result["rows"]),
-        pagination=pagination_meta.model_dump(),
-        warnings=service_result.get("warnings"),
+    return build_list_response(
+        request=request,
+        config=config,
+        service_result=service_result,
+        pagination=pagination,
+        sort_spec=sort_spec,
     )
 
 
 @router.get("/runs/latest", response_model=ForecastRunSummaryResponseV1)
 def forecast_runs_latest(
     request: Request,
+    response: Response,
     service: ForecastServiceDep,
     config: ConfigDep,
-) -> dict[str, object]:
+) -> dict[str, object] | Response:
     summary = service.get_latest_run_summary()
     if summary is None:
         raise APIError(
@@ -245,11 +180,13 @@ def forecast_runs_latest(
             message="No forecast run metadata found.",
         )
 
-    return build_object_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
+    return build_conditional_object_response(
+        request=request,
+        response=response,
+        config=config,
         data=summary,
+        etag=weak_etag(summary),
+        cache_control="no-cache",
     )
 
 
@@ -257,9 +194,10 @@ def forecast_runs_latest(
 def forecast_run_by_id(
     run_id: str,
     request: Request,
+    response: Response,
     service: ForecastServiceDep,
     config: ConfigDep,
-) -> dict[str, object]:
+) -> dict[str, object] | Response:
     summary = service.get_run_summary(run_id=run_id)
     if summary is None:
         raise APIError(
@@ -268,9 +206,11 @@ def forecast_run_by_id(
             message=f"Forecast run_id not found: {run_id}",
         )
 
-    return build_object_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
+    return build_conditional_object_response(
+        request=request,
+        response=response,
+        config=config,
         data=summary,
+        etag=weak_etag(summary),
+        cache_control="no-cache",
     )
@@ -1,12 +1,12 @@
 # This file defines liveness, readiness, and version endpoints for API operations.
 # It exists so orchestration and monitoring systems can verify service health quickly.
-# The readiness check confirms database connectivity and source table availability.
+# The readiness check reports cached database connectivity and source table availability.
 # Version details here help clients track API and schema compatibility over time.
 
 from __future__ import annotations
 
-import subprocess
-from datetime import UTC, datetime
+import os
+from pathlib import Path
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Request
@@ -14,34 +14,64 @@ from fastapi import APIRouter, Depends, Request
 from src.api.api_config import ApiConfig
 from src.api.db_access import DatabaseClient
 from src.api.dependencies import get_config, get_database_client
+from src.api.readiness import ReadinessCache, refresh_if_stale
+from src.api.response_envelope import request_timestamp
 from src.api.schema_versions import build_version_fields
 from src.api.schemas.health_schemas import HealthResponse, ReadinessResponse, VersionResponse
 
 router = APIRouter(tags=["health"])
 ConfigDep = Annotated[ApiConfig, Depends(get_config)]
 DBDep = Annotated[DatabaseClient, Depends(get_database_client)]
-
-
-def _utc_now() -> datetime:
-    return datetime.now(tz=UTC)
+_REPO_ROOT = Path(__file__).resolve().parents[3]
 
 
 def _git_commit() -> str | None:
+    # Container builds can bake the commit in; otherwise read the checkout's HEAD once at
+    # import without spawning git.
+    from_env = os.getenv("GIT_COMMIT", "").strip()
+    if from_env:
+        return from_env
     try:
-        completed = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        value = completed.stdout.strip()
-        return value or None
-    except Exception:
+        return _read_head_commit(_REPO_ROOT / ".git")
+    except (OSError, UnicodeDecodeError):
         return None
 
 
+def _read_head_commit(git_path: Path) -> str | None:
+    if git_path.is_file():
+        # Worktrees and submodules store a `gitdir: <path>` pointer instead of a directory.
+        pointer = git_path.read_text(encoding="utf-8").strip()
+        if not pointer.startswith("gitdir:"):
+            return None
+        git_path = (git_path.parent / pointer.removeprefix("gitdir:").strip()).resolve()
+
+    head = (git_path / "HEAD").read_text(encoding="utf-8").strip()
+    if not head.startswith("ref:"):
+        return head[:7] or None
+
+    ref = head.removeprefix("ref:").strip()
+    common_dir = git_path
+    if (git_path / "commondir").is_file():
+        common_dir = git_path / (git_path / "commondir").read_text(encoding="utf-8").strip()
+    for base in (git_path, common_dir):
+        ref_file = base / ref
+        if ref_file.is_file():
+            return ref_file.read_text(encoding="utf-8").strip()[:7] or None
+
+    packed_refs = common_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text(encoding="utf-8").splitlines():
+            sha, _, name = line.partition(" ")
+            if name == ref:
+                return sha[:7]
+    return None
+
+
+_GIT_COMMIT = _git_commit()
+
+
 @router.get("/health", response_model=HealthResponse)
-def health(
+async def health(
     request: Request,
     config: ConfigDep,
 ) -> dict[str, object]:
@@ -54,20 +84,25 @@ def health(
         "status": "ok",
         "environment": config.environment,
         "service_name": config.api_name,
-        "timestamp": _utc_now(),
+        "timestamp": request_timestamp(request),
     }
 
 
 @router.get("/ready", response_model=ReadinessResponse)
-def ready(
+async def ready(
     request: Request,
     config: ConfigDep,
     db: DBDep,
 ) -> dict[str, object]:
-    db_connected = db.can_connect()
-    pricing_source_ready = db_connected and db.table_exists(config.pricing_table_name)
-    forecast_source_ready = db_connected and db.table_exists(config.forecast_table_name)
-    is_ready = db_connected and pricing_source_ready and forecast_source_ready
+    cache: ReadinessCache | None = getattr(request.app.state, "readiness_cache", None)
+    if cache is None:
+        cache = ReadinessCache(
+            pricing_table_name=config.pricing_table_name,
+            forecast_table_name=config.forecast_table_name,
+            ttl_seconds=config.readiness_cache_ttl_seconds,
+        )
+    await refresh_if_stale(cache, db)
+    db_connected = cache.db_connected
 
     return {
         **build_version_fields(
@@ -76,16 +111,16 @@ def ready(
         ),
         "request_id": request.state.request_id,
         "db_connected": db_connected,
-        "pricing_source_ready": pricing_source_ready,
-        "forecast_source_ready": forecast_source_ready,
-        "ready": is_ready,
+        "pricing_source_ready": cache.pricing_source_ready,
+        "forecast_source_ready": cache.forecast_source_ready,
+        "ready": cache.ready,
         "database": "reachable" if db_connected else "unreachable",
-        "timestamp": _utc_now(),
+        "timestamp": request_timestamp(request),
     }
 
 
 @router.get("/version", response_model=VersionResponse)
-def version(
+async def version(
     request: Request,
     config: ConfigDep,
 ) -> dict[str, object]:
@@ -97,8 +132,8 @@ def version(
         "request_id": request.state.request_id,
         "api_version_path": config.api_version_path,
         "app_version": config.app_version,
-        "git_commit": _git_commit(),
+        "git_commit": _GIT_COMMIT,
         "project": config.api_name,
         "version": config.app_version,
-        "timestamp": _utc_now(),
+        "timestamp": request_timestamp(request),
     }
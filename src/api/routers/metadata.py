@@ -7,14 +7,15 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from src.api.api_config import ApiConfig
-from src.api.dependencies import get_config, get_metadata_service
-from src.api.error_handlers import APIError
-from src.api.pagination import compute_total_pages, normalize_pagination, parse_sort
-from src.api.response_envelope import build_list_envelope, build_object_envelope
-from src.api.schemas.common import PaginationMetadata
+from src.api.dependencies import get_config, get_metadata_service, resolve_list_query
+from src.api.response_envelope import (
+    build_list_response,
+    build_object_envelope,
+    request_timestamp,
+)
 from src.api.schemas.metadata_schemas import (
     PolicySummaryResponseV1,
     ReasonCodeListResponseV1,
@@ -22,8 +23,8 @@ from src.api.schemas.metadata_schemas import (
     ZoneMetadataListResponseV1,
 )
 from src.api.services.metadata_service import (
-    REASON_SORT_FIELD_MAP,
-    ZONE_SORT_FIELD_MAP,
+    REASON_SORT_FIELDS,
+    ZONE_SORT_FIELDS,
     MetadataService,
 )
 
@@ -32,9 +33,14 @@ MetadataServiceDep = Annotated[MetadataService, Depends(get_metadata_service)]
 ConfigDep = Annotated[ApiConfig, Depends(get_config)]
 
 
+def _allow_client_caching(response: Response, config: ApiConfig) -> None:
+    response.headers["Cache-Control"] = f"public, max-age={config.metadata_cache_ttl_seconds}"
+
+
 @router.get("/zones", response_model=ZoneMetadataListResponseV1)
 def metadata_zones(
     request: Request,
+    response: Response,
     service: MetadataServiceDep,
     config: ConfigDep,
     borough: str | None = Query(default=None),
@@ -44,25 +50,16 @@ def metadata_zones(
     limit: int | None = Query(default=None, ge=1),
     sort: str | None = Query(default="zone_id:asc"),
 ) -> dict[str, object]:
-    try:
-        pagination = normalize_pagination(
-            page=page,
-            page_size=page_size,
-            limit=limit,
-            default_page_size=config.default_page_size,
-            max_page_size=config.max_page_size,
-        )
-        sort_spec = parse_sort(
-            requested_sort=sort,
-            default_sort="zone_id:asc",
-            allowed_fields=set(ZONE_SORT_FIELD_MAP),
-        )
-    except ValueError as exc:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_QUERY_PARAM",
-            message=str(exc),
-        ) from exc
+    pagination, sort_spec = resolve_list_query(
+        config=config,
+        page=page,
+        page_size=page_size,
+        limit=limit,
+        sort=sort,
+        default_sort="zone_id:asc",
+        allowed_fields=ZONE_SORT_FIELDS,
+    )
+    _allow_client_caching(response, config)
 
     service_result = service.get_zones(
         borough=borough,
@@ -72,30 +69,19 @@ def metadata_zones(
         sort=sort_spec,
     )
 
-    pagination_meta = PaginationMetadata(
-        page=pagination.page,
-        page_size=pagination.page_size,
-        total_count=int(service_result["total_count"]),
-        total_pages=compute_total_pages(
-            total_count=int(service_result["total_count"]),
-            page_size=pagination.page_size,
-        ),
-        sort=sort_spec.as_text,
-    )
-
-    return build_list_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
-        data=list(service_result["rows"]),
-        pagination=pagination_meta.model_dump(),
-        warnings=service_result.get("warnings"),
+    return build_list_response(
+        request=request,
+        config=config,
+        service_result=service_result,
+        pagination=pagination,
+        sort_spec=sort_spec,
     )
 
 
 @router.get("/reason-codes", response_model=ReasonCodeListResponseV1)
 def metadata_reason_codes(
     request: Request,
+    response: Response,
     service: MetadataServiceDep,
     config: ConfigDep,
     category: str | None = Query(default=None),
@@ -105,25 +91,16 @@ def metadata_reason_codes(
     limit: int | None = Query(default=None, ge=1),
     sort: str | None = Query(default="reason_code:asc"),
 ) -> dict[str, object]:
-    try:
-        pagination = normalize_pagination(
-            page=page,
-            page_size=page_size,
-            limit=limit,
-            default_page_size=config.default_page_size,
-            max_page_size=config.max_page_size,
-        )
-        sort_spec = parse_sort(
-            requested_sort=sort,
-            default_sort="reason_code:asc",
-            allowed_fields=set(REASON_SORT_FIELD_MAP),
-        )
-    except ValueError as exc:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_QUERY_PARAM",
-            message=str(exc),
-        ) from exc
+    pagination, sort_spec = resolve_list_query(
+        config=config,
+        page=page,
+        page_size=page_size,
+        limit=limit,
+        sort=sort,
+        default_sort="reason_code:asc",
+        allowed_fields=REASON_SORT_FIELDS,
+    )
+    _allow_client_caching(response, config)
 
     service_result = service.get_reason_codes(
         category=category,
@@ -133,37 +110,28 @@ def metadata_reason_codes(
         sort=sort_spec,
     )
 
-    pagination_meta = PaginationMetadata(
-        page=pagination.page,
-        page_size=pagination.page_size,
-        total_count=int(service_result["total_count"]),
-        total_pages=compute_total_pages(
-            total_count=int(service_result["total_count"]),
-            page_size=pagination.page_size,
-        ),
-        sort=sort_spec.as_text,
-    )
-
-    return build_list_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
-        data=list(service_result["rows"]),
-        pagination=pagination_meta.model_dump(),
-        warnings=service_result.get("warnings"),
+    return build_list_response(
+        request=request,
+        config=config,
+        service_result=service_result,
+        pagination=pagination,
+        sort_spec=sort_spec,
     )
 
 
 @router.get("/policy/current", response_model=PolicySummaryResponseV1)
 def metadata_current_policy(
     request: Request,
+    response: Response,
     service: MetadataServiceDep,
     config: ConfigDep,
 ) -> dict[str, object]:
+    _allow_client_caching(response, config)
     return build_object_envelope(
         api_version_path=config.api_version_path,
         schema_version=config.schema_version,
         request_id=request.state.request_id,
+        generated_at=request_timestamp(request),
         data=service.get_current_policy(),
     )
 
@@ -171,12 +139,15 @@ def metadata_current_policy(
 @router.get("/schema", response_model=SchemaCatalogResponseV1)
 def metadata_schema(
     request: Request,
+    response: Response,
     service: MetadataServiceDep,
     config: ConfigDep,
 ) -> dict[str, object]:
+    _allow_client_caching(response, config)
     return build_object_envelope(
         api_version_path=config.api_version_path,
         schema_version=config.schema_version,
         request_id=request.state.request_id,
+        generated_at=request_timestamp(request),
         data=service.get_schema_catalog(),
     )
@@ -8,19 +8,23 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from src.api.api_config import ApiConfig
-from src.api.dependencies import get_config, get_pricing_service
+from src.api.dependencies import (
+    ensure_time_window,
+    get_config,
+    get_pricing_service,
+    resolve_list_query,
+)
 from src.api.error_handlers import APIError
-from src.api.pagination import compute_total_pages, normalize_pagination, parse_sort
-from src.api.response_envelope import build_list_envelope, build_object_envelope
-from src.api.schemas.common import PaginationMetadata
+from src.api.response_envelope import build_conditional_object_response, build_list_response
+from src.api.responses import weak_etag
 from src.api.schemas.pricing_schemas import (
     PricingDecisionListResponseV1,
     PricingRunSummaryResponseV1,
 )
-from src.api.services.pricing_service import PRICING_SORT_FIELD_MAP, PricingService
+from src.api.services.pricing_service import PRICING_SORT_FIELDS, PricingService
 
 router = APIRouter(prefix="/pricing", tags=["pricing"])
 PricingServiceDep = Annotated[PricingService, Depends(get_pricing_service)]
@@ -42,26 +46,17 @@ def pricing_latest(
     page: int = Query(default=1, ge=1),
     page_size: int | None = Query(default=None, ge=1),
     sort: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
 ) -> dict[str, object]:
-    try:
-        pagination = normalize_pagination(
-            page=page,
-            page_size=page_size,
-            limit=limit,
-            default_page_size=config.default_page_size,
-            max_page_size=config.max_page_size,
-        )
-        sort_spec = parse_sort(
-            requested_sort=sort,
-            default_sort=config.default_sort_order,
-            allowed_fields=set(PRICING_SORT_FIELD_MAP),
-        )
-    except ValueError as exc:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_QUERY_PARAM",
-            message=str(exc),
-        ) from exc
+    pagination, sort_spec = resolve_list_query(
+        config=config,
+        page=page,
+        page_size=page_size,
+        limit=limit,
+        sort=sort,
+        default_sort=config.default_sort_order,
+        allowed_fields=PRICING_SORT_FIELDS,
+    )
 
     service_result = service.get_latest_pricing(
         zone_id=zone_id,
@@ -70,26 +65,15 @@ def pricing_latest(
         page_size=pagination.page_size,
         sort=sort_spec,
         include_plain_language_fields=config.include_plain_language_fields,
+        cursor=cursor,
     )
 
-    pagination_meta = PaginationMetadata(
-        page=pagination.page,
-        page_size=pagination.page_size,
-        total_count=int(service_result["total_count"]),
-        total_pages=compute_total_pages(
-            total_count=int(service_result["total_count"]),
-            page_size=pagination.page_size,
-        ),
-        sort=sort_spec.as_text,
-    )
-
-    return build_list_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
-        data=list(service_result["rows"]),
-        pagination=pagination_meta.model_dump(),
-        warnings=service_result.get("warnings"),
+    return build_list_response(
+        request=request,
+        config=config,
+        service_result=service_result,
+        pagination=pagination,
+        sort_spec=sort_spec,
     )
 
 
@@ -113,33 +97,19 @@ def pricing_window(
     page_size: int | None = Query(default=None, ge=1),
     limit: int | None = Query(default=None, ge=1),
     sort: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
 ) -> dict[str, object]:
-    if start_ts > end_ts:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_TIME_WINDOW",
-            message="start_ts must be less than or equal to end_ts.",
-        )
-
-    try:
-        pagination = normalize_pagination(
-            page=page,
-            page_size=page_size,
-            limit=limit,
-            default_page_size=config.default_page_size,
-            max_page_size=config.max_page_size,
-        )
-        sort_spec = parse_sort(
-            requested_sort=sort,
-            default_sort=config.default_sort_order,
-            allowed_fields=set(PRICING_SORT_FIELD_MAP),
-        )
-    except ValueError as exc:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_QUERY_PARAM",
-            message=str(exc),
-        ) from exc
+    ensure_time_window(start_ts=start_ts, end_ts=end_ts)
+
+    pagination, sort_spec = resolve_list_query(
+        config=config,
+        page=page,
+        page_size=page_size,
+        limit=limit,
+        sort=sort,
+        default_sort=config.default_sort_order,
+        allowed_fields=PRICING_SORT_FIELDS,
+    )
 
     service_result = service.get_pricing_window(
         start_ts=start_ts,
@@ -154,26 +124,15 @@ def pricing_window(
         page_size=pagination.page_size,
         sort=sort_spec,
         include_plain_language_fields=config.include_plain_language_fields,
+        cursor=cursor,
     )
 
-    pagination_meta = PaginationMetadata(
-        page=pagination.page,
-        page_size=pagination.page_size,
-        total_count=int(service_result["total_count"]),
-        total_pages=compute_total_pages(
-            total_count=int(service_result["total_count"]),
-            page_size=pagination.page_size,
-        ),
-        sort=sort_spec.as_text,
-    )
-
-    return build_list_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
-        data=list(service_result["rows"]),
-        pagination=pagination_meta.model_dump(),
-        warnings=service_result.get("warnings"),
+    return build_list_response(
+        request=request,
+        config=config,
+        service_result=service_result,
+        pagination=pagination,
+        sort_spec=sort_spec,
     )
 
 
@@ -193,33 +152,19 @@ def pricing_zone_timeline(
     page_size: int | None = Query(default=None, ge=1),
     limit: int | None = Query(default=None, ge=1),
     sort: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
 ) -> dict[str, object]:
-    if start_ts > end_ts:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_TIME_WINDOW",
-            message="start_ts must be less than or equal to end_ts.",
-        )
-
-    try:
-        pagination = normalize_pagination(
-            page=page,
-            page_size=page_size,
-            limit=limit,
-            default_page_size=config.default_page_size,
-            max_page_size=config.max_page_size,
-        )
-        sort_spec = parse_sort(
-            requested_sort=sort,
-            default_sort=config.default_sort_order,
-            allowed_fields=set(PRICING_SORT_FIELD_MAP),
-        )
-    except ValueError as exc:
-        raise APIError(
-            status_code=400,
-            error_code="INVALID_QUERY_PARAM",
-            message=str(exc),
-        ) from exc
+    ensure_time_window(start_ts=start_ts, end_ts=end_ts)
+
+    pagination, sort_spec = resolve_list_query(
+        config=config,
+        page=page,
+        page_size=page_size,
+        limit=limit,
+        sort=sort,
+        default_sort=config.default_sort_order,
+        allowed_fields=PRICING_SORT_FIELDS,
+    )
 
     service_result = service.get_zone_timeline(
         zone_id=zone_id,
@@ -229,35 +174,25 @@ def pricing_zone_timeline(
         page_size=pagination.page_size,
         sort=sort_spec,
         include_plain_language_fields=config.include_plain_language_fields,
+        cursor=cursor,
     )
 
-    pagination_meta = PaginationMetadata(
-        page=pagination.page,
-        page_size=pagination.page_size,
-        total_count=int(service_result["total_count"]),
-        total_pages=compute_total_pages(
-            total_count=int(service_result["total_count"]),
-            page_size=pagination.page_size,
-        ),
-        sort=sort_spec.as_text,
-    )
-
-    return build_list_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
-        data=list(service_result["rows"]),
-        pagination=pagination_meta.model_dump(),
-        warnings=service_result.get("warnings"),
+    return build_list_response(
+        request=request,
+        config=config,
+        service_result=service_result,
+        pagination=pagination,
+        sort_spec=sort_spec,
     )
 
 
 @router.get("/runs/latest", response_model=PricingRunSummaryResponseV1)
 def pricing_runs_latest(
     request: Request,
+    response: Response,
     service: PricingServiceDep,
     config: ConfigDep,
-) -> dict[str, object]:
+) -> dict[str, object] | Response:
     summary = service.get_latest_run_summary()
     if summary is None:
         raise APIError(
@@ -266,11 +201,13 @@ def pricing_runs_latest(
             message="No pricing run metadata found.",
         )
 
-    return build_object_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
+    return build_conditional_object_response(
+        request=request,
+        response=response,
+        config=config,
         data=summary,
+        etag=weak_etag(summary),
+        cache_control="no-cache",
     )
 
 
@@ -278,9 +215,10 @@ def pricing_runs_latest(
 def pricing_run_by_id(
     run_id: str,
     request: Request,
+    response: Response,
     service: PricingServiceDep,
     config: ConfigDep,
-) -> dict[str, object]:
+) -> dict[str, object] | Response:
     summary = service.get_run_summary(run_id=run_id)
     if summary is None:
         raise APIError(
@@ -289,9 +227,11 @@ def pricing_run_by_id(
             message=f"Pricing run_id not found: {run_id}",
         )
 
-    return build_object_envelope(
-        api_version_path=config.api_version_path,
-        schema_version=config.schema_version,
-        request_id=request.state.request_id,
+    return build_conditional_object_response(
+        request=request,
+        response=response,
+        config=config,
         data=summary,
+        etag=weak_etag(summary),
+        cache_control="no-cache",
     )
@@ -0,0 +1,114 @@
+# This file computes a cheap fingerprint of everything that shapes the OpenAPI document.
+# It exists so contract checks can reuse a stored snapshot instead of rebuilding the schema.
+# The hash covers app metadata, route options, parameter constraints, and response models.
+# Any input that can change `app.openapi()` output must be folded into the digest here.
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+from typing import Any
+
+import fastapi
+import pydantic
+from fastapi import FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+_ROUTE_ATTRIBUTES = (
+    "name",
+    "summary",
+    "description",
+    "response_description",
+    "status_code",
+    "responses",
+    "deprecated",
+    "operation_id",
+    "include_in_schema",
+    "callbacks",
+    "openapi_extra",
+    "tags",
+)
+
+
+def openapi_fingerprint(app: FastAPI, *, api_version_path: str, schema_version: str) -> str:
+    """Return a blake2b digest that changes whenever the OpenAPI output can change."""
+
+    digest = hashlib.blake2b(digest_size=32)
+    for part in _iter_fingerprint_parts(
+        app, api_version_path=api_version_path, schema_version=schema_version
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _iter_fingerprint_parts(
+    app: FastAPI, *, api_version_path: str, schema_version: str
+) -> Iterator[str]:
+    yield f"fastapi={fastapi.__version__};pydantic={pydantic.VERSION}"
+    yield f"{api_version_path};{schema_version}"
+    yield repr((app.title, app.version, app.description, app.summary, app.openapi_version))
+    yield repr((app.openapi_tags, app.servers, app.root_path))
+
+    seen: set[type[BaseModel]] = set()
+    routes = sorted(
+        (route for route in app.routes if isinstance(route, APIRoute)),
+        key=lambda route: (route.path, sorted(route.methods)),
+    )
+    for route in routes:
+        endpoint = route.endpoint
+        yield route.path
+        yield ",".join(sorted(route.methods))
+        yield f"{endpoint.__module__}.{endpoint.__qualname__}"
+        for attribute in _ROUTE_ATTRIBUTES:
+            yield f"{attribute}={getattr(route, attribute, None)!r}"
+        yield from _iter_dependant_parts(route.dependant, seen)
+        for candidate in _nested_models(route.response_model):
+            yield _model_signature(candidate, seen)
+
+
+def _iter_dependant_parts(dependant: Dependant, seen: set[type[BaseModel]]) -> Iterator[str]:
+    # FieldInfo reprs carry defaults, aliases, descriptions, and constraint metadata such as
+    # `ge`/`le`, which `inspect.signature` hides behind `Query(default)`.
+    for group_name in (
+        "path_params",
+        "query_params",
+        "header_params",
+        "cookie_params",
+        "body_params",
+    ):
+        for field in getattr(dependant, group_name):
+            yield f"{group_name}:{field.name}:{field.alias}:{field.field_info!r}"
+            for candidate in _nested_models(field.field_info.annotation):
+                yield _model_signature(candidate, seen)
+    for sub_dependant in dependant.dependencies:
+        yield from _iter_dependant_parts(sub_dependant, seen)
+
+
+def _model_signature(model: type[BaseModel], seen: set[type[BaseModel]]) -> str:
+    # Nested models are walked so inner field changes move the hash without paying for
+    # a JSON schema build per model.
+    if model in seen:
+        return model.__qualname__
+    seen.add(model)
+    parts = [
+        f"{model.__module__}.{model.__qualname__}",
+        repr(model.__doc__),
+        repr(sorted(model.model_config.items(), key=lambda item: item[0])),
+    ]
+    for name, field in model.model_fields.items():
+        parts.append(f"{name}={field!r}")
+        for candidate in _nested_models(field.annotation):
+            parts.append(_model_signature(candidate, seen))
+    return "|".join(parts)
+
+
+def _nested_models(annotation: Any) -> list[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    nested: list[type[BaseModel]] = []
+    for arg in getattr(annotation, "__args__", ()) or ():
+        nested.extend(_nested_models(arg))
+    return nested
@@ -1,30 +1,51 @@
 # This file defines helpers for API path versioning and schema version metadata.
 # It exists so every response can carry explicit version fields for consumers.
-# The module also provides a basic breaking-change detector used by contract checks.
+# The module also provides a breaking-change detector used by contract checks.
 # Keeping these rules centralized makes compatibility decisions easier to enforce.
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 
+@lru_cache(maxsize=8)
 def api_version_label(api_version_path: str) -> str:
     """Convert `/api/v1` style paths into `v1` labels."""
 
-    cleaned = api_version_path.rstrip("/")
-    parts = [part for part in cleaned.split("/") if part]
-    if not parts:
+    label = api_version_path.rstrip("/").rpartition("/")[2]
+    if not label:
         raise ValueError(f"Invalid api_version_path: {api_version_path!r}")
-    return parts[-1]
+    return label
 
 
-def build_version_fields(*, api_version_path: str, schema_version: str) -> dict[str, str]:
-    """Return a normalized version metadata block."""
+@lru_cache(maxsize=8)
+def build_version_fields(*, api_version_path: str, schema_version: str) -> Mapping[str, str]:
+    """Return a normalized, read-only version metadata block shared across responses."""
 
-    return {
-        "api_version": api_version_label(api_version_path),
-        "schema_version": schema_version,
-    }
+    return MappingProxyType(
+        {
+            "api_version": api_version_label(api_version_path),
+            "schema_version": schema_version,
+        }
+    )
+
+
+_SCHEMA_REF_PREFIX = "#/components/schemas/"
+
+
+class DeferredSchemaDiff:
+    """Placeholder for one `(previous, current)` schema pair diffed at most once."""
+
+    __slots__ = ("previous_name", "current_name", "result")
+
+    def __init__(self, previous_name: str, current_name: str) -> None:
+        self.previous_name = previous_name
+        self.current_name = current_name
+        self.result: list[str] | None = None
 
 
 def detect_breaking_schema_changes(
@@ -34,32 +55,114 @@ def detect_breaking_schema_changes(
 ) -> list[str]:
     """Detect likely breaking changes by checking removed paths and fields."""
 
+    # Contract checks often compare a snapshot with itself or an unchanged regeneration;
+    # dict equality runs in C and bails at the first difference.
+    if previous_snapshot is current_snapshot or previous_snapshot == current_snapshot:
+        return []
+
     findings: list[str] = []
 
-    previous_paths = set(previous_snapshot.get("paths", {}).keys())
-    current_paths = set(current_snapshot.get("paths", {}).keys())
-    removed_paths = sorted(previous_paths - current_paths)
-    for path in removed_paths:
+    # Key views diff in C without copying either side into a set first.
+    previous_paths = previous_snapshot.get("paths", {}).keys()
+    current_paths = current_snapshot.get("paths", {}).keys()
+    for path in sorted(previous_paths - current_paths):
         findings.append(f"Removed API path: {path}")
 
     previous_schemas = previous_snapshot.get("components", {}).get("schemas", {})
     current_schemas = current_snapshot.get("components", {}).get("schemas", {})
 
-    for schema_name, previous_schema in previous_schemas.items():
+    # Phase one registers schema pairs (including `$ref` targets that were renamed) and
+    # phase two drains the queue, so shared or cyclic references are compared once.
+    cache: dict[tuple[str, str], DeferredSchemaDiff] = {}
+    queue: deque[DeferredSchemaDiff] = deque()
+
+    def register(previous_name: str, current_name: str) -> DeferredSchemaDiff:
+        key = (previous_name, current_name)
+        deferred = cache.get(key)
+        if deferred is None:
+            deferred = DeferredSchemaDiff(previous_name, current_name)
+            cache[key] = deferred
+            queue.append(deferred)
+        return deferred
+
+    ordered: list[str | DeferredSchemaDiff] = []
+    for schema_name in previous_schemas:
         if schema_name not in current_schemas:
-            findings.append(f"Removed schema component: {schema_name}")
+            ordered.append(f"Removed schema component: {schema_name}")
             continue
+        ordered.append(register(schema_name, schema_name))
+    seeded = len(cache)
+
+    while queue:
+        deferred = queue.popleft()
+        deferred.result = _diff_schema_pair(
+            deferred,
+            previous_schemas=previous_schemas,
+            current_schemas=current_schemas,
+            register=register,
+        )
+
+    for item in ordered:
+        findings.extend([item] if isinstance(item, str) else item.result or [])
+    for deferred in list(cache.values())[seeded:]:
+        findings.extend(deferred.result or [])
 
-        previous_required = set(previous_schema.get("required", []))
-        current_required = set(current_schemas[schema_name].get("required", []))
-        for removed_required in sorted(previous_required - current_required):
-            findings.append(
-                f"Schema {schema_name} removed required field: {removed_required}"
-            )
+    return findings
 
-        previous_properties = previous_schema.get("properties", {})
-        current_properties = current_schemas[schema_name].get("properties", {})
-        for removed_prop in sorted(set(previous_properties) - set(current_properties)):
-            findings.append(f"Schema {schema_name} removed property: {removed_prop}")
 
-    return findings
+def _diff_schema_pair(
+    deferred: DeferredSchemaDiff,
+    *,
+    previous_schemas: dict[str, Any],
+    current_schemas: dict[str, Any],
+    register: Callable[[str, str], DeferredSchemaDiff],
+) -> list[str]:
+    previous_schema = previous_schemas[deferred.previous_name]
+    current_schema = current_schemas[deferred.current_name]
+    if previous_schema == current_schema:
+        # Identical bodies remove nothing and reference the same names, which are already
+        # registered as same-name pairs.
+        return []
+    label = deferred.previous_name
+    if deferred.current_name != deferred.previous_name:
+        label = f"{deferred.previous_name} (now {deferred.current_name})"
+
+    results: list[str] = []
+    removed_required = set(previous_schema.get("required", ())).difference(
+        current_schema.get("required", ())
+    )
+    for required_name in sorted(removed_required):
+        results.append(f"Schema {label} removed required field: {required_name}")
+
+    previous_properties = previous_schema.get("properties", {})
+    current_properties = current_schema.get("properties", {})
+    for removed_prop in sorted(previous_properties.keys() - current_properties.keys()):
+        results.append(f"Schema {label} removed property: {removed_prop}")
+
+    for prop_name, previous_prop in previous_properties.items():
+        if prop_name not in current_properties:
+            continue
+        previous_refs = _schema_refs(previous_prop)
+        current_refs = _schema_refs(current_properties[prop_name])
+        if len(previous_refs) != 1 or len(current_refs) != 1:
+            continue
+        previous_ref, current_ref = previous_refs[0], current_refs[0]
+        if previous_ref in previous_schemas and current_ref in current_schemas:
+            register(previous_ref, current_ref)
+
+    return results
+
+
+def _schema_refs(node: Any) -> list[str]:
+    refs: list[str] = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            ref = item.get("$ref")
+            if isinstance(ref, str) and ref.startswith(_SCHEMA_REF_PREFIX):
+                refs.append(ref[len(_SCHEMA_REF_PREFIX) :])
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return refs
@@ -17,6 +17,7 @@ class PaginationMetadata(BaseModel):
     total_count: int = Field(ge=0)
     total_pages: int = Field(ge=0)
     sort: str
+    next_cursor: str | None = None
 
 
 class EnvelopeFields(BaseModel):
@@ -27,6 +28,12 @@ class EnvelopeFields(BaseModel):
     warnings: list[str] | None = None
 
 
+class ListEnvelopeFields(EnvelopeFields):
+    # Subclasses declare `data` after these fields, so envelope metadata is serialized
+    # ahead of the row array and streaming clients can read it without buffering rows.
+    pagination: PaginationMetadata
+
+
 class ErrorResponse(BaseModel):
     error_code: str
     message: str
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
-from src.api.schemas.common import EnvelopeFields, PaginationMetadata
+from src.api.schemas.common import EnvelopeFields, ListEnvelopeFields
 
 
 class ForecastRowV1(BaseModel):
@@ -40,9 +40,8 @@ class ForecastRowV1(BaseModel):
     forecast_range_summary: str | None = None
 
 
-class ForecastListResponseV1(EnvelopeFields):
+class ForecastListResponseV1(ListEnvelopeFields):
     data: list[ForecastRowV1]
-    pagination: PaginationMetadata
 
 
 class ForecastRunSummaryV1(BaseModel):
@@ -10,7 +10,7 @@ from typing import Any
 
 from pydantic import BaseModel
 
-from src.api.schemas.common import EnvelopeFields, PaginationMetadata
+from src.api.schemas.common import EnvelopeFields, ListEnvelopeFields
 
 
 class ZoneMetadataRowV1(BaseModel):
@@ -20,9 +20,8 @@ class ZoneMetadataRowV1(BaseModel):
     service_zone: str | None = None
 
 
-class ZoneMetadataListResponseV1(EnvelopeFields):
+class ZoneMetadataListResponseV1(ListEnvelopeFields):
     data: list[ZoneMetadataRowV1]
-    pagination: PaginationMetadata
 
 
 class ReasonCodeRowV1(BaseModel):
@@ -32,9 +31,8 @@ class ReasonCodeRowV1(BaseModel):
     active_flag: bool
 
 
-class ReasonCodeListResponseV1(EnvelopeFields):
+class ReasonCodeListResponseV1(ListEnvelopeFields):
     data: list[ReasonCodeRowV1]
-    pagination: PaginationMetadata
 
 
 class PolicySummaryV1(BaseModel):
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
-from src.api.schemas.common import EnvelopeFields, PaginationMetadata
+from src.api.schemas.common import EnvelopeFields, ListEnvelopeFields
 
 
 class PricingDecisionRowV1(BaseModel):
@@ -51,9 +51,8 @@ class PricingDecisionRowV1(BaseModel):
     confidence_note: str | None = None
 
 
-class PricingDecisionListResponseV1(EnvelopeFields):
+class PricingDecisionListResponseV1(ListEnvelopeFields):
     data: list[PricingDecisionRowV1]
-    pagination: PaginationMetadata
 
 
 class PricingRunSummaryV1(BaseModel):
@@ -5,10 +5,32 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from src.api.api_config import ApiConfig
 from src.api.db_access import DatabaseClient
+from src.api.responses import weak_etag
+from src.api.services.ttl_cache import TTLCache
+
+_PRICING_AGGREGATE_FIELDS = (
+    "total_rows",
+    "zone_count",
+    "cap_applied_rows",
+    "rate_limited_rows",
+    "smoothing_applied_rows",
+)
+
+
+@dataclass(frozen=True)
+class CachedSummary:
+    """Diagnostics summary with its weak ETag and monotonic expiry."""
+
+    data: dict[str, Any]
+    etag: str
+    expires_at: float
 
 
 class DiagnosticsService:
@@ -25,30 +47,41 @@ class DiagnosticsService:
         self.forecast_run_log_table = self.config.validate_table_name(
             self.config.forecast_run_log_table_name
         )
+        self._summary_cache: dict[str, CachedSummary] = {}
+        # Coverage, guardrail, and confidence summaries all start from the same run ids.
+        self._run_id_cache = TTLCache(ttl_seconds=self.config.latest_run_cache_ttl_seconds)
+        self._run_aggregate_cache = TTLCache(
+            ttl_seconds=self.config.diagnostics_cache_ttl_seconds, max_entries=8
+        )
+
+    def cached_summary(self, name: str, build: Callable[[], dict[str, Any]]) -> CachedSummary:
+        """Return the summary built by `build`, reusing it until the configured TTL lapses."""
+
+        # Summaries only move when a scheduled run lands, so callers between runs share one
+        # result. Concurrent misses may both rebuild; the last write wins.
+        now = time.monotonic()
+        cached = self._summary_cache.get(name)
+        if cached is not None and cached.expires_at > now:
+            return cached
+        data = build()
+        cached = CachedSummary(
+            data=data,
+            etag=weak_etag(data),
+            expires_at=now + self.config.diagnostics_cache_ttl_seconds,
+        )
+        self._summary_cache[name] = cached
+        return cached
 
     def get_latest_coverage_summary(self) -> dict[str, Any]:
         pricing_run_id = self._latest_pricing_run_id()
         forecast_run_id = self._latest_forecast_run_id()
 
-        pricing_counts = {
-            "pricing_zone_count": 0,
-            "pricing_row_count": 0,
-        }
+        pricing_counts = self._pricing_run_aggregates(pricing_run_id)
         forecast_counts = {
             "forecast_zone_count": 0,
             "forecast_row_count": 0,
         }
 
-        if pricing_run_id is not None:
-            pricing_query = f"""
-            SELECT
-                COUNT(DISTINCT zone_id) AS pricing_zone_count,
-                COUNT(*) AS pricing_row_count
-            FROM {self.pricing_table}
-            WHERE run_id = :run_id
-            """
-            pricing_counts = self.db.fetch_one(pricing_query, {"run_id": pricing_run_id}) or pricing_counts
-
         if forecast_run_id is not None:
             forecast_query = f"""
             SELECT
@@ -62,9 +95,9 @@ class DiagnosticsService:
         return {
             "pricing_run_id": pricing_run_id,
             "forecast_run_id": forecast_run_id,
-            "pricing_zone_count": int(pricing_counts.get("pricing_zone_count", 0)),
+            "pricing_zone_count": pricing_counts["zone_count"],
             "forecast_zone_count": int(forecast_counts.get("forecast_zone_count", 0)),
-            "pricing_row_count": int(pricing_counts.get("pricing_row_count", 0)),
+            "pricing_row_count": pricing_counts["total_rows"],
             "forecast_row_count": int(forecast_counts.get("forecast_row_count", 0)),
         }
 
@@ -81,20 +114,11 @@ class DiagnosticsService:
                 "rate_limited_rate": 0.0,
             }
 
-        query = f"""
-        SELECT
-            COUNT(*) AS total_rows,
-            SUM(CASE WHEN cap_applied THEN 1 ELSE 0 END) AS cap_applied_rows,
-            SUM(CASE WHEN rate_limit_applied THEN 1 ELSE 0 END) AS rate_limited_rows,
-            SUM(CASE WHEN smoothing_applied THEN 1 ELSE 0 END) AS smoothing_applied_rows
-        FROM {self.pricing_table}
-        WHERE run_id = :run_id
-        """
-        row = self.db.fetch_one(query, {"run_id": pricing_run_id}) or {}
-        total_rows = int(row.get("total_rows", 0) or 0)
-        cap_applied_rows = int(row.get("cap_applied_rows", 0) or 0)
-        rate_limited_rows = int(row.get("rate_limited_rows", 0) or 0)
-        smoothing_applied_rows = int(row.get("smoothing_applied_rows", 0) or 0)
+        row = self._pricing_run_aggregates(pricing_run_id)
+        total_rows = row["total_rows"]
+        cap_applied_rows = row["cap_applied_rows"]
+        rate_limited_rows = row["rate_limited_rows"]
+        smoothing_applied_rows = row["smoothing_applied_rows"]
 
         cap_rate = (cap_applied_rows / total_rows) if total_rows else 0.0
         rate_limit_rate = (rate_limited_rows / total_rows) if total_rows else 0.0
@@ -141,43 +165,73 @@ class DiagnosticsService:
             "bands": bands,
         }
 
-    def _latest_pricing_run_id(self) -> str | None:
-        query = f"""
-        SELECT run_id
-        FROM {self.pricing_run_log_table}
-        WHERE LOWER(status) = 'success'
-        ORDER BY started_at DESC
-        LIMIT 1
-        """
-        row = self.db.fetch_one(query)
-        if row and row.get("run_id"):
-            return str(row["run_id"])
+    def _pricing_run_aggregates(self, run_id: str | None) -> dict[str, int]:
+        # Coverage and guardrail summaries read the same run rows, so one aggregate pass
+        # serves both and is reused while the run id stays current.
+        if run_id is None:
+            return dict.fromkeys(_PRICING_AGGREGATE_FIELDS, 0)
+        return self._run_aggregate_cache.get_or_build(
+            ("pricing", run_id), lambda: self._query_pricing_run_aggregates(run_id)
+        )
 
-        fallback_query = f"""
-        SELECT run_id
+    def _query_pricing_run_aggregates(self, run_id: str) -> dict[str, int]:
+        query = f"""
+        SELECT
+            COUNT(*) AS total_rows,
+            COUNT(DISTINCT zone_id) AS zone_count,
+            COUNT(*) FILTER (WHERE cap_applied) AS cap_applied_rows,
+            COUNT(*) FILTER (WHERE rate_limit_applied) AS rate_limited_rows,
+            COUNT(*) FILTER (WHERE smoothing_applied) AS smoothing_applied_rows
         FROM {self.pricing_table}
-        ORDER BY pricing_created_at DESC
-        LIMIT 1
+        WHERE run_id = :run_id
         """
-        fallback_row = self.db.fetch_one(fallback_query)
-        return str(fallback_row["run_id"]) if fallback_row and fallback_row.get("run_id") else None
+        row = self.db.fetch_one(query, {"run_id": run_id}) or {}
+        return {field: int(row.get(field, 0) or 0) for field in _PRICING_AGGREGATE_FIELDS}
+
+    def _latest_pricing_run_id(self) -> str | None:
+        return self._latest_run_ids()["pricing"]
 
     def _latest_forecast_run_id(self) -> str | None:
+        return self._latest_run_ids()["forecast"]
+
+    def _latest_run_ids(self) -> dict[str, str | None]:
+        return self._run_id_cache.get_or_build("latest", self._query_latest_run_ids)
+
+    def _query_latest_run_ids(self) -> dict[str, str | None]:
+        # Both run logs are read in one round trip; each branch is an index-ordered LIMIT 1.
         query = f"""
-        SELECT run_id
-        FROM {self.forecast_run_log_table}
-        WHERE LOWER(status) = 'success'
-        ORDER BY started_at DESC
-        LIMIT 1
+        (
+            SELECT 'pricing' AS kind, run_id
+            FROM {self.pricing_run_log_table}
+            WHERE LOWER(status) = 'success'
+            ORDER BY started_at DESC
+            LIMIT 1
+        )
+        UNION ALL
+        (
+            SELECT 'forecast' AS kind, run_id
+            FROM {self.forecast_run_log_table}
+            WHERE LOWER(status) = 'success'
+            ORDER BY started_at DESC
+            LIMIT 1
+        )
         """
-        row = self.db.fetch_one(query)
-        if row and row.get("run_id"):
-            return str(row["run_id"])
-
+        run_ids: dict[str, str | None] = {"pricing": None, "forecast": None}
+        for row in self.db.fetch_all(query):
+            if row.get("run_id"):
+                run_ids[str(row["kind"])] = str(row["run_id"])
+
+        if run_ids["pricing"] is None:
+            run_ids["pricing"] = self._fallback_run_id(self.pricing_table, "pricing_created_at")
+        if run_ids["forecast"] is None:
+            run_ids["forecast"] = self._fallback_run_id(self.forecast_table, "forecast_created_at")
+        return run_ids
+
+    def _fallback_run_id(self, table: str, created_at_column: str) -> str | None:
         fallback_query = f"""
         SELECT run_id
-        FROM {self.forecast_table}
-        ORDER BY forecast_created_at DESC
+        FROM {table}
+        ORDER BY {created_at_column} DESC
         LIMIT 1
         """
         fallback_row = self.db.fetch_one(fallback_query)
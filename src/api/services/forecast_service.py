@@ -5,14 +5,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 from src.api.api_config import ApiConfig
 from src.api.db_access import DatabaseClient
 from src.api.error_handlers import APIError
-from src.api.pagination import SortSpec
-from src.api.plain_language import forecast_plain_fields
+from src.api.pagination import (
+    SortSpec,
+    keyset_after_clause,
+    keyset_page_params,
+    split_keyset_page,
+)
+from src.api.plain_language import forecast_plain_fields_batch
+from src.api.services.results import ServiceListResult
+from src.api.services.ttl_cache import TTLCache
 
 FORECAST_SORT_FIELD_MAP: dict[str, str] = {
     "zone_id": "f.zone_id",
@@ -21,6 +29,28 @@ FORECAST_SORT_FIELD_MAP: dict[str, str] = {
     "confidence_score": "f.confidence_score",
     "borough": "z.borough",
 }
+FORECAST_SORT_FIELDS: frozenset[str] = frozenset(FORECAST_SORT_FIELD_MAP)
+
+# Sort fields backed by NOT NULL forecast columns, mapped to the parser for their cursor value.
+# Together with the (zone_id, bucket_start_ts) tie-breaker these give a total row order, so
+# the next page can be selected by comparison instead of OFFSET.
+FORECAST_CURSOR_VALUE_PARSERS: dict[str, Callable[[Any], Any]] = {
+    "zone_id": int,
+    "bucket_start_ts": datetime.fromisoformat,
+    "y_pred": float,
+    "confidence_score": float,
+}
+
+# Plain-language columns blanked when the feature is disabled; `exclude_none` drops them.
+_HIDDEN_PLAIN_FIELDS: dict[str, None] = {
+    "zone_name": None,
+    "demand_outlook_label": None,
+    "confidence_note": None,
+    "forecast_range_summary": None,
+}
+
+# (has_start, has_end, has_zone, has_borough, sort_field, sort_order, after_cursor, check_zone)
+_WindowShape = tuple[bool, bool, bool, bool, str, str, bool, bool]
 
 
 class ForecastService:
@@ -34,6 +64,10 @@ class ForecastService:
         self.forecast_run_log_table = self.config.validate_table_name(
             self.config.forecast_run_log_table_name
         )
+        # Every "latest" request resolves the newest successful run first; runs land minutes
+        # apart, so the id is shared across requests for a few seconds.
+        self._run_id_cache = TTLCache(ttl_seconds=self.config.latest_run_cache_ttl_seconds)
+        self._window_query_cache: dict[_WindowShape, tuple[str, str]] = {}
 
     def get_latest_forecast(
         self,
@@ -44,7 +78,8 @@ class ForecastService:
         page_size: int,
         sort: SortSpec,
         include_plain_language_fields: bool,
-    ) -> dict[str, Any]:
+        cursor: str | None = None,
+    ) -> ServiceListResult:
         latest_run_id = self._latest_run_id()
         if latest_run_id is None:
             return {"rows": [], "total_count": 0, "warnings": ["No forecast run found."]}
@@ -59,6 +94,7 @@ class ForecastService:
             page_size=page_size,
             sort=sort,
             include_plain_language_fields=include_plain_language_fields,
+            cursor=cursor,
         )
 
     def get_forecast_window(
@@ -73,85 +109,79 @@ class ForecastService:
         page_size: int,
         sort: SortSpec,
         include_plain_language_fields: bool,
-    ) -> dict[str, Any]:
+        cursor: str | None = None,
+        require_known_zone: bool = False,
+    ) -> ServiceListResult:
+        check_zone = require_known_zone and zone_id is not None
         effective_run_id = run_id or self._latest_run_id()
         if effective_run_id is None:
+            if check_zone and zone_id is not None and not self.zone_exists(zone_id):
+                raise self._zone_not_found(zone_id)
             return {"rows": [], "total_count": 0, "warnings": ["No forecast run found."]}
 
-        where_clauses: list[str] = ["f.run_id = :run_id"]
         params: dict[str, Any] = {"run_id": effective_run_id}
-
         if start_ts is not None:
-            where_clauses.append("f.bucket_start_ts >= :start_ts")
             params["start_ts"] = start_ts
         if end_ts is not None:
-            where_clauses.append("f.bucket_start_ts <= :end_ts")
             params["end_ts"] = end_ts
         if zone_id is not None:
-            where_clauses.append("f.zone_id = :zone_id")
             params["zone_id"] = zone_id
         if borough is not None:
-            where_clauses.append("LOWER(z.borough) = LOWER(:borough)")
             params["borough"] = borough
 
-        where_sql = " AND ".join(where_clauses)
-        order_sql = self._order_by_clause(sort)
+        try:
+            page_params = params | keyset_page_params(
+                cursor=cursor,
+                sort=sort,
+                page=page,
+                page_size=page_size,
+                value_parsers=FORECAST_CURSOR_VALUE_PARSERS,
+            )
+        except ValueError as exc:
+            raise APIError(
+                status_code=400,
+                error_code="INVALID_QUERY_PARAM",
+                message=str(exc),
+            ) from exc
 
-        count_query = f"""
-        SELECT COUNT(*) AS total_count
-        FROM {self.forecast_table} f
-        LEFT JOIN {self.zone_table} z ON z.location_id = f.zone_id
-        WHERE {where_sql}
-        """
+        count_query, data_query = self._window_queries(
+            (
+                start_ts is not None,
+                end_ts is not None,
+                zone_id is not None,
+                borough is not None,
+                sort.field,
+                sort.order,
+                cursor is not None,
+                check_zone,
+            )
+        )
         total_count_row = self.db.fetch_one(count_query, params) or {"total_count": 0}
+        if check_zone and zone_id is not None and not total_count_row.get("zone_known"):
+            raise self._zone_not_found(zone_id)
         total_count = int(total_count_row["total_count"])
 
-        data_query = f"""
-        SELECT
-            f.zone_id,
-            f.bucket_start_ts,
-            f.forecast_run_key,
-            f.run_id,
-            f.horizon_index,
-            z.zone AS zone_name,
-            z.borough,
-            z.service_zone,
-            f.y_pred,
-            f.y_pred_lower,
-            f.y_pred_upper,
-            f.confidence_score,
-            f.uncertainty_band,
-            f.used_recursive_features,
-            f.model_name,
-            f.model_version,
-            f.model_stage,
-            f.feature_version
-        FROM {self.forecast_table} f
-        LEFT JOIN {self.zone_table} z ON z.location_id = f.zone_id
-        WHERE {where_sql}
-        ORDER BY {order_sql}, f.zone_id ASC, f.bucket_start_ts ASC
-        LIMIT :limit OFFSET :offset
-        """
-
-        page_params = dict(params)
-        page_params["limit"] = page_size
-        page_params["offset"] = (page - 1) * page_size
-
-        raw_rows = self.db.fetch_all(data_query, page_params)
+        rows = self.db.fetch_all(data_query, page_params)
+        rows, next_cursor = split_keyset_page(
+            rows, sort=sort, page_size=page_size, value_parsers=FORECAST_CURSOR_VALUE_PARSERS
+        )
 
-        rows: list[dict[str, Any]] = []
-        for row in raw_rows:
-            shaped = dict(row)
-            if include_plain_language_fields:
-                shaped.update(forecast_plain_fields(shaped))
-            else:
-                shaped["zone_name"] = None
-                shaped["demand_outlook_label"] = None
-                shaped["confidence_note"] = None
-                shaped["forecast_range_summary"] = None
-            rows.append(shaped)
+        # `fetch_all` hands back fresh dicts, so rows are completed in place rather than
+        # copied once more per row.
+        if include_plain_language_fields:
+            plain_rows = forecast_plain_fields_batch(rows)
+            for row, plain_fields in zip(rows, plain_rows, strict=True):
+                row.update(plain_fields)
+        else:
+            for row in rows:
+                row.update(_HIDDEN_PLAIN_FIELDS)
 
-        return {"rows": rows, "total_count": total_count, "warnings": None}
+        return {
+            "rows": rows,
+            "total_count": total_count,
+            "warnings": None,
+            "next_cursor": next_cursor,
+        }
 
     def get_zone_timeline(
         self,
@@ -163,14 +193,10 @@ class ForecastService:
         page_size: int,
         sort: SortSpec,
         include_plain_language_fields: bool,
-    ) -> dict[str, Any]:
-        if not self.zone_exists(zone_id):
-            raise APIError(
-                status_code=404,
-                error_code="ZONE_NOT_FOUND",
-                message=f"Unknown zone_id: {zone_id}",
-            )
-
+        cursor: str | None = None,
+    ) -> ServiceListResult:
+        # The zone lookup rides along with the window count instead of costing its own
+        # round trip before it.
         return self.get_forecast_window(
             start_ts=start_ts,
             end_ts=end_ts,
@@ -181,6 +207,8 @@ class ForecastService:
             page_size=page_size,
             sort=sort,
             include_plain_language_fields=include_plain_language_fields,
+            cursor=cursor,
+            require_known_zone=True,
         )
 
     def get_latest_run_summary(self) -> dict[str, Any] | None:
@@ -239,7 +267,18 @@ class ForecastService:
         query = f"SELECT 1 FROM {self.zone_table} WHERE location_id = :zone_id LIMIT 1"
         return self.db.fetch_one(query, {"zone_id": zone_id}) is not None
 
+    @staticmethod
+    def _zone_not_found(zone_id: int) -> APIError:
+        return APIError(
+            status_code=404,
+            error_code="ZONE_NOT_FOUND",
+            message=f"Unknown zone_id: {zone_id}",
+        )
+
     def _latest_run_id(self) -> str | None:
+        return self._run_id_cache.get_or_build("forecast", self._query_latest_run_id)
+
+    def _query_latest_run_id(self) -> str | None:
         by_log_query = f"""
         SELECT run_id
         FROM {self.forecast_run_log_table}
@@ -262,6 +301,90 @@ class ForecastService:
             return str(fallback["run_id"])
         return None
 
+    def _window_queries(self, shape: _WindowShape) -> tuple[str, str]:
+        # Only filter presence, sort, and cursor use change the SQL text; values are bound
+        # parameters. The shape space is small, so each rendered pair is kept for reuse.
+        queries = self._window_query_cache.get(shape)
+        if queries is None:
+            queries = self._render_window_queries(*shape)
+            self._window_query_cache[shape] = queries
+        return queries
+
+    def _render_window_queries(
+        self,
+        has_start: bool,
+        has_end: bool,
+        has_zone: bool,
+        has_borough: bool,
+        sort_field: str,
+        sort_order: str,
+        after_cursor: bool,
+        check_zone: bool,
+    ) -> tuple[str, str]:
+        where_clauses: list[str] = ["f.run_id = :run_id"]
+        if has_start:
+            where_clauses.append("f.bucket_start_ts >= :start_ts")
+        if has_end:
+            where_clauses.append("f.bucket_start_ts <= :end_ts")
+        if has_zone:
+            where_clauses.append("f.zone_id = :zone_id")
+        if has_borough:
+            where_clauses.append("LOWER(z.borough) = LOWER(:borough)")
+
+        sort = SortSpec(field=sort_field, order=sort_order)
+        where_sql = " AND ".join(where_clauses)
+        order_sql = self._order_by_clause(sort)
+        page_where_sql = where_sql
+        if after_cursor:
+            after_cursor_sql = keyset_after_clause(
+                sort_expr=FORECAST_SORT_FIELD_MAP[sort_field],
+                sort_order=sort_order,
+                table_alias="f",
+            )
+            page_where_sql = f"{where_sql} AND {after_cursor_sql}"
+
+        zone_known_sql = ""
+        if check_zone:
+            zone_known_sql = (
+                f",\n            EXISTS (SELECT 1 FROM {self.zone_table} "
+                "WHERE location_id = :zone_id) AS zone_known"
+            )
+
+        count_query = f"""
+        SELECT COUNT(*) AS total_count{zone_known_sql}
+        FROM {self.forecast_table} f
+        LEFT JOIN {self.zone_table} z ON z.location_id = f.zone_id
+        WHERE {where_sql}
+        """
+
+        data_query = f"""
+        SELECT
+            f.zone_id,
+            f.bucket_start_ts,
+            f.forecast_run_key,
+            f.run_id,
+            f.horizon_index,
+            z.zone AS zone_name,
+            z.borough,
+            z.service_zone,
+            f.y_pred,
+            f.y_pred_lower,
+            f.y_pred_upper,
+            f.confidence_score,
+            f.uncertainty_band,
+            f.used_recursive_features,
+            f.model_name,
+            f.model_version,
+            f.model_stage,
+            f.feature_version
+        FROM {self.forecast_table} f
+        LEFT JOIN {self.zone_table} z ON z.location_id = f.zone_id
+        WHERE {page_where_sql}
+        ORDER BY {order_sql}, f.zone_id ASC, f.bucket_start_ts ASC
+        LIMIT :limit OFFSET :offset
+        """
+        return count_query, data_query
+
     @staticmethod
     def _order_by_clause(sort: SortSpec) -> str:
         sql_expr = FORECAST_SORT_FIELD_MAP[sort.field]
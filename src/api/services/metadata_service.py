@@ -10,18 +10,39 @@ from typing import Any
 from src.api.api_config import ApiConfig
 from src.api.db_access import DatabaseClient
 from src.api.pagination import SortSpec
+from src.api.services.results import ServiceListResult
+from src.api.services.ttl_cache import TTLCache
 
 ZONE_SORT_FIELD_MAP: dict[str, str] = {
     "zone_id": "z.location_id",
     "zone_name": "z.zone",
     "borough": "z.borough",
 }
+ZONE_SORT_FIELDS: frozenset[str] = frozenset(ZONE_SORT_FIELD_MAP)
 
 REASON_SORT_FIELD_MAP: dict[str, str] = {
     "reason_code": "r.reason_code",
     "category": "r.category",
     "active_flag": "r.active_flag",
 }
+REASON_SORT_FIELDS: frozenset[str] = frozenset(REASON_SORT_FIELD_MAP)
+
+# Filter values come straight from query strings, so the cache is bounded by entry count.
+METADATA_CACHE_MAX_ENTRIES = 256
+
+SCHEMA_COMPATIBILITY_POLICY: dict[str, list[str]] = {
+    "non_breaking_changes": [
+        "adding optional fields",
+        "adding new endpoints",
+        "adding reason codes",
+    ],
+    "breaking_changes": [
+        "renaming fields",
+        "removing fields",
+        "changing field types",
+        "changing nesting shape",
+    ],
+}
 
 
 class MetadataService:
@@ -33,6 +54,14 @@ class MetadataService:
         self.zone_table = self.config.validate_table_name(self.config.zone_table_name)
         self.reason_code_table = self.config.validate_table_name(self.config.reason_code_table_name)
         self.policy_table = self.config.validate_table_name(self.config.pricing_policy_snapshot_table_name)
+        # Reference data changes on the order of days. Cached rows are shared across
+        # requests and must not be mutated by callers.
+        self._cache = TTLCache(
+            ttl_seconds=self.config.metadata_cache_ttl_seconds,
+            max_entries=METADATA_CACHE_MAX_ENTRIES,
+        )
+        # The catalog depends only on config, so it is built once and shared read-only.
+        self._schema_catalog = self._build_schema_catalog()
 
     def get_zones(
         self,
@@ -42,7 +71,27 @@ class MetadataService:
         page: int,
         page_size: int,
         sort: SortSpec,
-    ) -> dict[str, Any]:
+    ) -> ServiceListResult:
+        return self._cache.get_or_build(
+            ("zones", borough, service_zone, page, page_size, sort),
+            lambda: self._fetch_zones(
+                borough=borough,
+                service_zone=service_zone,
+                page=page,
+                page_size=page_size,
+                sort=sort,
+            ),
+        )
+
+    def _fetch_zones(
+        self,
+        *,
+        borough: str | None,
+        service_zone: str | None,
+        page: int,
+        page_size: int,
+        sort: SortSpec,
+    ) -> ServiceListResult:
         where_clauses: list[str] = ["1 = 1"]
         params: dict[str, Any] = {}
 
@@ -90,7 +139,27 @@ class MetadataService:
         page: int,
         page_size: int,
         sort: SortSpec,
-    ) -> dict[str, Any]:
+    ) -> ServiceListResult:
+        return self._cache.get_or_build(
+            ("reason_codes", category, active_only, page, page_size, sort),
+            lambda: self._fetch_reason_codes(
+                category=category,
+                active_only=active_only,
+                page=page,
+                page_size=page_size,
+                sort=sort,
+            ),
+        )
+
+    def _fetch_reason_codes(
+        self,
+        *,
+        category: str | None,
+        active_only: bool,
+        page: int,
+        page_size: int,
+        sort: SortSpec,
+    ) -> ServiceListResult:
         where_clauses: list[str] = ["1 = 1"]
         params: dict[str, Any] = {}
 
@@ -130,6 +199,9 @@ class MetadataService:
         return {"rows": rows, "total_count": total_count, "warnings": None}
 
     def get_current_policy(self) -> dict[str, Any]:
+        return self._cache.get_or_build(("policy",), self._fetch_current_policy)
+
+    def _fetch_current_policy(self) -> dict[str, Any]:
         query = f"""
         SELECT
             policy_version,
@@ -152,6 +224,9 @@ class MetadataService:
         return row
 
     def get_schema_catalog(self) -> dict[str, Any]:
+        return self._schema_catalog
+
+    def _build_schema_catalog(self) -> dict[str, Any]:
         endpoints = [
             {"endpoint_path": "/health", "method": "GET", "response_model_name": "HealthResponse"},
             {
@@ -184,19 +259,7 @@ class MetadataService:
         return {
             "api_version_path": self.config.api_version_path,
             "schema_version": self.config.schema_version,
-            "compatibility_policy": {
-                "non_breaking_changes": [
-                    "adding optional fields",
-                    "adding new endpoints",
-                    "adding reason codes",
-                ],
-                "breaking_changes": [
-                    "renaming fields",
-                    "removing fields",
-                    "changing field types",
-                    "changing nesting shape",
-                ],
-            },
+            "compatibility_policy": SCHEMA_COMPATIBILITY_POLICY,
             "endpoints": endpoints,
         }
 
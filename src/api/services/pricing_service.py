@@ -5,15 +5,24 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
+
+import orjson
 
 from src.api.api_config import ApiConfig
 from src.api.db_access import DatabaseClient
 from src.api.error_handlers import APIError
-from src.api.pagination import SortSpec
-from src.api.plain_language import pricing_plain_fields
+from src.api.pagination import (
+    SortSpec,
+    keyset_after_clause,
+    keyset_page_params,
+    split_keyset_page,
+)
+from src.api.plain_language import pricing_plain_fields_batch
+from src.api.services.results import ServiceListResult
+from src.api.services.ttl_cache import TTLCache
 
 PRICING_SORT_FIELD_MAP: dict[str, str] = {
     "zone_id": "p.zone_id",
@@ -23,6 +32,36 @@ PRICING_SORT_FIELD_MAP: dict[str, str] = {
     "confidence_score": "p.confidence_score",
     "borough": "z.borough",
 }
+PRICING_SORT_FIELDS: frozenset[str] = frozenset(PRICING_SORT_FIELD_MAP)
+
+# NOT NULL pricing columns that can drive keyset pages, mapped to their cursor value parser.
+PRICING_CURSOR_VALUE_PARSERS: dict[str, Callable[[Any], Any]] = {
+    "zone_id": int,
+    "bucket_start_ts": datetime.fromisoformat,
+    "final_multiplier": float,
+    "raw_multiplier": float,
+    "confidence_score": float,
+}
+
+# Plain-language columns blanked when the feature is disabled; `exclude_none` drops them.
+_HIDDEN_PLAIN_FIELDS: dict[str, None] = {
+    "zone_name": None,
+    "recommended_price_action": None,
+    "why_this_price": None,
+    "guardrail_note": None,
+    "confidence_note": None,
+}
+
+# Count keys carry filter values from query strings, so the cache stays small: it only
+# needs to hold the filter sets users are actively paging through.
+PRICING_COUNT_CACHE_MAX_ENTRIES = 128
+
+# Filters compared with LOWER() in SQL; their values are case-folded in count cache keys.
+_CASE_INSENSITIVE_FILTERS = frozenset({"borough", "uncertainty_band"})
+
+# Presence of each filter (start, end, zone, borough, band, cap, rate limit), then
+# (sort_field, sort_order, after_cursor).
+_WindowShape = tuple[bool, bool, bool, bool, bool, bool, bool, str, str, bool]
 
 
 class PricingService:
@@ -36,6 +75,15 @@ class PricingService:
         self.pricing_run_log_table = self.config.validate_table_name(
             self.config.pricing_run_log_table_name
         )
+        self._run_id_cache = TTLCache(ttl_seconds=self.config.latest_run_cache_ttl_seconds)
+        # A run's decisions are written once, so counts per filter set hold while users page.
+        self._count_cache = TTLCache(
+            ttl_seconds=self.config.list_count_cache_ttl_seconds,
+            max_entries=PRICING_COUNT_CACHE_MAX_ENTRIES,
+        )
+        # Filters, sort, and cursor use only change which SQL text is needed; values are
+        # bound, so each rendered query pair is kept per shape.
+        self._window_query_cache: dict[_WindowShape, tuple[str, str]] = {}
 
     def get_latest_pricing(
         self,
@@ -46,7 +94,8 @@ class PricingService:
         page_size: int,
         sort: SortSpec,
         include_plain_language_fields: bool,
-    ) -> dict[str, Any]:
+        cursor: str | None = None,
+    ) -> ServiceListResult:
         latest_run_id = self._latest_run_id()
         if latest_run_id is None:
             return {"rows": [], "total_count": 0, "warnings": ["No pricing run found."]}
@@ -64,6 +113,7 @@ class PricingService:
             page_size=page_size,
             sort=sort,
             include_plain_language_fields=include_plain_language_fields,
+            cursor=cursor,
         )
 
     def get_pricing_window(
@@ -81,104 +131,83 @@ class PricingService:
         page_size: int,
         sort: SortSpec,
         include_plain_language_fields: bool,
-    ) -> dict[str, Any]:
+        cursor: str | None = None,
+    ) -> ServiceListResult:
         effective_run_id = run_id or self._latest_run_id()
         if effective_run_id is None:
             return {"rows": [], "total_count": 0, "warnings": ["No pricing run found."]}
 
-        where_clauses: list[str] = ["p.run_id = :run_id"]
         params: dict[str, Any] = {"run_id": effective_run_id}
-
         if start_ts is not None:
-            where_clauses.append("p.bucket_start_ts >= :start_ts")
             params["start_ts"] = start_ts
         if end_ts is not None:
-            where_clauses.append("p.bucket_start_ts <= :end_ts")
             params["end_ts"] = end_ts
         if zone_id is not None:
-            where_clauses.append("p.zone_id = :zone_id")
             params["zone_id"] = zone_id
         if borough is not None:
-            where_clauses.append("LOWER(z.borough) = LOWER(:borough)")
             params["borough"] = borough
         if uncertainty_band is not None:
-            where_clauses.append("LOWER(p.uncertainty_band) = LOWER(:uncertainty_band)")
             params["uncertainty_band"] = uncertainty_band
         if cap_applied is not None:
-            where_clauses.append("p.cap_applied = :cap_applied")
             params["cap_applied"] = cap_applied
         if rate_limit_applied is not None:
-            where_clauses.append("p.rate_limit_applied = :rate_limit_applied")
             params["rate_limit_applied"] = rate_limit_applied
 
-        where_sql = " AND ".join(where_clauses)
-        order_sql = self._order_by_clause(sort)
+        try:
+            page_params = params | keyset_page_params(
+                cursor=cursor,
+                sort=sort,
+                page=page,
+                page_size=page_size,
+                value_parsers=PRICING_CURSOR_VALUE_PARSERS,
+            )
+        except ValueError as exc:
+            raise APIError(
+                status_code=400,
+                error_code="INVALID_QUERY_PARAM",
+                message=str(exc),
+            ) from exc
 
-        count_query = f"""
-        SELECT COUNT(*) AS total_count
-        FROM {self.pricing_table} p
-        LEFT JOIN {self.zone_table} z ON z.location_id = p.zone_id
-        WHERE {where_sql}
-        """
-        total_count_row = self.db.fetch_one(count_query, params) or {"total_count": 0}
-        total_count = int(total_count_row["total_count"])
+        count_query, data_query = self._window_queries(
+            (
+                start_ts is not None,
+                end_ts is not None,
+                zone_id is not None,
+                borough is not None,
+                uncertainty_band is not None,
+                cap_applied is not None,
+                rate_limit_applied is not None,
+                sort.field,
+                sort.order,
+                cursor is not None,
+            )
+        )
+        total_count = self._count_cache.get_or_build(
+            self._count_cache_key(count_query, params),
+            lambda: self._query_total_count(count_query, params),
+        )
 
-        data_query = f"""
-        SELECT
-            p.zone_id,
-            p.bucket_start_ts,
-            p.pricing_run_key,
-            p.run_id,
-            p.forecast_run_id,
-            z.zone AS zone_name,
-            z.borough,
-            z.service_zone,
-            p.final_multiplier,
-            p.raw_multiplier,
-            p.pre_cap_multiplier,
-            p.post_cap_multiplier,
-            p.confidence_score,
-            p.uncertainty_band,
-            p.y_pred,
-            p.y_pred_lower,
-            p.y_pred_upper,
-            p.cap_applied,
-            p.cap_type,
-            p.cap_reason,
-            p.rate_limit_applied,
-            p.rate_limit_direction,
-            p.smoothing_applied,
-            p.primary_reason_code,
-            p.reason_codes_json,
-            p.reason_summary,
-            p.pricing_policy_version
-        FROM {self.pricing_table} p
-        LEFT JOIN {self.zone_table} z ON z.location_id = p.zone_id
-        WHERE {where_sql}
-        ORDER BY {order_sql}, p.zone_id ASC, p.bucket_start_ts ASC
-        LIMIT :limit OFFSET :offset
-        """
+        rows = self.db.fetch_all(data_query, page_params)
+        rows, next_cursor = split_keyset_page(
+            rows, sort=sort, page_size=page_size, value_parsers=PRICING_CURSOR_VALUE_PARSERS
+        )
+
+        # `fetch_all` hands back fresh dicts, so rows are reshaped in place.
+        for row in rows:
+            row["reason_codes"] = self._normalize_reason_codes(row.pop("reason_codes_json", None))
+        if include_plain_language_fields:
+            for row, plain_fields in zip(rows, pricing_plain_fields_batch(rows), strict=True):
+                row.update(plain_fields)
+        else:
+            for row in rows:
+                row.update(_HIDDEN_PLAIN_FIELDS)
 
-        page_params = dict(params)
-        page_params["limit"] = page_size
-        page_params["offset"] = (page - 1) * page_size
-        raw_rows = self.db.fetch_all(data_query, page_params)
-
-        rows: list[dict[str, Any]] = []
-        for row in raw_rows:
-            shaped = dict(row)
-            shaped["reason_codes"] = self._normalize_reason_codes(shaped.pop("reason_codes_json", None))
-            if include_plain_language_fields:
-                shaped.update(pricing_plain_fields(shaped))
-            else:
-                shaped["zone_name"] = None
-                shaped["recommended_price_action"] = None
-                shaped["why_this_price"] = None
-                shaped["guardrail_note"] = None
-                shaped["confidence_note"] = None
-            rows.append(shaped)
-
-        return {"rows": rows, "total_count": total_count, "warnings": None}
+        return {
+            "rows": rows,
+            "total_count": total_count,
+            "warnings": None,
+            "next_cursor": next_cursor,
+        }
 
     def get_zone_timeline(
         self,
@@ -190,7 +219,8 @@ class PricingService:
         page_size: int,
         sort: SortSpec,
         include_plain_language_fields: bool,
-    ) -> dict[str, Any]:
+        cursor: str | None = None,
+    ) -> ServiceListResult:
         if not self.zone_exists(zone_id):
             raise APIError(
                 status_code=404,
@@ -211,6 +241,7 @@ class PricingService:
             page_size=page_size,
             sort=sort,
             include_plain_language_fields=include_plain_language_fields,
+            cursor=cursor,
         )
 
     def get_latest_run_summary(self) -> dict[str, Any] | None:
@@ -261,11 +292,30 @@ class PricingService:
         """
         return self.db.fetch_one(query, {"run_id": run_id})
 
+    @staticmethod
+    def _count_cache_key(count_query: str, params: dict[str, Any]) -> tuple[Any, ...]:
+        # Aware datetimes hash by instant, so window bounds sent with different offsets
+        # already share a key.
+        normalized = tuple(
+            sorted(
+                (name, value.lower() if name in _CASE_INSENSITIVE_FILTERS else value)
+                for name, value in params.items()
+            )
+        )
+        return (count_query, normalized)
+
+    def _query_total_count(self, count_query: str, params: dict[str, Any]) -> int:
+        total_count_row = self.db.fetch_one(count_query, params) or {"total_count": 0}
+        return int(total_count_row["total_count"])
+
     def zone_exists(self, zone_id: int) -> bool:
         query = f"SELECT 1 FROM {self.zone_table} WHERE location_id = :zone_id LIMIT 1"
         return self.db.fetch_one(query, {"zone_id": zone_id}) is not None
 
     def _latest_run_id(self) -> str | None:
+        return self._run_id_cache.get_or_build("pricing", self._query_latest_run_id)
+
+    def _query_latest_run_id(self) -> str | None:
         by_log_query = f"""
         SELECT run_id
         FROM {self.pricing_run_log_table}
@@ -288,19 +338,113 @@ class PricingService:
             return str(fallback["run_id"])
         return None
 
+    def _window_queries(self, shape: _WindowShape) -> tuple[str, str]:
+        queries = self._window_query_cache.get(shape)
+        if queries is None:
+            queries = self._render_window_queries(*shape)
+            self._window_query_cache[shape] = queries
+        return queries
+
+    def _render_window_queries(
+        self,
+        has_start: bool,
+        has_end: bool,
+        has_zone: bool,
+        has_borough: bool,
+        has_uncertainty_band: bool,
+        has_cap_applied: bool,
+        has_rate_limit_applied: bool,
+        sort_field: str,
+        sort_order: str,
+        after_cursor: bool,
+    ) -> tuple[str, str]:
+        where_clauses: list[str] = ["p.run_id = :run_id"]
+        if has_start:
+            where_clauses.append("p.bucket_start_ts >= :start_ts")
+        if has_end:
+            where_clauses.append("p.bucket_start_ts <= :end_ts")
+        if has_zone:
+            where_clauses.append("p.zone_id = :zone_id")
+        if has_borough:
+            where_clauses.append("LOWER(z.borough) = LOWER(:borough)")
+        if has_uncertainty_band:
+            where_clauses.append("LOWER(p.uncertainty_band) = LOWER(:uncertainty_band)")
+        if has_cap_applied:
+            where_clauses.append("p.cap_applied = :cap_applied")
+        if has_rate_limit_applied:
+            where_clauses.append("p.rate_limit_applied = :rate_limit_applied")
+
+        sort = SortSpec(field=sort_field, order=sort_order)
+        where_sql = " AND ".join(where_clauses)
+        order_sql = self._order_by_clause(sort)
+        page_where_sql = where_sql
+        if after_cursor:
+            after_cursor_sql = keyset_after_clause(
+                sort_expr=PRICING_SORT_FIELD_MAP[sort_field],
+                sort_order=sort_order,
+                table_alias="p",
+            )
+            page_where_sql = f"{where_sql} AND {after_cursor_sql}"
+
+        count_query = f"""
+        SELECT COUNT(*) AS total_count
+        FROM {self.pricing_table} p
+        LEFT JOIN {self.zone_table} z ON z.location_id = p.zone_id
+        WHERE {where_sql}
+        """
+
+        data_query = f"""
+        SELECT
+            p.zone_id,
+            p.bucket_start_ts,
+            p.pricing_run_key,
+            p.run_id,
+            p.forecast_run_id,
+            z.zone AS zone_name,
+            z.borough,
+            z.service_zone,
+            p.final_multiplier,
+            p.raw_multiplier,
+            p.pre_cap_multiplier,
+            p.post_cap_multiplier,
+            p.confidence_score,
+            p.uncertainty_band,
+            p.y_pred,
+            p.y_pred_lower,
+            p.y_pred_upper,
+            p.cap_applied,
+            p.cap_type,
+            p.cap_reason,
+            p.rate_limit_applied,
+            p.rate_limit_direction,
+            p.smoothing_applied,
+            p.primary_reason_code,
+            p.reason_codes_json,
+            p.reason_summary,
+            p.pricing_policy_version
+        FROM {self.pricing_table} p
+        LEFT JOIN {self.zone_table} z ON z.location_id = p.zone_id
+        WHERE {page_where_sql}
+        ORDER BY {order_sql}, p.zone_id ASC, p.bucket_start_ts ASC
+        LIMIT :limit OFFSET :offset
+        """
+        return count_query, data_query
+
     @staticmethod
     def _normalize_reason_codes(reason_codes_json: Any) -> list[str]:
+        # The column is JSONB, so the driver normally hands back a decoded list of strings;
+        # text payloads are only parsed as a fallback.
         if reason_codes_json is None:
             return []
-        if isinstance(reason_codes_json, list):
-            return [str(item) for item in reason_codes_json]
         if isinstance(reason_codes_json, str):
             try:
-                parsed = json.loads(reason_codes_json)
-            except json.JSONDecodeError:
+                reason_codes_json = orjson.loads(reason_codes_json)
+            except orjson.JSONDecodeError:
                 return []
-            if isinstance(parsed, list):
-                return [str(item) for item in parsed]
+        if isinstance(reason_codes_json, list):
+            if all(isinstance(item, str) for item in reason_codes_json):
+                return cast(list[str], reason_codes_json)
+            return [str(item) for item in reason_codes_json]
         return []
 
     @staticmethod
@@ -0,0 +1,16 @@
+# This file defines the result shapes that list-style service methods return to routers.
+# It exists so routers can trust field types instead of re-casting values at the edge.
+# Services already convert database counts to `int` before building these results.
+# Keeping the contract typed lets mypy catch drift between services and envelopes.
+
+from __future__ import annotations
+
+from typing import Any, NotRequired, TypedDict
+
+
+class ServiceListResult(TypedDict):
+    rows: list[dict[str, Any]]
+    total_count: int
+    warnings: list[str] | None
+    # Set by keyset-capable lists when more rows follow the returned page.
+    next_cursor: NotRequired[str | None]
@@ -0,0 +1,47 @@
+# This file provides the small in-process TTL cache that services use for slow-moving reads.
+# It exists so repeat requests between scheduled runs reuse one query result per key.
+# Entries expire on a monotonic clock and the cache is bounded by entry count.
+# Sync routes share it across worker threads, so lookups, eviction, and stores hold a lock;
+# builds run outside it, so concurrent misses may both rebuild and the last write wins.
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar, cast
+
+_T = TypeVar("_T")
+
+
+class TTLCache:
+    """Bounded mapping of keys to values that expire `ttl_seconds` after they are built."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int = 256) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], _T]) -> _T:
+        """Return the live value for `key`, calling `build` on a miss or after expiry."""
+
+        if self.ttl_seconds <= 0:
+            return build()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cast(_T, cached[1])
+        value = build()
+        with self._lock:
+            now = time.monotonic()
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                while len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + self.ttl_seconds, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
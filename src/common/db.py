@@ -6,23 +6,53 @@ Keeping these helpers isolated reduces duplication and keeps domain modules focu
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any
+
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.common.settings import get_settings
 
-_SETTINGS = get_settings()
 
-engine: Engine = create_engine(_SETTINGS.DATABASE_URL, pool_pre_ping=True, future=True)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, class_=Session)
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Return the shared pipeline engine, creating it on first use."""
+
+    settings = get_settings()
+    return create_engine(
+        settings.DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=True,
+        future=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> sessionmaker[Session]:
+    """Return the shared session factory bound to `get_engine()`."""
+
+    return sessionmaker(bind=get_engine(), autocommit=False, autoflush=False, class_=Session)
+
+
+def __getattr__(name: str) -> Any:
+    # `engine` and `SessionLocal` stay importable, but settings are only loaded and the
+    # engine only built when one of them is first requested.
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def test_connection() -> bool:
     """Return True if the database can be reached and queried."""
 
     try:
-        with engine.connect() as connection:
+        with get_engine().connect() as connection:
             connection.execute(text("SELECT 1"))
         return True
     except Exception:
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import re
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 COLUMN_ALIASES = {
@@ -50,6 +52,18 @@ CANONICAL_TRIP_COLUMNS = [
     "store_and_fwd_flag",
 ]
 
+NUMERIC_TRIP_COLUMNS = [
+    "vendor_id",
+    "pickup_location_id",
+    "dropoff_location_id",
+    "rate_code_id",
+    "passenger_count",
+    "payment_type",
+    "trip_distance",
+    "fare_amount",
+    "total_amount",
+]
+
 TRIP_COLUMNS_WITH_META = CANONICAL_TRIP_COLUMNS + [
     "ingest_batch_id",
     "source_file",
@@ -58,18 +72,27 @@ TRIP_COLUMNS_WITH_META = CANONICAL_TRIP_COLUMNS + [
 ]
 
 
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
 def _to_snake_case(value: str) -> str:
-    normalized = re.sub(r"[^a-zA-Z0-9]+", "_", value.strip()).strip("_")
+    normalized = _NON_ALNUM_RE.sub("_", value.strip()).strip("_")
     return normalized.lower()
 
 
+@lru_cache(maxsize=256)
+def _canonical_column_name(column: str) -> str:
+    snake_case = _to_snake_case(column)
+    return COLUMN_ALIASES.get(snake_case, snake_case)
+
+
 def normalize_trip_dataframe(df: pd.DataFrame, source_file: Path, ingest_batch_id: str) -> pd.DataFrame:
     """Normalize TLC trip dataframe to canonical schema and metadata."""
 
-    renamed_columns = {
-        column: COLUMN_ALIASES.get(_to_snake_case(column), _to_snake_case(column)) for column in df.columns
-    }
-    normalized = df.rename(columns=renamed_columns).copy()
+    renamed_columns = {column: _canonical_column_name(column) for column in df.columns}
+    # Every later write replaces whole columns, so the renamed frame can share the input's
+    # arrays instead of copying them; the caller's frame is never written to.
+    normalized = df.rename(columns=renamed_columns, copy=False)
 
     for column in CANONICAL_TRIP_COLUMNS:
         if column not in normalized.columns:
@@ -78,26 +101,16 @@ def normalize_trip_dataframe(df: pd.DataFrame, source_file: Path, ingest_batch_i
     normalized["pickup_datetime"] = pd.to_datetime(normalized["pickup_datetime"], errors="coerce")
     normalized["dropoff_datetime"] = pd.to_datetime(normalized["dropoff_datetime"], errors="coerce")
 
-    int_columns = [
-        "vendor_id",
-        "pickup_location_id",
-        "dropoff_location_id",
-        "rate_code_id",
-        "passenger_count",
-        "payment_type",
-    ]
-    for column in int_columns:
-        normalized[column] = pd.to_numeric(normalized[column], errors="coerce")
-
-    float_columns = ["trip_distance", "fare_amount", "total_amount"]
-    for column in float_columns:
-        normalized[column] = pd.to_numeric(normalized[column], errors="coerce")
+    # Parquet sources arrive already typed; only text or mixed columns need coercion.
+    for column in NUMERIC_TRIP_COLUMNS:
+        if not pd.api.types.is_numeric_dtype(normalized[column]):
+            normalized[column] = pd.to_numeric(normalized[column], errors="coerce")
 
     normalized["store_and_fwd_flag"] = normalized["store_and_fwd_flag"].astype("string")
 
     normalized["ingest_batch_id"] = ingest_batch_id
     normalized["source_file"] = str(source_file)
-    normalized["source_row_number"] = pd.Series(range(1, len(normalized) + 1), dtype="int64")
+    normalized["source_row_number"] = np.arange(1, len(normalized) + 1, dtype=np.int64)
     normalized["ingested_at"] = datetime.now(tz=UTC)
 
     return normalized[TRIP_COLUMNS_WITH_META]
@@ -52,6 +52,9 @@ class Settings(BaseModel):
     PREFECT_API_URL: str
     PROMETHEUS_PORT: int
     GRAFANA_PORT: int
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
 
 
 def load_settings(*, load_env: bool = True) -> Settings:
@@ -69,7 +72,9 @@ def load_settings(*, load_env: bool = True) -> Settings:
         )
 
     try:
-        return Settings.model_validate(dict(os.environ))
+        # Only declared fields are read, so the rest of the environment is never copied.
+        values = {key: os.environ[key] for key in Settings.model_fields if key in os.environ}
+        return Settings.model_validate(values)
     except ValidationError as exc:
         raise RuntimeError(f"Invalid environment configuration: {exc}") from exc
 
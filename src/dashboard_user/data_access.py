@@ -6,13 +6,14 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import asdict
 from datetime import datetime
 from typing import Any, cast
 
 import pandas as pd
 
-from src.api.plain_language import forecast_plain_fields, pricing_plain_fields
+from src.api.plain_language import forecast_plain_fields_batch, pricing_plain_fields_batch
 from src.dashboard_user.api_client import ApiUnavailableError, DashboardApiClient
 from src.dashboard_user.dashboard_config import DashboardConfig, DashboardFilters
 from src.dashboard_user.db_client import DashboardDbClient, DatabaseUnavailableError
@@ -408,22 +409,16 @@ class DashboardDataAccess:
             if target_column not in output.columns:
                 output[target_column] = None
 
-        for index, row in output.iterrows():
-            if all(
-                row.get(column)
-                for column in [
-                    "why_this_price",
-                    "guardrail_note",
-                    "confidence_note",
-                    "recommended_price_action",
-                ]
-            ):
-                continue
-            generated = pricing_plain_fields(row.to_dict())
-            for key, value in generated.items():
-                output.at[index, key] = value
-
-        return output
+        return self._fill_plain_language(
+            output,
+            columns=[
+                "why_this_price",
+                "guardrail_note",
+                "confidence_note",
+                "recommended_price_action",
+            ],
+            build_fields=pricing_plain_fields_batch,
+        )
 
     def _apply_forecast_plain_language(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         if dataframe.empty:
@@ -434,16 +429,34 @@ class DashboardDataAccess:
             if target_column not in output.columns:
                 output[target_column] = None
 
-        for index, row in output.iterrows():
-            if all(
-                row.get(column)
-                for column in ["demand_outlook_label", "confidence_note", "forecast_range_summary"]
-            ):
-                continue
-            generated = forecast_plain_fields(row.to_dict())
-            for key, value in generated.items():
-                output.at[index, key] = value
+        return self._fill_plain_language(
+            output,
+            columns=["demand_outlook_label", "confidence_note", "forecast_range_summary"],
+            build_fields=forecast_plain_fields_batch,
+        )
+
+    @staticmethod
+    def _fill_plain_language(
+        output: pd.DataFrame,
+        *,
+        columns: list[str],
+        build_fields: Callable[[Sequence[Mapping[str, Any]]], Sequence[Mapping[str, Any]]],
+    ) -> pd.DataFrame:
+        # Rows that already carry every field keep their text; the rest are generated in
+        # one batch so thresholds are bucketed together instead of per `iterrows` step.
+        records = output.to_dict("records")
+        missing = [
+            position
+            for position, record in enumerate(records)
+            if not all(record.get(column) for column in columns)
+        ]
+        if not missing:
+            return output
 
+        generated = build_fields([records[position] for position in missing])
+        for key in generated[0]:
+            values = [fields[key] for fields in generated]
+            output.iloc[missing, output.columns.get_loc(key)] = values
         return output
 
     @staticmethod
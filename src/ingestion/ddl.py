@@ -6,8 +6,10 @@ It is typically invoked via the Phase 1 Make targets and should be safe to re-ru
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
 DDL_ORDER = [
@@ -19,6 +21,14 @@ DDL_ORDER = [
     "ingestion_watermark.sql",
 ]
 
+DDL_APPLIED_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ingestion_ddl_applied (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    ddl_hash TEXT NOT NULL,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+)
+"""
+
 
 def apply_ingestion_ddl(engine: Engine, ddl_dir: Path | None = None) -> None:
     """Apply ingestion DDL files in deterministic order."""
@@ -28,3 +38,58 @@ def apply_ingestion_ddl(engine: Engine, ddl_dir: Path | None = None) -> None:
         for ddl_file in DDL_ORDER:
             sql_text = (ddl_path / ddl_file).read_text(encoding="utf-8")
             connection.exec_driver_sql(sql_text)
+
+
+def ingestion_ddl_hash(ddl_dir: Path | None = None) -> str:
+    """Return a stable hash of the ingestion DDL files in apply order."""
+
+    ddl_path = ddl_dir or Path("sql/ddl")
+    digest = hashlib.sha256()
+    for ddl_file in DDL_ORDER:
+        digest.update(ddl_file.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update((ddl_path / ddl_file).read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def apply_ingestion_ddl_if_changed(
+    engine: Engine,
+    ddl_dir: Path | None = None,
+    *,
+    force: bool = False,
+) -> bool:
+    """Apply ingestion DDL only when the files differ from the last recorded apply.
+
+    Returns True when DDL was applied and False when the recorded hash matched.
+    """
+
+    current_hash = ingestion_ddl_hash(ddl_dir)
+    if not force:
+        with engine.connect() as connection:
+            table_present = connection.execute(
+                text("SELECT to_regclass('ingestion_ddl_applied') IS NOT NULL")
+            ).scalar_one()
+            applied_hash = None
+            if table_present:
+                applied_hash = connection.execute(
+                    text("SELECT ddl_hash FROM ingestion_ddl_applied WHERE id = 1")
+                ).scalar_one_or_none()
+        if applied_hash == current_hash:
+            return False
+
+    apply_ingestion_ddl(engine, ddl_dir)
+    with engine.begin() as connection:
+        connection.exec_driver_sql(DDL_APPLIED_TABLE_SQL)
+        connection.execute(
+            text(
+                """
+                INSERT INTO ingestion_ddl_applied (id, ddl_hash, applied_at)
+                VALUES (1, :ddl_hash, NOW())
+                ON CONFLICT (id) DO UPDATE
+                SET ddl_hash = EXCLUDED.ddl_hash, applied_at = EXCLUDED.applied_at
+                """
+            ),
+            {"ddl_hash": current_hash},
+        )
+    return True
@@ -7,6 +7,7 @@ It is typically invoked via the Phase 1 Make targets and should be safe to re-ru
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -87,30 +88,41 @@ def _load_manifest(manifest_path: Path) -> dict[str, dict[str, Any]]:
     return entries
 
 
-def download_sample_files(months: list[str]) -> list[dict[str, Any]]:
-    """Download sample files and update immutable manifest rows."""
+def _manifest_payload(source: SourceFile) -> dict[str, Any]:
+    if not source.destination.exists():
+        _download_file(source.url, source.destination)
+
+    return {
+        "source_name": source.source_name,
+        "file_path": str(source.destination),
+        "checksum": sha256sum(source.destination),
+        "file_size": source.destination.stat().st_size,
+        "discovered_at": datetime.now(tz=UTC).isoformat(),
+    }
+
+
+def download_sample_files(months: list[str], max_workers: int = 1) -> list[dict[str, Any]]:
+    """Download sample files and update immutable manifest rows.
+
+    Downloads run on up to `max_workers` threads; the manifest is merged and written once
+    on the calling thread so concurrent workers never touch it.
+    """
 
     manifest_path = Path("data/landing/manifest.jsonl")
     existing = _load_manifest(manifest_path)
-    discovered: list[dict[str, Any]] = []
-
-    for source in build_sample_sources(months):
-        if not source.destination.exists():
-            _download_file(source.url, source.destination)
-
-        checksum = sha256sum(source.destination)
-        size = source.destination.stat().st_size
-        payload = {
-            "source_name": source.source_name,
-            "file_path": str(source.destination),
-            "checksum": checksum,
-            "file_size": size,
-            "discovered_at": datetime.now(tz=UTC).isoformat(),
-        }
+    # Repeated months would otherwise have two workers writing the same destination file.
+    sources = list({source.destination: source for source in build_sample_sources(months)}.values())
+
+    if max_workers > 1 and len(sources) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as executor:
+            payloads = list(executor.map(_manifest_payload, sources))
+    else:
+        payloads = [_manifest_payload(source) for source in sources]
+
+    for payload in payloads:
         key = f"{payload['source_name']}::{payload['file_path']}::{payload['checksum']}"
         if key not in existing:
             existing[key] = payload
-            discovered.append(payload)
 
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
     with manifest_path.open("w", encoding="utf-8") as file_obj:
@@ -5,9 +5,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from types import SimpleNamespace
 from typing import Any
+from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
@@ -15,7 +17,6 @@ from src.api.api_config import ApiConfig
 from src.api.app import app
 from src.api.dependencies import (
     get_config,
-    get_database_client,
     get_diagnostics_service,
     get_forecast_service,
     get_metadata_service,
@@ -79,6 +80,18 @@ class FakeDBClient:
             "reason_code_reference",
         }
 
+    @property
+    def engine(self) -> Any:
+        return SimpleNamespace(pool=None, connect=self._connect)
+
+    def _connect(self) -> Any:
+        if not self._connected:
+            raise ConnectionError("fake database is offline")
+        return SimpleNamespace(close=lambda: None)
+
+    def trust_identifiers(self, names: Iterable[str]) -> None:
+        return None
+
     def can_connect(self) -> bool:
         return self._connected
 
@@ -104,8 +117,6 @@ def api_test_client(
     resolved_config = config or build_test_config()
 
     app.dependency_overrides[get_config] = lambda: resolved_config
-    if db_client is not None:
-        app.dependency_overrides[get_database_client] = lambda: db_client
     if pricing_service is not None:
         app.dependency_overrides[get_pricing_service] = lambda: pricing_service
     if forecast_service is not None:
@@ -116,7 +127,14 @@ def api_test_client(
         app.dependency_overrides[get_diagnostics_service] = lambda: diagnostics_service
 
     try:
-        with TestClient(app) as client:
+        with ExitStack() as stack:
+            if db_client is not None:
+                # Startup binds whatever this builds to `app.state.db_client`, so routes and
+                # the readiness refresher see the same fake a deployed app would see.
+                stack.enter_context(
+                    patch("src.api.dependencies.build_database_client", return_value=db_client)
+                )
+            client = stack.enter_context(TestClient(app))
             yield client
     finally:
         app.dependency_overrides.clear()
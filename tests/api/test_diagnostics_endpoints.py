@@ -0,0 +1,98 @@
+# This file tests diagnostics summary endpoints and their response caching.
+# It exists so repeat dashboard polls keep hitting the cached summary instead of the database.
+# The tests check that summaries and latest run ids are reused within their TTLs.
+# Conditional requests with a matching ETag must short-circuit to 304 Not Modified.
+
+from __future__ import annotations
+
+from typing import Any
+
+from src.api.services.diagnostics_service import DiagnosticsService
+from tests.api.support import FakeDBClient, api_test_client, build_test_config
+
+
+class CountingDiagnosticsDB:
+    def __init__(self) -> None:
+        self.query_count = 0
+
+    def fetch_one(self, query: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        self.query_count += 1
+        return None
+
+    def fetch_all(self, query: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        self.query_count += 1
+        return []
+
+
+def test_diagnostics_summary_is_cached_with_etag() -> None:
+    db = CountingDiagnosticsDB()
+    service = DiagnosticsService(config=build_test_config(), db=db)  # type: ignore[arg-type]
+
+    with api_test_client(
+        config=build_test_config(),
+        db_client=FakeDBClient(),
+        diagnostics_service=service,
+    ) as client:
+        first = client.get("/api/v1/diagnostics/coverage/latest")
+        queries_after_first = db.query_count
+        second = client.get("/api/v1/diagnostics/coverage/latest")
+        not_modified = client.get(
+            "/api/v1/diagnostics/coverage/latest",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+
+    assert first.status_code == 200
+    assert first.json()["data"]["pricing_run_id"] is None
+    assert first.headers["cache-control"] == "public, max-age=60"
+    assert second.headers["etag"] == first.headers["etag"]
+    assert db.query_count == queries_after_first
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+def test_latest_run_ids_are_shared_across_summaries() -> None:
+    db = CountingDiagnosticsDB()
+    service = DiagnosticsService(config=build_test_config(), db=db)  # type: ignore[arg-type]
+
+    assert service._latest_pricing_run_id() is None
+    queries_after_first_lookup = db.query_count
+    assert service._latest_pricing_run_id() is None
+
+    assert service._latest_forecast_run_id() is None
+
+    # One UNION ALL over both run logs, then one fallback query per empty run log.
+    assert queries_after_first_lookup == 3
+    assert db.query_count == queries_after_first_lookup
+
+
+class AggregatingDiagnosticsDB(CountingDiagnosticsDB):
+    def __init__(self) -> None:
+        super().__init__()
+        self.aggregate_queries = 0
+
+    def fetch_one(self, query: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        self.query_count += 1
+        if "cap_applied_rows" in query:
+            self.aggregate_queries += 1
+            return {
+                "total_rows": 4,
+                "zone_count": 2,
+                "cap_applied_rows": 1,
+                "rate_limited_rows": 2,
+                "smoothing_applied_rows": 0,
+            }
+        return {"run_id": "run-pr-1"}
+
+
+def test_coverage_and_guardrail_share_one_pricing_aggregate() -> None:
+    db = AggregatingDiagnosticsDB()
+    service = DiagnosticsService(config=build_test_config(), db=db)  # type: ignore[arg-type]
+
+    coverage = service.get_latest_coverage_summary()
+    guardrails = service.get_latest_guardrail_summary()
+
+    assert db.aggregate_queries == 1
+    assert coverage["pricing_zone_count"] == 2
+    assert coverage["pricing_row_count"] == 4
+    assert guardrails["cap_applied_rate"] == 0.25
+    assert guardrails["rate_limited_rate"] == 0.5
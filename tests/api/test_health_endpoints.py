@@ -1,6 +1,6 @@
 # This file tests API health, readiness, and version endpoints.
 # It exists to validate operational contracts used by orchestration and monitoring.
-# The tests confirm request IDs and version metadata are always returned.
+# The tests confirm request IDs, version metadata, and cached readiness probes.
 # Keeping these checks stable helps prevent accidental regressions in base API availability.
 
 from __future__ import annotations
@@ -50,3 +50,23 @@ def test_version_endpoint_returns_version_metadata() -> None:
     assert payload["app_version"] == config.app_version
     assert payload["project"] == config.api_name
     assert payload["version"] == config.app_version
+
+
+def test_ready_endpoint_reuses_cached_probe() -> None:
+    class CountingDBClient(FakeDBClient):
+        def __init__(self) -> None:
+            super().__init__(connected=True)
+            self.probe_count = 0
+
+        def can_connect(self) -> bool:
+            self.probe_count += 1
+            return super().can_connect()
+
+    db_client = CountingDBClient()
+    with api_test_client(config=build_test_config(), db_client=db_client) as client:
+        first = client.get("/ready")
+        second = client.get("/ready")
+
+    assert first.json()["ready"] is True
+    assert second.json()["ready"] is True
+    assert db_client.probe_count == 1
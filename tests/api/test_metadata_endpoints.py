@@ -6,7 +6,9 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import Any
 
+from src.api.services.metadata_service import MetadataService
 from tests.api.support import FakeDBClient, api_test_client, build_test_config
 
 
@@ -147,6 +149,51 @@ def test_metadata_policy_and_schema_endpoints() -> None:
     assert schema.json()["data"]["api_version_path"] == "/api/v1"
 
 
+class CountingMetadataDB:
+    def __init__(self) -> None:
+        self.query_count = 0
+
+    def fetch_one(self, query: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        self.query_count += 1
+        return {"total_count": 0}
+
+    def fetch_all(self, query: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        self.query_count += 1
+        return []
+
+
+def test_metadata_zones_are_cached_per_query() -> None:
+    db = CountingMetadataDB()
+    service = MetadataService(config=build_test_config(), db=db)  # type: ignore[arg-type]
+
+    with api_test_client(
+        config=build_test_config(),
+        db_client=FakeDBClient(),
+        metadata_service=service,
+    ) as client:
+        first = client.get("/api/v1/metadata/zones?borough=Queens")
+        queries_after_first = db.query_count
+        client.get("/api/v1/metadata/zones?borough=Queens")
+        queries_after_repeat = db.query_count
+        client.get("/api/v1/metadata/zones?borough=Bronx")
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "public, max-age=300"
+    assert queries_after_repeat == queries_after_first
+    assert db.query_count > queries_after_repeat
+
+
+def test_schema_catalog_is_built_once_per_service() -> None:
+    service = MetadataService(
+        config=build_test_config(), db=CountingMetadataDB()  # type: ignore[arg-type]
+    )
+
+    catalog = service.get_schema_catalog()
+
+    assert service.get_schema_catalog() is catalog
+    assert catalog["endpoints"][3]["endpoint_path"] == "/api/v1/pricing/latest"
+
+
 def test_diagnostics_endpoints() -> None:
     with api_test_client(
         config=build_test_config(),
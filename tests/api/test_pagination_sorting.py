@@ -1,13 +1,30 @@
 # This file tests pagination and sorting behavior for deterministic list responses.
 # It exists to validate both helper-level normalization and endpoint-level metadata output.
-# The tests cover partial-page behavior and invalid sort/page size validation.
+# The tests cover partial-page behavior, keyset cursors, and invalid sort/page size validation.
 # This keeps list contracts reliable for consumers that paginate programmatically.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from typing import Any
 
-from src.api.pagination import normalize_pagination, parse_sort
+import pytest
+
+from src.api.error_handlers import APIError
+from src.api.pagination import (
+    SortSpec,
+    decode_cursor,
+    encode_cursor,
+    keyset_after_clause,
+    keyset_page_params,
+    normalize_pagination,
+    parse_sort,
+    split_keyset_page,
+)
+from src.api.services import pricing_service
+from src.api.services.forecast_service import ForecastService
+from src.api.services.pricing_service import PricingService
 from tests.api.support import FakeDBClient, api_test_client, build_test_config
 
 
@@ -122,3 +139,260 @@ def test_invalid_page_size_returns_400() -> None:
 
     assert response.status_code == 400
     assert response.json()["error_code"] == "INVALID_QUERY_PARAM"
+
+
+class KeysetPageDB:
+    def __init__(self) -> None:
+        self.page_queries: list[tuple[str, dict[str, Any]]] = []
+
+    def fetch_one(self, query: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        if "COUNT(*)" in query:
+            return {"total_count": 3}
+        return {"run_id": "run-fc-1"}
+
+    def fetch_all(self, query: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        self.page_queries.append((query, dict(params or {})))
+        return [
+            {"zone_id": zone_id, "bucket_start_ts": datetime(2026, 2, 25, 10, 0, tzinfo=UTC)}
+            for zone_id in (101, 102, 103)
+        ][: int((params or {})["limit"])]
+
+
+def test_cursor_round_trip_and_rejects_garbage() -> None:
+    bucket = datetime(2026, 2, 25, 10, 0, tzinfo=UTC)
+    cursor = encode_cursor(["zone_id:asc", 102, 102, bucket])
+
+    assert decode_cursor(cursor) == ["zone_id:asc", 102, 102, "2026-02-25T10:00:00+00:00"]
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor")
+
+
+def test_keyset_helpers_share_one_sort_key_layout() -> None:
+    parsers = {"zone_id": int, "bucket_start_ts": datetime.fromisoformat, "y_pred": float}
+    sort = SortSpec(field="y_pred", order="desc")
+    bucket = datetime(2026, 2, 25, 10, 0, tzinfo=UTC)
+    rows = [{"zone_id": zone_id, "bucket_start_ts": bucket, "y_pred": 1.5} for zone_id in (1, 2, 3)]
+
+    page, cursor = split_keyset_page(rows, sort=sort, page_size=2, value_parsers=parsers)
+    params = keyset_page_params(
+        cursor=cursor, sort=sort, page=9, page_size=2, value_parsers=parsers
+    )
+
+    assert [row["zone_id"] for row in page] == [1, 2]
+    assert params == {
+        "offset": 0,
+        "limit": 3,
+        "cursor_sort_value": 1.5,
+        "cursor_zone_id": 2,
+        "cursor_bucket_start_ts": bucket,
+    }
+    assert keyset_after_clause(sort_expr="f.y_pred", sort_order="desc", table_alias="f") == (
+        "(f.y_pred < :cursor_sort_value OR (f.y_pred = :cursor_sort_value"
+        " AND (f.zone_id, f.bucket_start_ts) > (:cursor_zone_id, :cursor_bucket_start_ts)))"
+    )
+    with pytest.raises(ValueError):
+        keyset_page_params(
+            cursor=cursor,
+            sort=SortSpec(field="zone_id", order="asc"),
+            page=1,
+            page_size=2,
+            value_parsers=parsers,
+        )
+
+
+def test_forecast_window_keyset_pages_follow_next_cursor() -> None:
+    db = KeysetPageDB()
+    service = ForecastService(config=build_test_config(), db=db)  # type: ignore[arg-type]
+    sort = SortSpec(field="bucket_start_ts", order="desc")
+    window: dict[str, Any] = {
+        "start_ts": None,
+        "end_ts": None,
+        "zone_id": None,
+        "borough": None,
+        "run_id": "run-fc-1",
+        "page": 1,
+        "page_size": 2,
+        "sort": sort,
+        "include_plain_language_fields": False,
+    }
+
+    first = service.get_forecast_window(**window)
+    second = service.get_forecast_window(**window, cursor=first["next_cursor"])
+
+    assert [row["zone_id"] for row in first["rows"]] == [101, 102]
+    assert first["total_count"] == 3
+    query, params = db.page_queries[-1]
+    assert "(f.zone_id, f.bucket_start_ts) > (:cursor_zone_id, :cursor_bucket_start_ts)" in query
+    assert params["offset"] == 0
+    assert params["cursor_zone_id"] == 102
+    assert params["cursor_sort_value"] == datetime(2026, 2, 25, 10, 0, tzinfo=UTC)
+    assert second["total_count"] == 3
+    with pytest.raises(APIError):
+        service.get_forecast_window(
+            **{**window, "sort": SortSpec(field="zone_id", order="asc")},
+            cursor=first["next_cursor"],
+        )
+
+
+def test_pricing_window_keyset_pages_follow_next_cursor() -> None:
+    db = KeysetPageDB()
+    service = PricingService(config=build_test_config(), db=db)  # type: ignore[arg-type]
+    window: dict[str, Any] = {
+        "start_ts": None,
+        "end_ts": None,
+        "zone_id": None,
+        "borough": None,
+        "uncertainty_band": None,
+        "cap_applied": None,
+        "rate_limit_applied": None,
+        "run_id": "run-pr-1",
+        "page": 1,
+        "page_size": 2,
+        "sort": SortSpec(field="zone_id", order="desc"),
+        "include_plain_language_fields": False,
+    }
+
+    first = service.get_pricing_window(**window)
+    service.get_pricing_window(**window, cursor=first["next_cursor"])
+
+    assert [row["zone_id"] for row in first["rows"]] == [101, 102]
+    assert first["rows"][0]["reason_codes"] == []
+    assert first["rows"][0]["why_this_price"] is None
+    query, params = db.page_queries[-1]
+    assert "p.zone_id < :cursor_sort_value" in query
+    assert params["cursor_sort_value"] == 102
+    with pytest.raises(APIError):
+        service.get_pricing_window(**window, cursor="not a cursor")
+
+
+def test_forecast_window_reuses_rendered_sql_per_query_shape() -> None:
+    db = KeysetPageDB()
+    service = ForecastService(config=build_test_config(), db=db)  # type: ignore[arg-type]
+    window: dict[str, Any] = {
+        "start_ts": None,
+        "end_ts": None,
+        "zone_id": None,
+        "borough": None,
+        "run_id": "run-fc-1",
+        "page": 1,
+        "page_size": 2,
+        "sort": SortSpec(field="zone_id", order="asc"),
+        "include_plain_language_fields": False,
+    }
+
+    service.get_forecast_window(**window)
+    service.get_forecast_window(**{**window, "page": 2})
+    service.get_forecast_window(**{**window, "zone_id": 101})
+
+    first_sql, second_sql, zone_sql = (query for query, _ in db.page_queries)
+    assert first_sql is second_sql
+    assert "f.zone_id = :zone_id" in zone_sql
+    assert "f.zone_id = :zone_id" not in first_sql
+
+
+def test_zone_timeline_checks_zone_inside_window_count() -> None:
+    class ZoneCheckingDB(KeysetPageDB):
+        def __init__(self, *, zone_known: bool) -> None:
+            super().__init__()
+            self.zone_known = zone_known
+            self.one_queries: list[str] = []
+
+        def fetch_one(
+            self, query: str, params: dict[str, Any] | None = None
+        ) -> dict[str, Any] | None:
+            self.one_queries.append(query)
+            if "COUNT(*)" in query:
+                return {"total_count": 3, "zone_known": self.zone_known}
+            return {"run_id": "run-fc-1"}
+
+    timeline: dict[str, Any] = {
+        "zone_id": 101,
+        "start_ts": None,
+        "end_ts": None,
+        "page": 1,
+        "page_size": 2,
+        "sort": SortSpec(field="zone_id", order="asc"),
+        "include_plain_language_fields": False,
+    }
+    known_db = ZoneCheckingDB(zone_known=True)
+    known = ForecastService(config=build_test_config(), db=known_db)  # type: ignore[arg-type]
+    unknown = ForecastService(
+        config=build_test_config(), db=ZoneCheckingDB(zone_known=False)  # type: ignore[arg-type]
+    )
+
+    assert known.get_zone_timeline(**timeline)["total_count"] == 3
+    assert not any("location_id = :zone_id LIMIT 1" in query for query in known_db.one_queries)
+    assert "AS zone_known" in known_db.one_queries[-1]
+    with pytest.raises(APIError) as raised:
+        unknown.get_zone_timeline(**timeline)
+    assert raised.value.error_code == "ZONE_NOT_FOUND"
+
+
+def test_pricing_window_reuses_count_and_sql_across_pages() -> None:
+    class CountingPageDB(KeysetPageDB):
+        def __init__(self) -> None:
+            super().__init__()
+            self.count_queries = 0
+
+        def fetch_one(
+            self, query: str, params: dict[str, Any] | None = None
+        ) -> dict[str, Any] | None:
+            if "COUNT(*)" in query:
+                self.count_queries += 1
+            return super().fetch_one(query, params)
+
+    db = CountingPageDB()
+    service = PricingService(config=build_test_config(), db=db)  # type: ignore[arg-type]
+    window: dict[str, Any] = {
+        "start_ts": None,
+        "end_ts": None,
+        "zone_id": None,
+        "borough": None,
+        "uncertainty_band": None,
+        "cap_applied": None,
+        "rate_limit_applied": None,
+        "run_id": "run-pr-1",
+        "page": 1,
+        "page_size": 2,
+        "sort": SortSpec(field="borough", order="asc"),
+        "include_plain_language_fields": False,
+    }
+
+    service.get_pricing_window(**window)
+    second_page = service.get_pricing_window(**{**window, "page": 2})
+    service.get_pricing_window(**{**window, "zone_id": 101})
+
+    assert second_page["total_count"] == 3
+    assert db.count_queries == 2
+    assert db.page_queries[0][0] is db.page_queries[1][0]
+
+
+def test_concurrent_pricing_windows_keep_count_cache_bounded(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pricing_service, "PRICING_COUNT_CACHE_MAX_ENTRIES", 4)
+    db = KeysetPageDB()
+    service = PricingService(config=build_test_config(), db=db)  # type: ignore[arg-type]
+
+    def list_zone(zone_id: int) -> int:
+        result = service.get_pricing_window(
+            start_ts=None,
+            end_ts=None,
+            zone_id=zone_id,
+            borough="QUEENS" if zone_id % 2 else "queens",
+            uncertainty_band=None,
+            cap_applied=None,
+            rate_limit_applied=None,
+            run_id="run-pr-1",
+            page=1,
+            page_size=2,
+            sort=SortSpec(field="borough", order="asc"),
+            include_plain_language_fields=False,
+        )
+        return result["total_count"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        totals = list(pool.map(list_zone, [zone_id % 40 for zone_id in range(400)]))
+
+    assert totals == [3] * 400
+    assert len(service._count_cache._entries) <= 4
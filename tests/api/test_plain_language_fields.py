@@ -10,9 +10,12 @@ from datetime import UTC, datetime
 from src.api.plain_language import (
     confidence_note,
     demand_outlook_label,
+    forecast_plain_fields,
+    forecast_plain_fields_batch,
     guardrail_note,
     price_action_label,
     pricing_plain_fields,
+    pricing_plain_fields_batch,
 )
 from tests.api.support import FakeDBClient, api_test_client, build_test_config
 
@@ -87,6 +90,35 @@ def test_plain_language_mapping_thresholds() -> None:
     assert "High confidence" in confidence_note(0.9, "low")
 
 
+def test_plain_language_batch_matches_row_mapping() -> None:
+    rows: list[dict[str, object]] = [
+        {
+            "final_multiplier": multiplier,
+            "confidence_score": confidence,
+            "uncertainty_band": band,
+            "y_pred": y_pred,
+            "y_pred_lower": y_pred - 2.0,
+            "y_pred_upper": y_pred + 2.0,
+            "cap_applied": multiplier > 1.1,
+            "rate_limit_applied": confidence < 0.6,
+            "cap_reason": "low_confidence" if multiplier > 1.1 else None,
+            "reason_summary": "Demand is above baseline.",
+        }
+        for multiplier, confidence, band, y_pred in [
+            (0.9, 0.95, "low", 2.0),
+            (1.0, 0.8, None, 5.0),
+            (1.08, 0.79, "MEDIUM", 14.9),
+            (1.2, 0.6, "high", 15.0),
+            (1.21, 0.59, "low", 30.0),
+            (float("nan"), float("nan"), "low", float("nan")),
+        ]
+    ]
+
+    assert pricing_plain_fields_batch(rows) == [pricing_plain_fields(row) for row in rows]
+    assert forecast_plain_fields_batch(rows) == [forecast_plain_fields(row) for row in rows]
+    assert pricing_plain_fields_batch([]) == []
+
+
 def test_plain_language_fields_present_when_enabled() -> None:
     with api_test_client(
         config=build_test_config(include_plain_language_fields=True),
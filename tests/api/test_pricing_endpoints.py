@@ -8,6 +8,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 from src.api.error_handlers import APIError
+from src.api.services.pricing_service import PricingService
 from tests.api.support import FakeDBClient, api_test_client, build_test_config
 
 
@@ -159,3 +160,35 @@ def test_pricing_invalid_sort_returns_400() -> None:
 
     assert response.status_code == 400
     assert response.json()["error_code"] == "INVALID_QUERY_PARAM"
+
+
+def test_pricing_run_summary_honors_if_none_match() -> None:
+    with api_test_client(
+        config=build_test_config(),
+        db_client=FakeDBClient(),
+        pricing_service=FakePricingService(),
+    ) as client:
+        first = client.get("/api/v1/pricing/runs/latest")
+        not_modified = client.get(
+            "/api/v1/pricing/runs/latest",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        stale = client.get("/api/v1/pricing/runs/latest", headers={"If-None-Match": 'W/"old"'})
+
+    assert first.headers["etag"].startswith('W/"')
+    assert first.headers["cache-control"] == "no-cache"
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert stale.status_code == 200
+
+
+def test_reason_codes_accept_decoded_lists_and_json_text() -> None:
+    decoded = ["HIGH_DEMAND", "CAP_APPLIED"]
+
+    assert PricingService._normalize_reason_codes(decoded) is decoded
+    assert PricingService._normalize_reason_codes('["LOW_CONFIDENCE", 7]') == [
+        "LOW_CONFIDENCE",
+        "7",
+    ]
+    assert PricingService._normalize_reason_codes("not json") == []
+    assert PricingService._normalize_reason_codes(None) == []
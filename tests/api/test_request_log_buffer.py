@@ -0,0 +1,65 @@
+# This file tests the batched request log buffer used by the API middleware.
+# It exists to confirm queued rows reach the writer in batches and are flushed on stop.
+# The tests use an in-memory writer so no database is required.
+# Keeping these checks close to the API tests protects the logging contract.
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from typing import Any
+
+from src.api.request_log_buffer import RequestLogBuffer
+
+
+class RecordingWriter:
+    def __init__(self) -> None:
+        self.batches: list[list[Mapping[str, Any]]] = []
+
+    def log_requests(self, *, table_name: str, records: list[Mapping[str, Any]]) -> None:
+        assert table_name == "api_request_log"
+        self.batches.append(list(records))
+
+
+def test_request_log_buffer_batches_rows_and_flushes_on_stop() -> None:
+    writer = RecordingWriter()
+
+    async def scenario() -> None:
+        buffer = RequestLogBuffer(
+            writer_factory=lambda: writer,
+            table_name="api_request_log",
+            max_batch=2,
+            flush_interval_ms=1000,
+        )
+        buffer.start()
+        for index in range(5):
+            assert buffer.put_nowait({"request_id": f"req-{index}"})
+        await buffer.stop()
+        assert not buffer.put_nowait({"request_id": "late"})
+
+    asyncio.run(scenario())
+
+    flushed = [row["request_id"] for batch in writer.batches for row in batch]
+    assert flushed == [f"req-{index}" for index in range(5)]
+    assert max(len(batch) for batch in writer.batches) <= 2
+
+
+def test_request_log_buffer_drops_rows_when_full() -> None:
+    writer = RecordingWriter()
+
+    async def scenario() -> RequestLogBuffer:
+        buffer = RequestLogBuffer(
+            writer_factory=lambda: writer,
+            table_name="api_request_log",
+            max_queue_size=1,
+        )
+        buffer.start()
+        assert buffer.put_nowait({"request_id": "kept"})
+        assert not buffer.put_nowait({"request_id": "dropped"})
+        await buffer.stop()
+        return buffer
+
+    buffer = asyncio.run(scenario())
+
+    assert buffer.dropped_count == 1
+    assert [row["request_id"] for batch in writer.batches for row in batch] == ["kept"]
@@ -7,10 +7,17 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI, Query
 
 from src.api.app import app
 from src.api.response_envelope import build_list_envelope, build_object_envelope
+from src.api.schema_fingerprint import openapi_fingerprint
 from src.api.schema_versions import build_version_fields, detect_breaking_schema_changes
+from src.api.schemas.forecast_schemas import ForecastListResponseV1
+from src.api.schemas.metadata_schemas import ReasonCodeListResponseV1, ZoneMetadataListResponseV1
+from src.api.schemas.pricing_schemas import PricingDecisionListResponseV1
 
 
 def test_openapi_contains_required_phase7_paths() -> None:
@@ -54,6 +61,18 @@ def test_response_envelope_builders_include_version_and_request_fields() -> None
     assert object_payload["request_id"] == "req-2"
 
 
+def test_list_envelopes_serialize_metadata_before_rows() -> None:
+    for model in (
+        PricingDecisionListResponseV1,
+        ForecastListResponseV1,
+        ZoneMetadataListResponseV1,
+        ReasonCodeListResponseV1,
+    ):
+        field_names = list(model.model_fields)
+        assert field_names[-1] == "data"
+        assert field_names.index("request_id") < field_names.index("pagination")
+
+
 def test_schema_version_helpers_and_breaking_change_detector() -> None:
     version_fields = build_version_fields(api_version_path="/api/v1", schema_version="1.0.0")
     assert version_fields == {"api_version": "v1", "schema_version": "1.0.0"}
@@ -86,6 +105,81 @@ def test_schema_version_helpers_and_breaking_change_detector() -> None:
     assert any("removed required field" in item for item in findings)
 
 
+def test_breaking_change_detector_follows_renamed_refs_once() -> None:
+    previous = {
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Envelope": {
+                    "properties": {
+                        "data": {"type": "array", "items": {"$ref": "#/components/schemas/RowV1"}}
+                    }
+                },
+                "Other": {"properties": {"row": {"$ref": "#/components/schemas/RowV1"}}},
+                "RowV1": {"required": ["zone_id"], "properties": {"zone_id": {"type": "integer"}}},
+            }
+        },
+    }
+    current = {
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Envelope": {
+                    "properties": {
+                        "data": {"type": "array", "items": {"$ref": "#/components/schemas/RowV2"}}
+                    }
+                },
+                "Other": {"properties": {"row": {"$ref": "#/components/schemas/RowV2"}}},
+                "RowV2": {"required": [], "properties": {}},
+            }
+        },
+    }
+
+    findings = detect_breaking_schema_changes(previous_snapshot=previous, current_snapshot=current)
+    assert findings == [
+        "Removed schema component: RowV1",
+        "Schema RowV1 (now RowV2) removed required field: zone_id",
+        "Schema RowV1 (now RowV2) removed property: zone_id",
+    ]
+
+
+def test_breaking_change_detector_skips_unchanged_snapshots() -> None:
+    snapshot_path = Path("reports/api/contract_checks/latest_contract_snapshot.json")
+    snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    regenerated = json.loads(json.dumps(snapshot))
+
+    for current in (snapshot, regenerated):
+        findings = detect_breaking_schema_changes(
+            previous_snapshot=snapshot, current_snapshot=current
+        )
+        assert findings == []
+
+
+def _single_route_app(page_size_query: Any) -> FastAPI:
+    probe_app = FastAPI(title="probe", version="1")
+
+    @probe_app.get("/items")
+    def list_items(page_size: int | None = page_size_query) -> dict[str, int | None]:
+        return {"page_size": page_size}
+
+    return probe_app
+
+
+def test_openapi_fingerprint_tracks_query_constraints() -> None:
+    loose_app = _single_route_app(Query(default=None, ge=1))
+    strict_app = _single_route_app(Query(default=None, ge=1, le=50, description="Rows per page"))
+
+    assert loose_app.openapi() != strict_app.openapi()
+    fingerprints = {
+        openapi_fingerprint(candidate, api_version_path="/api/v1", schema_version="1.0.0")
+        for candidate in (loose_app, strict_app)
+    }
+    assert len(fingerprints) == 2
+    assert openapi_fingerprint(
+        app, api_version_path="/api/v1", schema_version="1.0.0"
+    ) == openapi_fingerprint(app, api_version_path="/api/v1", schema_version="1.0.0")
+
+
 def test_contract_snapshot_file_exists_and_is_valid_json() -> None:
     snapshot_path = Path("reports/api/contract_checks/latest_contract_snapshot.json")
     assert snapshot_path.exists()
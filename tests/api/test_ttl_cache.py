@@ -0,0 +1,43 @@
+# This file tests the in-process TTL cache shared by API services.
+# It exists because sync routes hit the cache from many worker threads at once.
+# The tests fill the cache past its bound concurrently and check it never raises.
+# They also confirm the entry bound holds once the threads finish.
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+
+from src.api.services.ttl_cache import TTLCache
+
+
+def test_concurrent_fills_past_max_entries_stay_bounded() -> None:
+    cache = TTLCache(ttl_seconds=60, max_entries=4)
+    errors: list[Exception] = []
+    start = threading.Barrier(16)
+
+    def fill(worker: int) -> None:
+        start.wait()
+        try:
+            for index in range(2_000):
+                key = (worker, index)
+                built = cache.get_or_build(key, lambda key=key: time.sleep(0) or key)
+                assert built == key
+        except Exception as exc:
+            errors.append(exc)
+
+    # A tiny switch interval makes threads interleave inside the eviction path.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=fill, args=(worker,)) for worker in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    assert len(cache._entries) <= 4
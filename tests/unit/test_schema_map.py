@@ -29,3 +29,27 @@ def test_normalize_trip_dataframe_schema() -> None:
     assert list(normalized.columns) == TRIP_COLUMNS_WITH_META
     assert normalized.iloc[0]["pickup_location_id"] == 132
     assert normalized.iloc[0]["source_row_number"] == 1
+
+
+def test_normalize_trip_dataframe_numbers_rows_positionally() -> None:
+    sample = pd.DataFrame(
+        {
+            "PULocationID": ["132", "bad"],
+            "tpep_pickup_datetime": ["2024-01-01 00:00:00", "2024-01-01 00:05:00"],
+        },
+        index=[10, 20],
+    )
+    normalized = normalize_trip_dataframe(sample, Path("sample.csv"), "batch-1")
+
+    assert normalized["source_row_number"].tolist() == [1, 2]
+    assert normalized.iloc[0]["pickup_location_id"] == 132
+    assert pd.isna(normalized.iloc[1]["pickup_location_id"])
+
+
+def test_normalize_trip_dataframe_leaves_input_frame_untouched() -> None:
+    sample = pd.DataFrame({"PULocationID": ["132"], "trip_distance": ["2.5"]})
+    original = sample.copy()
+
+    normalize_trip_dataframe(sample, Path("sample.csv"), "batch-1")
+
+    pd.testing.assert_frame_equal(sample, original)
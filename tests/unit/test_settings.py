@@ -21,3 +21,11 @@ def test_load_settings_missing_required(monkeypatch: pytest.MonkeyPatch) -> None
     monkeypatch.delenv("PROJECT_NAME", raising=False)
     with pytest.raises(RuntimeError, match="Missing required environment variables"):
         settings_module.load_settings(load_env=False)
+
+
+def test_load_settings_reads_optional_declared_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DB_POOL_SIZE", "12")
+    monkeypatch.setenv("UNRELATED_SETTING", "ignored")
+    settings = settings_module.load_settings()
+    assert settings.DB_POOL_SIZE == 12
+    assert settings.DB_MAX_OVERFLOW == 10